@@ -1,3 +1,3 @@
-from __future__ import print_function, absolute_import
-
+from __future__ import print_function, absolute_import
+
 from .h5_nastran import H5Nastran
\ No newline at end of file
@@ -0,0 +1,3 @@
+from __future__ import print_function, absolute_import
+
+from .bdf_reader import BDFReader, card_parsers, split_cards
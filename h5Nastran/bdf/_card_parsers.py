@@ -0,0 +1,301 @@
+"""
+Parsers of the bulk data cards read directly by BDFReader.  The fields of a card are split the same way as
+pyNastran (small field, large field and free field) and converted with the same rules and defaults as the pyNastran
+cards, then with the same defaults as the card tables for fields pyNastran leaves blank.  A parser raises
+ValueError for anything it doesn't handle exactly like pyNastran, those cards are left to pyNastran.
+"""
+
+from __future__ import print_function, absolute_import
+from six.moves import range
+
+import re
+
+from ..input.card_table import _defaults
+
+
+_nan = _defaults['<f8']
+_blank = _defaults['<i8']
+
+_components_re = re.compile(r'[1-6]+$')
+_offt_re = re.compile(r'[A-Z]+$')
+
+
+def get_fields(card_lines):
+    """
+    Returns the fields of a card, with None for blank fields and without the trailing blank fields.  card_lines
+    are the lines of the card without comments.
+    """
+    line = card_lines[0].rstrip()
+
+    if '*' in line:
+        if ',' in line:
+            fields = line.split(',')[:5]
+            fields += [''] * (5 - len(fields))
+        else:
+            fields = [line[0:8], line[8:24], line[24:40], line[40:56], line[56:72]]
+    else:
+        if ',' in line:
+            fields = line.split(',')[:9]
+            fields += [''] * (9 - len(fields))
+        else:
+            fields = [line[0:8], line[8:16], line[16:24], line[24:32], line[32:40], line[40:48], line[48:56],
+                      line[56:64], line[64:72]]
+
+    for line in card_lines[1:]:
+        if '*' in line:
+            if ',' in line:
+                _fields = line.split(',')[1:5]
+                _fields += [''] * (4 - len(_fields))
+            else:
+                _fields = [line[8:24], line[24:40], line[40:56], line[56:72]]
+        else:
+            if ',' in line:
+                _fields = line.split(',')[1:9]
+                _fields += [''] * (8 - len(_fields))
+            else:
+                _fields = [line[8:16], line[16:24], line[24:32], line[32:40], line[40:48], line[48:56],
+                           line[56:64], line[64:72]]
+        fields += _fields
+
+    fields = [_.strip() or None for _ in fields]
+
+    while fields[-1] is None:
+        fields.pop()
+
+    return fields
+
+
+def _integer(value):
+    if value is None:
+        raise ValueError(value)
+    return int(value)
+
+
+def _integer_or_blank(value, default):
+    if value is None:
+        return default
+    return _integer(value)
+
+
+def _double(value):
+    if value is None or value.isdigit():
+        raise ValueError(value)
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    # 1.0D+3, 1.0+3, 1.0-3
+    value = value.upper()
+
+    if 'D' in value:
+        return float(value.replace('D', 'E'))
+
+    sign = ''
+    if value[0] in ('+', '-'):
+        sign = value[0]
+        value = value[1:]
+
+    if '+' in value:
+        value = sign + value.replace('+', 'E+')
+    elif '-' in value:
+        value = sign + value.replace('-', 'E-')
+
+    return float(value)
+
+
+def _double_or_blank(value, default):
+    if value is None:
+        return default
+    return _double(value)
+
+
+def _integer_double_or_blank(value, default):
+    if value is None:
+        return default
+    if '.' in value or '-' in value[1:] or '+' in value[1:]:
+        return _double(value)
+    return _integer(value)
+
+
+def _components_or_blank(value, default):
+    if value is None:
+        return default
+
+    if _components_re.match(value) is None or len(set(value)) != len(value):
+        raise ValueError(value)
+
+    return int(''.join(sorted(value)))
+
+
+def _check_len(fields, max_len):
+    if len(fields) > max_len:
+        raise ValueError(fields)
+    return fields + [None] * (max_len - len(fields))
+
+
+def _offt(value):
+    # pyNastran reads E as O, integer offt (NX) is left to pyNastran
+    if value is None:
+        return 'GGG'
+    if _offt_re.match(value) is None:
+        raise ValueError(value)
+    return value.replace('E', 'O')
+
+
+def _value(value, default):
+    if value is None:
+        return default
+    return value
+
+
+########################################################################################################################
+
+
+def parse_grid(fields):
+    f = _check_len(fields, 9)
+
+    nid = _integer(f[1])
+    cp = _integer_or_blank(f[2], 0)
+    x = (_double_or_blank(f[3], 0.), _double_or_blank(f[4], 0.), _double_or_blank(f[5], 0.))
+    cd = _integer_or_blank(f[6], 0)
+    ps = _components_or_blank(f[7], _blank)
+    seid = _integer_or_blank(f[8], 0)
+
+    if nid <= 0 or cp < 0 or cd < -1 or seid < 0:
+        raise ValueError(fields)
+
+    return nid, cp, x, cd, ps, seid, 0
+
+
+def _parse_shell(fields, nnodes):
+    # CQUAD4 and CTRIA3, the nodes are followed by theta/mcid, zoffs, blank fields up to field 9, tflag and Ti
+    f = _check_len(fields, 11 + nnodes)
+
+    eid = _integer(f[1])
+    pid = _integer_or_blank(f[2], eid)
+    nids = tuple(_integer(f[3 + i]) for i in range(nnodes))
+
+    if len(set(nids)) != nnodes:
+        raise ValueError(fields)
+
+    theta_mcid = _integer_double_or_blank(f[3 + nnodes], 0.)
+    zoffs = _double_or_blank(f[4 + nnodes], 0.)
+
+    for i in range(5 + nnodes, 10):
+        if f[i] is not None:
+            raise ValueError(fields)
+
+    tflag = _integer_or_blank(f[10], 0)
+    t = tuple(_double_or_blank(f[11 + i], _nan) for i in range(nnodes))
+
+    if isinstance(theta_mcid, float):
+        theta = theta_mcid
+        mcid = _blank
+    else:
+        theta = _nan
+        mcid = theta_mcid
+
+    return eid, pid, nids, theta, zoffs, tflag, t, mcid, 0
+
+
+def parse_cquad4(fields):
+    return _parse_shell(fields, 4)
+
+
+def parse_ctria3(fields):
+    return _parse_shell(fields, 3)
+
+
+def parse_cbar(fields):
+    f = _check_len(fields, 17)
+
+    eid = _integer(f[1])
+    pid = _integer_or_blank(f[2], eid)
+    ga = _integer(f[3])
+    gb = _integer(f[4])
+
+    x1_g0 = _integer_double_or_blank(f[5], 0.)
+
+    if isinstance(x1_g0, float):
+        x = (x1_g0, _double_or_blank(f[6], 0.), _double_or_blank(f[7], 0.))
+        if x[0] ** 2 + x[1] ** 2 + x[2] ** 2 == 0.:
+            raise ValueError(fields)
+        g0 = _blank
+
+        if _offt(f[8]).startswith('G'):
+            flag = 1
+        else:
+            flag = 0
+    else:
+        x = (_nan, _nan, _nan)
+        g0 = x1_g0
+        flag = 2
+
+        if g0 in (ga, gb):
+            raise ValueError(fields)
+
+        _offt(f[8])
+
+    pa = _integer_or_blank(f[9], 0)
+    pb = _integer_or_blank(f[10], 0)
+
+    w = tuple(_double_or_blank(f[11 + i], 0.) for i in range(6))
+
+    return (eid, pid, ga, gb, flag, x[0], x[1], x[2], g0, pa, pb) + w + (0,)
+
+
+def parse_cbush(fields):
+    f = _check_len(fields, 14)
+
+    eid = _integer(f[1])
+    pid = _integer_or_blank(f[2], eid)
+    ga = _integer(f[3])
+    gb = _integer_or_blank(f[4], 0)
+    cid = _integer_or_blank(f[8], None)
+
+    x1_g0 = _integer_double_or_blank(f[5], None)
+
+    if isinstance(x1_g0, float):
+        x = (x1_g0, _double_or_blank(f[6], 0.), _double_or_blank(f[7], 0.))
+        if cid is None and x[0] ** 2 + x[1] ** 2 + x[2] ** 2 == 0.:
+            raise ValueError(fields)
+        g0 = _blank
+    else:
+        x = None
+        g0 = _value(x1_g0, _blank)
+
+    if cid is not None:
+        if cid == 0:
+            flag = 0 if x is None else 1
+        else:
+            flag = -1
+    else:
+        flag = 2 if x is None else 1
+
+    if x is None:
+        x = (_nan, _nan, _nan)
+
+    s = _double_or_blank(f[9], 0.5)
+    ocid = _integer_or_blank(f[10], -1)
+    si = tuple(_double_or_blank(f[11 + i], _nan) for i in range(3))
+
+    return (eid, pid, ga, gb, flag, x[0], x[1], x[2], g0, _value(cid, _blank), s, ocid) + si + (0,)
+
+
+def parse_conm2(fields):
+    f = _check_len(fields, 15)
+
+    eid = _integer(f[1])
+    nid = _integer(f[2])
+    cid = _integer_or_blank(f[3], 0)
+    mass = _double_or_blank(f[4], 0.)
+
+    if mass < 0.:
+        raise ValueError(fields)
+
+    x = tuple(_double_or_blank(f[5 + i], 0.) for i in range(3))
+    i = tuple(_double_or_blank(f[9 + j], 0.) for j in range(6))
+
+    return eid, nid, cid, mass, x[0], x[1], x[2], i[0], i[1:3], i[3:6], 0
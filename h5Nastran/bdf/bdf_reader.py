@@ -0,0 +1,447 @@
+from __future__ import print_function, absolute_import
+from six import iteritems
+
+import os
+
+import numpy as np
+
+from ..input.element import CBAR, CBUSH, CONM2, CQUAD4, CTRIA3
+from ..input.node import GRID
+from ._card_parsers import (get_fields, parse_grid, parse_cquad4, parse_ctria3, parse_cbar, parse_cbush,
+                            parse_conm2)
+
+
+# card name: (card table, parser)
+card_parsers = {
+    'GRID': (GRID, parse_grid),
+    'CQUAD4': (CQUAD4, parse_cquad4),
+    'CTRIA3': (CTRIA3, parse_ctria3),
+    'CBAR': (CBAR, parse_cbar),
+    'CBUSH': (CBUSH, parse_cbush),
+    'CONM2': (CONM2, parse_conm2),
+}
+
+# cards that change the defaults of a card read directly, if one is in the deck the card is left to pyNastran
+_default_cards = {
+    'CBAR': 'BAROR',
+}
+
+# bdf dict: id field, cards read directly that share the ids of the cards read by pyNastran into the dict
+_id_groups = (
+    ('nodes', 'ID', ('GRID',)),
+    ('elements', 'EID', ('CQUAD4', 'CTRIA3', 'CBAR', 'CBUSH')),
+    ('masses', 'EID', ('CONM2',)),
+)
+
+
+def _get_card_name(line):
+    # name of the card starting on the line (without comment), '' for continuation and blank lines
+    card_name = line.split(',', 1)[0].split('\t', 1)[0][:8].rstrip().upper()
+
+    if card_name and card_name[0] not in ('+', '*'):
+        return card_name.rstrip(' *')
+
+    return ''
+
+
+def split_cards(lines, card_types):
+    """
+    Splits the lines of a deck by card without reading the cards, i.e. the deck saved in BDF_LINES.  Returns the
+    lines of the bulk data cards of card_types and the rest of the lines.  INCLUDE files aren't read.
+    """
+    card_lines = []
+    other_lines = []
+
+    lines = iter(lines)
+
+    for line in lines:
+        other_lines.append(line)
+
+        _line = line.upper()
+        if _line.startswith('BEGIN') and 'BULK' in _line:
+            break
+
+    _lines = other_lines
+
+    for line in lines:
+        if line[:1] in ('', ' ', '+', '*', ',', '$'):
+            # continuation, blank or comment line
+            _lines.append(line)
+            continue
+
+        card_name = _get_card_name(line.split('$', 1)[0])
+
+        if card_name:
+            if card_name == 'ENDDATA':
+                other_lines.append(line)
+                other_lines.extend(lines)
+                break
+
+            if card_name in card_types:
+                _lines = card_lines
+            else:
+                _lines = other_lines
+
+        _lines.append(line)
+
+    return card_lines, other_lines
+
+
+def _remove_repeated_cards(data):
+    # first of the cards repeated exactly, in file order
+    rows = np.frombuffer(data.tobytes(), dtype=np.dtype((np.void, data.dtype.itemsize)))
+
+    first = np.unique(rows, return_index=True)[1]
+
+    if first.shape[0] == data.shape[0]:
+        return data
+
+    return data[np.sort(first)]
+
+
+def _worker(filename, include_dir, card_types):
+    reader = BDFReader(filename, card_types)
+    reader.include_dir = include_dir
+    return reader._read_include_file()
+
+
+class _Include(object):
+    # INCLUDE statement of the bulk data when include files are read by BDFReader.read_multiprocess
+    def __init__(self, filename):
+        self.filename = filename
+
+
+class _BulkSegment(object):
+    # bulk data of a file up to the next INCLUDE statement, data is card name: array once the segment is done
+    def __init__(self):
+        self.other_lines = []
+        self.rows = {}
+        self.lines = {}
+        self.data = {}
+        self.card_names = set()
+
+    def finish(self):
+        for card_name, rows in iteritems(self.rows):
+            self.data[card_name] = np.array(rows, dtype=card_parsers[card_name][0].table_def.dtype)
+        self.rows.clear()
+
+
+class BDFReader(object):
+    """
+    Reads the high volume bulk data cards (see card_parsers) of a bdf directly into arrays of the dtype of their
+    card tables, so that pyNastran only has to read the rest of the deck.  INCLUDE files are read in place.
+
+    After read, card_data is a dict of card name: array in file order (DOMAIN_ID is 0), card_lines are the lines of
+    the cards in card_data and other_lines are the lines of the deck left to pyNastran, without INCLUDE statements.
+    """
+
+    def __init__(self, filename, card_types=None):
+        self.filename = filename
+        self.include_dir = os.path.dirname(os.path.abspath(filename))
+
+        if card_types is None:
+            card_types = sorted(card_parsers.keys())
+
+        self.card_types = set(card_types)
+
+        self.card_data = {}
+        self.card_lines = []
+        self.other_lines = []
+
+        self._segment = None
+        self._segments = []
+
+        self._expand_includes = True
+
+        self._pool = None
+        self._results = {}
+
+    def read(self):
+        self._read()
+
+    def read_multiprocess(self, processes=None):
+        """
+        Same as read, but the INCLUDE files of the bulk data are read by a pool of worker processes while the main
+        file is read, then the cards are merged in the same order as read.  Each include file is read by one
+        worker, and the include files it includes by other workers.  The cards of an include file must not continue
+        in the file including it.
+        """
+        from multiprocessing import Pool, cpu_count
+
+        if processes is None:
+            processes = max(cpu_count() - 1, 1)
+
+        self._pool = Pool(processes)
+
+        try:
+            done = self._read()
+        except BaseException:
+            self._pool.terminate()
+            raise
+        finally:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._results.clear()
+
+        if not done:
+            # an include file ended the bulk data, everything after it has to be left to pyNastran
+            self._clear()
+            self._read()
+
+    def check_ids(self, bdf):
+        """
+        Checks the ids of card_data against each other and against the cards of bdf, the rest of the deck read by
+        pyNastran, the same way as pyNastran does.  A card repeated exactly is only kept once, any other card with
+        the id of another card raises DuplicateIDsError.
+        """
+        from pyNastran.bdf.errors import DuplicateIDsError
+
+        for group, id_name, card_names in _id_groups:
+            ids = [np.fromiter(getattr(bdf, group).keys(), dtype='<i8')]
+
+            for card_name in card_names:
+                data = self.card_data.get(card_name, None)
+
+                if data is None:
+                    continue
+
+                data = self.card_data[card_name] = _remove_repeated_cards(data)
+
+                ids.append(data[id_name].astype('<i8'))
+
+            ids = np.concatenate(ids)
+
+            if np.unique(ids).shape[0] == ids.shape[0]:
+                continue
+
+            ids = np.sort(ids)
+            duplicates = np.unique(ids[1:][ids[1:] == ids[:-1]])
+
+            raise DuplicateIDsError('self.%s IDs are not unique=%s' % (group, duplicates.tolist()))
+
+    def _clear(self):
+        self.card_data.clear()
+        del self.card_lines[:]
+        del self.other_lines[:]
+
+        self._segment = None
+        self._segments = []
+
+    def _read(self):
+        lines = self._read_lines(self.filename)
+
+        for line in lines:
+            self.other_lines.append(line)
+
+            _line = line.upper()
+            if _line.startswith('BEGIN') and 'BULK' in _line:
+                break
+
+        self._expand_includes = self._pool is None
+        self._start_segment()
+
+        last_line = self._read_bulk(lines)
+
+        self._expand_includes = True
+        self._end_segment()
+
+        segments = self._get_segments(self._segments)
+
+        if segments is None:
+            return False
+
+        data = {}
+        card_lines = {}
+        card_names = set()
+
+        for segment in segments:
+            self.other_lines.extend(segment.other_lines)
+            card_names.update(segment.card_names)
+
+            for card_name, _data in iteritems(segment.data):
+                data.setdefault(card_name, []).append(_data)
+                card_lines.setdefault(card_name, []).extend(segment.lines[card_name])
+
+        for card_name, default_card in iteritems(_default_cards):
+            if default_card in card_names and card_name in data:
+                del data[card_name]
+                self.other_lines.extend(card_lines.pop(card_name))
+
+        # superelements, auxiliary models and everything after ENDDATA are left to pyNastran
+        if last_line is not None:
+            self.other_lines.append(last_line)
+            self.other_lines.extend(lines)
+
+        for card_name, _data in iteritems(data):
+            self.card_data[card_name] = np.concatenate(_data)
+
+        for card_name in sorted(card_lines.keys()):
+            self.card_lines.extend(card_lines[card_name])
+
+        self._segments = []
+
+        return True
+
+    def _read_include_file(self):
+        # returns the segments of an include file read by a worker, None if the bulk data ends in the file
+        self._expand_includes = False
+        self._start_segment()
+
+        if self._read_bulk(self._read_lines(self.filename)) is not None:
+            return None
+
+        self._end_segment()
+
+        return self._segments
+
+    def _get_segments(self, segments):
+        # segments in file order, with the segments of the include files read by the workers
+        result = []
+
+        for segment in segments:
+            if isinstance(segment, _BulkSegment):
+                result.append(segment)
+                continue
+
+            _segments = self._results[segment].get()
+
+            if _segments is None:
+                return None
+
+            for _segment in _segments:
+                if not isinstance(_segment, _BulkSegment):
+                    self._add_result(_segment)
+
+            _segments = self._get_segments(_segments)
+
+            if _segments is None:
+                return None
+
+            result.extend(_segments)
+
+        return result
+
+    def _add_result(self, filename):
+        if filename not in self._results:
+            self._results[filename] = self._pool.apply_async(_worker, (filename, self.include_dir, self.card_types))
+
+    def _start_segment(self):
+        self._segment = _BulkSegment()
+        self._segments.append(self._segment)
+
+    def _end_segment(self):
+        self._segment.finish()
+        self._segment = None
+
+    def _add_include(self, filename):
+        self._end_segment()
+        self._segments.append(filename)
+        if self._pool is not None:
+            self._add_result(filename)
+        self._start_segment()
+
+    def _read_bulk(self, lines):
+        # returns the line that ended the bulk data (BEGIN or ENDDATA), None at the end of the file
+        card_name = None
+        card_lines = []  # without comments
+        raw_lines = []
+
+        for line in lines:
+            if isinstance(line, _Include):
+                self._add_card(card_name, card_lines, raw_lines)
+                card_name = None
+                card_lines = []
+                raw_lines = []
+                self._add_include(line.filename)
+                continue
+
+            if line.upper().startswith('BEGIN'):
+                self._add_card(card_name, card_lines, raw_lines)
+                return line
+
+            _line = line.split('$', 1)[0]
+
+            _card_name = _get_card_name(_line)
+
+            if _card_name:
+                self._add_card(card_name, card_lines, raw_lines)
+                card_name = _card_name
+                card_lines = []
+                raw_lines = []
+
+                if card_name == 'ENDDATA':
+                    return line
+
+            if _line.rstrip():
+                card_lines.append(_line)
+
+            raw_lines.append(line)
+
+        self._add_card(card_name, card_lines, raw_lines)
+
+        return None
+
+    def _add_card(self, card_name, card_lines, raw_lines):
+        segment = self._segment
+        segment.card_names.add(card_name)
+
+        if card_name in self.card_types and len(card_lines) > 0:
+            try:
+                row = self._parse_card(card_name, card_lines)
+            except ValueError:
+                row = None
+
+            if row is not None:
+                try:
+                    segment.rows[card_name].append(row)
+                    segment.lines[card_name].extend(raw_lines)
+                except KeyError:
+                    segment.rows[card_name] = [row]
+                    segment.lines[card_name] = list(raw_lines)
+                return
+
+        segment.other_lines.extend(raw_lines)
+
+    @staticmethod
+    def _parse_card(card_name, card_lines):
+        for line in card_lines:
+            # tabs, replication and dynamic syntax are left to pyNastran
+            if '\t' in line or '=' in line or '%' in line:
+                return None
+
+        return card_parsers[card_name][1](get_fields(card_lines))
+
+    def _read_lines(self, filename):
+        # lines of the file, INCLUDE files are read in place unless _expand_includes is False when they are found
+        from pyNastran.bdf.bdf_interface.include_file import get_include_filename
+
+        with open(filename, 'r') as f:
+            lines = iter(f)
+
+            for line in lines:
+                line = line.rstrip('\r\n\t')
+
+                if not line.upper().startswith('INCLUDE'):
+                    yield line
+                    continue
+
+                include_lines = [line.split('$')[0].strip()]
+
+                line_base = line.split('$')[0]
+
+                if "'" in line_base:
+                    line_base = line_base[8:].strip()
+                    if not (line_base.startswith("'") and line_base.endswith("'")):
+                        while not line.split('$')[0].endswith("'"):
+                            line = next(lines).split('$')[0].strip()
+                            include_lines.append(line)
+
+                include_file = os.path.join(self.include_dir, get_include_filename(include_lines, self.include_dir))
+
+                if not self._expand_includes:
+                    yield _Include(include_file)
+                    continue
+
+                for _line in self._read_lines(include_file):
+                    yield _line
@@ -0,0 +1,47 @@
+"""
+Opens solver output files that may be compressed.  The compression is found from the file extension:
+.gz (gzip), .bz2 (bzip2), .xz/.lzma (lzma) and .zst/.zstd (zstandard, requires the zstandard package).
+"""
+
+from __future__ import print_function, absolute_import
+
+import os
+
+
+compressed_extensions = ('.gz', '.bz2', '.xz', '.lzma', '.zst', '.zstd')
+
+
+def is_compressed(filename):
+    return os.path.splitext(filename)[1].lower() in compressed_extensions
+
+
+def open_file(filename):
+    """
+    Returns a binary file object for filename, decompressing it while it is read if it is compressed.
+    Compressed files are only meant to be read sequentially.
+    """
+    ext = os.path.splitext(filename)[1].lower()
+
+    if ext == '.gz':
+        import gzip
+        return gzip.open(filename, 'rb')
+
+    elif ext == '.bz2':
+        import bz2
+        return bz2.BZ2File(filename, 'rb')
+
+    elif ext in ('.xz', '.lzma'):
+        try:
+            import lzma
+        except ImportError:
+            from backports import lzma
+        return lzma.open(filename, 'rb')
+
+    elif ext in ('.zst', '.zstd'):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('The zstandard package is required to read %s!' % filename)
+        return zstandard.ZstdDecompressor().stream_reader(open(filename, 'rb'), closefd=True)
+
+    return open(filename, 'rb')
@@ -0,0 +1,83 @@
+"""
+Compression profiles of the h5 file.  A profile is a dict of group path: tables.Filters (None for no compression),
+tables created in a group use the filters of the closest group in the profile.  '/' is the default of the file.
+"""
+
+from __future__ import print_function, absolute_import
+from six import iteritems, string_types
+
+import tables
+
+
+_zlib = tables.Filters(complib='zlib', complevel=5)
+_lz4 = tables.Filters(complib='blosc:lz4', complevel=5, shuffle=True)
+_zstd = tables.Filters(complib='blosc:zstd', complevel=5, shuffle=True)
+
+
+compression_profiles = {
+    # everything zlib level 5, smallest files
+    'default': {
+        '/': _zlib
+    },
+    # fast results writing and reading
+    'fast': {
+        '/': _zlib,
+        '/NASTRAN/INPUT': _zlib,
+        '/NASTRAN/RESULT': _lz4,
+        '/INDEX': None
+    },
+    # results close to zlib size, faster to read
+    'zstd': {
+        '/': _zlib,
+        '/NASTRAN/INPUT': _zlib,
+        '/NASTRAN/RESULT': _zstd,
+        '/INDEX': None
+    }
+}
+
+
+def get_compression_profile(compression):
+    """
+    Returns the profile for compression, which is a profile name, a tables.Filters used for the whole file, or
+    a profile.
+    """
+    if compression is None:
+        compression = 'default'
+
+    if isinstance(compression, string_types):
+        try:
+            profile = compression_profiles[compression]
+        except KeyError:
+            raise ValueError('Unknown compression profile %s!' % compression)
+    elif isinstance(compression, tables.Filters):
+        profile = {'/': compression}
+    else:
+        profile = dict(compression)
+
+    profile = {path: _get_filters(filters) for path, filters in iteritems(profile)}
+    profile.setdefault('/', _zlib)
+
+    return profile
+
+
+def _get_filters(filters):
+    if filters is None:
+        return tables.Filters(complevel=0)
+    return filters
+
+
+def describe_compression_profile(profile):
+    """
+    Returns one line per group of the profile, path: complib complevel shuffle.
+    """
+    lines = []
+
+    for path in sorted(profile.keys()):
+        filters = profile[path]
+        if filters.complevel == 0:
+            lines.append('%s: none' % path)
+        else:
+            lines.append('%s: %s %d%s' % (path, filters.complib, filters.complevel,
+                                          ' shuffle' if filters.shuffle else ''))
+
+    return '\n'.join(lines)
@@ -1,7 +1,7 @@
-from __future__ import print_function, absolute_import
-from six import iteritems, iterkeys, itervalues
-from six.moves import range
-
-from .f06_reader import F06Reader
-
-from . import tables
+from __future__ import print_function, absolute_import
+from six import iteritems, iterkeys, itervalues
+from six.moves import range
+
+from .f06_reader import F06Reader
+
+from . import tables
@@ -1 +1 @@
-from . import nodal
+from . import nodal
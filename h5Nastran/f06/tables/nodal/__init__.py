@@ -1 +1 @@
-from . import displacement
+from . import displacement
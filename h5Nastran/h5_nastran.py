@@ -1,228 +1,599 @@
-from __future__ import print_function, absolute_import
-from six import iteritems, itervalues
-from six.moves import range
-
-from pyNastran.bdf.bdf import BDF
-
-
-import tables
-import numpy as np
-
-
-from .input import Input
-from .result import Result
-
-from .pynastran_interface import get_bdf_cards
-from .punch import PunchReader
-from .f06 import F06Reader
-
-
-class H5Nastran(object):
-
-    version = '0.1.0'
-
-    def __init__(self, h5filename, mode='r'):
-        filters = tables.Filters(complib='zlib', complevel=5)
-        self.h5f = tables.open_file(h5filename, mode=mode, filters=filters)
-
-        self._card_tables = {}
-        self._result_tables = {}
-
-        self.input = Input(self)
-        self.result = Result(self)
-
-        self.bdf = None  # pyNastran bdf file
-
-        self._tables = set()
-        self._unsupported_tables = set()
-
-        self._bdf = None
-        self._punch = None
-        self._f06 = None
-
-        self._bdf_domain = 1
-
-        if mode == 'w':
-            self._write_info()
-
-    def close(self):
-        self.h5f.close()
-
-    def load_bdf(self, filename=None):
-        if self._bdf is not None:
-            raise Exception('BDF already loaded!')
-
-        if filename is None:
-            self._load_bdf()
-            return self.bdf
-
-        self._bdf = filename
-
-        self.bdf = BDF(debug=False)
-        self.bdf.read_bdf(filename)
-
-        bdf = self.bdf
-
-        assert bdf is not None
-
-        cards = get_bdf_cards(bdf)
-
-        tables = set()
-        unsupported = []
-
-        card_names = sorted(cards.keys())
-
-        for card_name in card_names:
-            table = self._card_tables.get(card_name, None)
-
-            if table is None:
-                print(card_name)
-                unsupported.append(card_name)
-                continue
-
-            try:
-                table.write_data(cards[card_name], self._bdf_domain)
-            except NotImplementedError:
-                print(card_name)
-                unsupported.append(card_name)
-
-            tables.add(table)
-
-        for table in tables:
-            table.finalize()
-
-        self._unsupported_cards(unsupported)
-
-        self._bdf_domain += 1
-
-        self._save_bdf()
-
-        return self.bdf
-
-    def load_f06(self, f06file):
-        if self._bdf is None:
-            raise Exception('BDF must be loaded first!')
-
-        if self._punch is not None:
-            raise Exception('Punch file has already been loaded.  Cannot load f06 file after punch.')
-
-        self._f06 = f06file
-
-        reader = F06Reader(f06file)
-        reader.register_callback(self._load_result_table)
-        reader.read()
-
-        for table in self._tables:
-            table.finalize()
-
-        self._tables.clear()
-
-    def load_punch(self, filename):
-        if self._bdf is None:
-            raise Exception('BDF must be loaded first!')
-
-        if self._f06 is not None:
-            raise Exception('F06 has already been loaded.  Cannot load punch file after f06.')
-
-        self._punch = filename
-
-        reader = PunchReader(filename)
-        reader.register_callback(self._load_result_table)
-        reader.read()
-
-        for table in self._tables:
-            table.finalize()
-
-        self._tables.clear()
-        self._write_unsupported_tables()
-
-    def path(self):
-        return ['', 'NASTRAN']
-
-    def register_card_table(self, card_table):
-        assert card_table.card_id not in self._card_tables
-        self._card_tables[card_table.card_id] = card_table
-
-    def register_result_table(self, result_table):
-        result_type = result_table.result_type
-        if isinstance(result_type, str):
-            result_type = [result_type]
-
-        for _result_type in result_type:
-            assert _result_type not in self._result_tables
-            self._result_tables[_result_type] = result_table
-
-    def _load_bdf(self):
-        from zlib import decompress
-
-        bdf_lines = decompress(self.h5f.get_node('/PRIVATE/NASTRAN/INPUT/BDF_LINES').read()).decode()
-
-        from six import StringIO
-
-        class DummyIO(StringIO):
-            # pyNastran expects StringIO to have a readlines method
-            def readlines(self):
-                return self.getvalue().split('\n')
-
-        data = DummyIO()
-
-        data.write(bdf_lines)
-
-        bdf = BDF(debug=False)
-        bdf.read_bdf(data)
-
-        data.close()
-
-        self.bdf = bdf
-
-    def _load_result_table(self, table_data):
-        print(table_data.header)
-
-        results_type = table_data.header.results_type
-
-        table = self._result_tables.get(results_type, None)
-
-        if table is None:
-            return self._unsupported_table(table_data)
-
-        table.results_type = results_type
-
-        table.write_data(table_data)
-
-        self._tables.add(table)
-
-    def _save_bdf(self):
-        from six import StringIO
-
-        out = StringIO()
-
-        self.bdf.write_bdf(out, close=False)
-
-        from zlib import compress
-
-        self.h5f.create_array('/PRIVATE/NASTRAN/INPUT', 'BDF_LINES', obj=compress(out.getvalue().encode()), title='BDF LINES',
-                              createparents=True)
-
-    def _unsupported_cards(self, cards):
-        cards = np.array(cards, dtype='S8')
-        self.h5f.create_array('/PRIVATE/NASTRAN/INPUT', 'UNSUPPORTED_CARDS', obj=cards, title='UNSUPPORTED BDF CARDS',
-                         createparents=True)
-
-    def _unsupported_table(self, table_data):
-        print('Unsupported table %s' % table_data.header.results_type)
-        self._unsupported_tables.add(table_data.header.results_type)
-
-    def _write_info(self):
-        import pyNastran
-
-        info = 'h5Nastran version %s\nPowered by pyNastran version %s' % (self.version, pyNastran.__version__)
-
-        self.h5f.create_array('/PRIVATE/h5Nastran', 'h5Nastran', obj=info.encode(), title='h5Nastran Info',
-                              createparents=True)
-
-    def _write_unsupported_tables(self):
-        headers = list(sorted(self._unsupported_tables))
-        data = np.array(headers, dtype='S256')
-
-        self.h5f.create_array('/PRIVATE/NASTRAN/RESULT', 'UNSUPPORTED_RESULT_TABLES', obj=data, title='UNSUPPORTED RESULT TABLES',
-                         createparents=True)
+from __future__ import print_function, absolute_import
+from six import iteritems, itervalues
+from six.moves import range
+from six import StringIO
+
+import os
+import time
+
+from pyNastran.bdf.bdf import BDF
+
+
+import tables
+import numpy as np
+
+
+from .input import Input
+from .input.card_table import CardTable
+from .result import Result
+from .result.result_table import ResultTable
+from .lru_cache import LRUCache
+from .write_buffers import WriteBuffers
+from .compression import get_compression_profile, describe_compression_profile
+
+from .pynastran_interface import get_bdf_cards
+from .bdf import BDFReader, split_cards
+from .punch import PunchReader
+from .f06 import F06Reader
+
+
+class _StringIO(StringIO):
+    # pyNastran expects StringIO to have a readlines method
+    def readlines(self):
+        return self.getvalue().split('\n')
+
+
+class _ResultConverter(object):
+    # converts the punch tables to the records of their result table in the PunchReader.read_multiprocess workers,
+    # the classes are pickled by name and the worker uses their class level table definitions
+    def __init__(self, table_classes):
+        self.table_classes = table_classes
+
+    def __call__(self, table_data):
+        table_class = self.table_classes.get(table_data.header.results_type, None)
+
+        if table_class is None:
+            return table_data.data
+
+        return table_class.table_def.to_numpy(table_data.data)
+
+
+class H5Nastran(object):
+
+    version = '0.2.0'
+
+    def __init__(self, h5filename, mode='r', index_cache_size=256 * 1024 ** 2, write_buffer_size=32 * 1024 ** 2,
+                 compression='default'):
+        """
+        index_cache_size is the size in bytes of the private index kept in memory by the result tables for search.
+        write_buffer_size is the size in bytes of the results the result tables buffer in total before the largest
+        buffers are appended.
+        compression is the compression profile of a new file, see compression.get_compression_profile.
+        """
+        self.compression = get_compression_profile(compression)
+        self.h5f = tables.open_file(h5filename, mode=mode, filters=self.compression['/'])
+
+        # tables are only created when needed, the locations are (group, attribute) of the tables not created yet
+        self._card_tables = {}
+        self._card_table_locations = {}
+        self._card_table_classes = {}
+        self._result_tables = {}
+        self._result_table_locations = {}
+
+        self.index_cache = LRUCache(index_cache_size)
+        self.write_buffers = WriteBuffers(write_buffer_size)
+
+        self.input = Input(self)
+        self.result = Result(self)
+
+        self.bdf = None  # pyNastran bdf file
+
+        self._tables = set()
+        self._unsupported_tables = set()
+
+        self._bdf = None
+        self._punch = None
+        self._f06 = None
+
+        self._bdf_domain = 1
+
+        if mode == 'w':
+            self._create_compression_groups()
+            self._write_info()
+
+    def close(self):
+        self.h5f.close()
+
+    def load_bdf(self, filename=None, fast=False, parallel=False, processes=None, card_types=None):
+        """
+        Without filename, the bdf of the file is loaded into self.bdf.  The cards held exactly by their tables are
+        rebuilt from the tables (see CardTable.to_bdf) and only the rest of the saved deck is read by pyNastran.
+        card_types optionally selects the card types loaded, the bdf isn't cross referenced in that case.
+
+        fast reads the GRID, CQUAD4, CTRIA3, CBAR, CBUSH and CONM2 cards directly into their tables (see
+        bdf.BDFReader), only the rest of the deck is read by pyNastran and is in self.bdf.  Duplicate node, element
+        and mass ids raise DuplicateIDsError as they do in pyNastran (see BDFReader.check_ids), but the deck isn't
+        cross referenced, so references to missing nodes, properties or coordinate systems aren't reported.
+
+        parallel is the same as fast, but the INCLUDE files of the bulk data are read by a pool of processes
+        worker processes (see BDFReader.read_multiprocess).
+        """
+        if self._bdf is not None:
+            raise Exception('BDF already loaded!')
+
+        if filename is None:
+            self._load_bdf(card_types)
+            return self.bdf
+
+        self._bdf = filename
+
+        self.bdf = BDF(debug=False)
+
+        if fast or parallel:
+            reader = BDFReader(filename)
+
+            if parallel:
+                reader.read_multiprocess(processes)
+            else:
+                reader.read()
+
+            data = _StringIO()
+            data.write('\n'.join(reader.other_lines))
+            data.seek(0)
+
+            self.bdf.read_bdf(data, xref=False)
+
+            data.close()
+
+            reader.check_ids(self.bdf)
+
+            card_data = reader.card_data
+            card_lines = reader.card_lines
+
+            self._apply_grdset(card_data)
+        else:
+            self.bdf.read_bdf(filename)
+            card_data = {}
+            card_lines = None
+
+        bdf = self.bdf
+
+        assert bdf is not None
+
+        cards = get_bdf_cards(bdf)
+
+        tables = set()
+        unsupported = []
+
+        card_names = sorted(set(cards.keys()) | set(card_data.keys()))
+
+        for card_name in card_names:
+            table = self._get_card_table(card_name)
+
+            if table is None:
+                print(card_name)
+                unsupported.append(card_name)
+                continue
+
+            _cards = cards.get(card_name, {})
+            _data = card_data.get(card_name, None)
+
+            if not table.expected_rows:
+                table.expected_rows = len(_cards) + (len(_data) if _data is not None else 0)
+
+            try:
+                table.write_data(_cards, self._bdf_domain, _data)
+            except NotImplementedError:
+                print(card_name)
+                unsupported.append(card_name)
+
+            tables.add(table)
+
+        for table in tables:
+            table.finalize()
+
+        self.h5f.flush()
+
+        self._unsupported_cards(unsupported)
+
+        self._bdf_domain += 1
+
+        self._save_bdf(card_lines)
+
+        return self.bdf
+
+    def load_f06(self, f06file):
+        if self._bdf is None:
+            raise Exception('BDF must be loaded first!')
+
+        if self._punch is not None:
+            raise Exception('Punch file has already been loaded.  Cannot load f06 file after punch.')
+
+        self._f06 = f06file
+
+        reader = F06Reader(f06file)
+        reader.register_callback(self._load_result_table)
+        reader.read()
+
+        for table in self._tables:
+            table.finalize()
+
+        self._tables.clear()
+
+    def load_punch(self, filename, results_types=None, subcase_ids=None, ids=None, resume=False,
+                   checkpoint_interval=600., processes=None):
+        """
+        Loads the result tables of a punch file.  results_types, subcase_ids and ids (ids and inclusive (first, last)
+        id ranges) optionally select which tables and records are loaded; other tables are skipped without parsing.
+
+        The ingest state is checkpointed every checkpoint_interval seconds (None to disable).  If a load_punch was
+        interrupted, reopen the file in 'a' mode and call load_punch again with the same arguments and resume=True
+        to continue from the last checkpoint.
+
+        If processes is given, the tables are read and converted by that many worker processes while the tables
+        are written by this one, see PunchReader.read_multiprocess.
+        """
+        if self._bdf is None and not (resume and '/PRIVATE/NASTRAN/INPUT/BDF_LINES' in self.h5f):
+            raise Exception('BDF must be loaded first!')
+
+        if self._f06 is not None:
+            raise Exception('F06 has already been loaded.  Cannot load punch file after f06.')
+
+        self._punch = filename
+
+        reader = PunchReader(filename, results_types=results_types, subcase_ids=subcase_ids, ids=ids)
+
+        start = 0
+
+        if not reader.is_stream:
+            # also for the tables first created after a resume
+            self._set_expected_rows(reader.table_index().row_counts(reader.selection()))
+
+        if resume:
+            start = self._read_punch_checkpoint(reader)
+
+        last_checkpoint = [time.time()]
+
+        def _callback(table_data):
+            self._load_result_table(table_data)
+
+            if checkpoint_interval is not None and time.time() - last_checkpoint[0] >= checkpoint_interval:
+                self._write_punch_checkpoint(reader)
+                last_checkpoint[0] = time.time()
+
+        reader.register_callback(_callback)
+
+        if processes is None:
+            reader.read(start)
+        else:
+            reader.read_multiprocess(processes, start=start, converter=self._result_converter())
+
+        for table in self._tables:
+            table.finalize()
+
+        self._tables.clear()
+        self._write_unsupported_tables()
+
+        try:
+            self.h5f.remove_node('/PRIVATE/CHECKPOINT', recursive=True)
+        except tables.NoSuchNodeError:
+            pass
+
+        self.h5f.flush()
+
+    def path(self):
+        return ['', 'NASTRAN']
+
+    def register_table_class(self, table_class, group, name):
+        """
+        Registers the card id or result types of table_class, the table is created by getattr(group, name) when it
+        is first needed.
+        """
+        if issubclass(table_class, ResultTable):
+            result_type = table_class.result_type
+
+            if result_type is None:
+                return
+
+            if isinstance(result_type, str):
+                result_type = [result_type]
+
+            for _result_type in result_type:
+                assert _result_type not in self._result_table_locations
+                self._result_table_locations[_result_type] = (group, name)
+
+        elif issubclass(table_class, CardTable):
+            card_id = table_class.card_id
+
+            if card_id is None:
+                return
+
+            if card_id == '':
+                card_id = table_class.__name__
+
+            assert card_id not in self._card_table_locations
+            self._card_table_locations[card_id] = (group, name)
+            self._card_table_classes[card_id] = table_class
+
+    def register_card_table(self, card_table):
+        assert card_table.card_id not in self._card_tables
+        self._card_tables[card_table.card_id] = card_table
+
+    def register_result_table(self, result_table):
+        result_type = result_table.result_type
+        if isinstance(result_type, str):
+            result_type = [result_type]
+
+        for _result_type in result_type:
+            assert _result_type not in self._result_tables
+            self._result_tables[_result_type] = result_table
+
+    def _get_card_table(self, card_id):
+        table = self._card_tables.get(card_id, None)
+
+        if table is None and card_id in self._card_table_locations:
+            group, name = self._card_table_locations[card_id]
+            table = getattr(group, name)
+
+        return table
+
+    def _get_result_table(self, results_type):
+        table = self._result_tables.get(results_type, None)
+
+        if table is None and results_type in self._result_table_locations:
+            group, name = self._result_table_locations[results_type]
+            table = getattr(group, name)
+
+        return table
+
+    def _result_converter(self):
+        return _ResultConverter(self._result_table_classes())
+
+    def _result_table_classes(self):
+        # results type: class of the result tables, without creating them
+        table_classes = {}
+
+        for results_type, (group, name) in iteritems(self._result_table_locations):
+            table_classes[results_type] = group._table_classes[name]
+
+        for results_type, table in iteritems(self._result_tables):
+            table_classes[results_type] = type(table)
+
+        return table_classes
+
+    def _load_bdf(self, card_types=None):
+        from zlib import decompress
+
+        bdf_lines = decompress(self.h5f.get_node('/PRIVATE/NASTRAN/INPUT/BDF_LINES').read()).decode().split('\n')
+
+        if card_types is None:
+            _card_types = self._card_table_classes.keys()
+        else:
+            _card_types = card_types
+
+        tables = []
+
+        for card_name in sorted(set(_card_types)):
+            table_class = self._card_table_classes.get(card_name, None)
+
+            if table_class is not None and table_class.to_bdf is not CardTable.to_bdf:
+                tables.append(self._get_card_table(card_name))
+
+        table_cards = set(table.card_id for table in tables)
+
+        bdf = BDF(debug=False)
+
+        if card_types is None:
+            bdf_lines = split_cards(bdf_lines, table_cards)[1]
+        else:
+            bdf_lines = split_cards(bdf_lines, set(card_types) - table_cards)[0]
+
+        if card_types is None or len(bdf_lines) > 0:
+            data = _StringIO()
+
+            data.write('\n'.join(bdf_lines))
+
+            bdf.read_bdf(data, xref=False, punch=card_types is not None)
+
+            data.close()
+
+        for table in tables:
+            table.add_to_bdf(bdf)
+
+        if card_types is None:
+            bdf.cross_reference()
+
+        self.bdf = bdf
+
+    def _apply_grdset(self, card_data):
+        # pyNastran sets the blank CD of the grids from GRDSET when cross referencing
+        grdset = self.bdf.grdset
+
+        if grdset is None:
+            return
+
+        for node in itervalues(self.bdf.nodes):
+            if not node.cd:
+                node.cd = grdset.cd
+
+        if 'GRID' in card_data:
+            cd = card_data['GRID']['CD']
+            cd[cd == 0] = grdset.cd
+
+    def _load_result_table(self, table_data):
+        print(table_data.header)
+
+        results_type = table_data.header.results_type
+
+        table = self._get_result_table(results_type)
+
+        if table is None:
+            return self._unsupported_table(table_data)
+
+        table.results_type = results_type
+
+        table.write_data(table_data)
+
+        self._tables.add(table)
+
+    def _read_punch_checkpoint(self, reader):
+        # restores the state written by _write_punch_checkpoint, returns the table number to continue reading from
+        h5f = self.h5f
+
+        if '/PRIVATE/CHECKPOINT' not in h5f and '/PRIVATE/CHECKPOINT_PENDING/PUNCH' in h5f:
+            # stopped while replacing the checkpoint, the pending one is complete
+            h5f.rename_node('/PRIVATE/CHECKPOINT_PENDING', 'CHECKPOINT')
+
+        try:
+            h5f.remove_node('/PRIVATE/CHECKPOINT_PENDING', recursive=True)
+        except tables.NoSuchNodeError:
+            pass
+
+        start = 0
+
+        if '/PRIVATE/CHECKPOINT/PUNCH' in h5f:
+            filesize, mtime, start, offset = h5f.get_node('/PRIVATE/CHECKPOINT/PUNCH').read()
+
+            if filesize != os.path.getsize(reader.file.filename) or mtime != os.path.getmtime(reader.file.filename):
+                raise Exception('Checkpoint does not match punch file %s!' % reader.file.filename)
+
+            if not reader.is_stream:
+                # the next table is found by its offset, compressed files are read again up to table number start
+                offsets = reader.table_index().data['OFFSET']
+                start = np.searchsorted(offsets, int(offset))
+
+                if start < offsets.shape[0] and offsets[start] != int(offset):
+                    raise Exception('Checkpoint does not match punch file %s!' % reader.file.filename)
+
+            unsupported = h5f.get_node('/PRIVATE/CHECKPOINT/UNSUPPORTED_RESULT_TABLES').read()
+            self._unsupported_tables.update(_.decode() for _ in unsupported)
+
+        try:
+            h5f.remove_node('/PRIVATE/NASTRAN/RESULT/UNSUPPORTED_RESULT_TABLES')
+        except tables.NoSuchNodeError:
+            pass
+
+        # only tables already in the file can have a checkpoint, those without one are emptied
+        table_classes = set()
+
+        for results_type, table_class in iteritems(self._result_table_classes()):
+            if table_class in table_classes:
+                continue
+
+            table_classes.add(table_class)
+
+            if table_class.table_def.path() not in h5f:
+                continue
+
+            table = self._get_result_table(results_type)
+
+            if table.read_checkpoint():
+                self._tables.add(table)
+
+        return int(start)
+
+    def _write_punch_checkpoint(self, reader):
+        # the new checkpoint is written next to the current one and then swapped in
+        h5f = self.h5f
+
+        root = '/PRIVATE/CHECKPOINT_PENDING'
+
+        try:
+            h5f.remove_node(root, recursive=True)
+        except tables.NoSuchNodeError:
+            pass
+
+        for table in self._tables:
+            table.write_checkpoint(root)
+
+        filename = reader.file.filename
+
+        start = reader.position + 1
+
+        if reader.is_stream:
+            offset = -1
+        else:
+            index = reader.table_index()
+            if start < len(index):
+                offset = index[start]['OFFSET']
+            else:
+                offset = os.path.getsize(filename)
+
+        info = np.array([os.path.getsize(filename), os.path.getmtime(filename), start, offset], dtype='<f8')
+
+        unsupported = np.array(list(sorted(self._unsupported_tables)), dtype='S256')
+
+        h5f.create_array(root, 'UNSUPPORTED_RESULT_TABLES', obj=unsupported, title='UNSUPPORTED RESULT TABLES',
+                         createparents=True)
+        h5f.create_array(root, 'PUNCH', obj=info, title='Punch File Size, Modification Time, Next Table, Offset')
+
+        h5f.flush()
+
+        try:
+            h5f.remove_node('/PRIVATE/CHECKPOINT', recursive=True)
+        except tables.NoSuchNodeError:
+            pass
+
+        h5f.rename_node(root, 'CHECKPOINT')
+
+        h5f.flush()
+
+    def _save_bdf(self, card_lines=None):
+        # card_lines are the lines of the cards read directly by BDFReader, they aren't in self.bdf
+        from six import StringIO
+
+        out = StringIO()
+
+        if card_lines is None:
+            self.bdf.write_bdf(out, close=False)
+        else:
+            self.bdf.write_bdf(out, close=False, enddata=False)
+            for line in card_lines:
+                out.write(line)
+                out.write('\n')
+            out.write('ENDDATA\n')
+
+        from zlib import compress
+
+        self.h5f.create_array('/PRIVATE/NASTRAN/INPUT', 'BDF_LINES', obj=compress(out.getvalue().encode()), title='BDF LINES',
+                              createparents=True)
+
+    def _set_expected_rows(self, row_counts):
+        expected_rows = {}
+
+        for results_type, row_count in iteritems(row_counts):
+            table = self._get_result_table(results_type)
+
+            if table is None:
+                continue
+
+            expected_rows[table] = expected_rows.get(table, 0) + row_count
+
+        for table, row_count in iteritems(expected_rows):
+            table.expected_rows = row_count
+
+    def _unsupported_cards(self, cards):
+        cards = np.array(cards, dtype='S8')
+        self.h5f.create_array('/PRIVATE/NASTRAN/INPUT', 'UNSUPPORTED_CARDS', obj=cards, title='UNSUPPORTED BDF CARDS',
+                         createparents=True)
+
+    def _unsupported_table(self, table_data):
+        print('Unsupported table %s' % table_data.header.results_type)
+        self._unsupported_tables.add(table_data.header.results_type)
+
+    def _create_compression_groups(self):
+        # tables inherit the filters of the group they are created in
+        paths = sorted((path for path in self.compression.keys() if path != '/'), key=lambda _: _.count('/'))
+
+        for path in paths:
+            where, name = path.rsplit('/', 1)
+            self.h5f.create_group(where or '/', name, filters=self.compression[path], createparents=True)
+
+    def _write_info(self):
+        import pyNastran
+
+        info = 'h5Nastran version %s\nPowered by pyNastran version %s' % (self.version, pyNastran.__version__)
+
+        self.h5f.create_array('/PRIVATE/h5Nastran', 'h5Nastran', obj=info.encode(), title='h5Nastran Info',
+                              createparents=True)
+
+        self.h5f.create_array('/PRIVATE/h5Nastran', 'COMPRESSION',
+                              obj=describe_compression_profile(self.compression).encode(),
+                              title='h5Nastran Compression Profile')
+
+    def _write_unsupported_tables(self):
+        headers = list(sorted(self._unsupported_tables))
+        data = np.array(headers, dtype='S256')
+
+        self.h5f.create_array('/PRIVATE/NASTRAN/RESULT', 'UNSUPPORTED_RESULT_TABLES', obj=data, title='UNSUPPORTED RESULT TABLES',
+                         createparents=True)
@@ -1 +1 @@
-from .input import Input
+from .input import Input
@@ -1,358 +1,463 @@
-from collections import defaultdict, OrderedDict
-from copy import deepcopy
-
-import numpy as np
-import tables
-
-from h5Nastran.msc import data_tables
-
-_defaults = {
-    '<f8': np.nan,
-    '<i8': -10
-}
-
-
-def _get_dtype(table):
-    try:
-        return data_tables[table.same_as].dtype
-    except KeyError:
-        return table.dtype
-
-
-def _convert_dtype(dtype):
-    new_dtype = []
-
-    for i in range(len(dtype)-1):
-        _dtype = dtype[i]
-
-        if not isinstance(_dtype[1], list):
-            new_dtype.append(_dtype)
-        else:
-            _shape = _dtype[2]
-            for j in range(len(_dtype[1])):
-                _ = _dtype[1][j]
-                assert not isinstance(_, list)  # not doing multiple levels
-                _name = _[0]
-                _type = _[1]
-                new_dtype.append((_name, _type, _shape))
-
-    new_dtype.append(dtype[-1])  # add DOMAIN_ID
-
-    return new_dtype
-
-
-class TableDef(object):
-
-    @classmethod
-    def create(cls, table_def, defaults=None, len_id=None, pos_id=None, subtables=None, rename=None):
-        if isinstance(table_def, str):
-            table_def = data_tables[table_def]
-        if subtables is None:
-            subtables = [TableDef.create(data_tables[_], rename=rename) for _ in table_def.subtables]
-        return cls(table_def.name, table_def.path, _get_dtype(table_def), defaults, len_id, pos_id, subtables, rename)
-
-    def __init__(self, table_id, group, dtype, defaults=None, len_id=None, pos_id=None, subtables=None, rename=None):
-        self.implemented = True
-        self.table_id = table_id
-        self.group = group
-
-        self.dtype = np.dtype(dtype)
-
-        try:
-            self.Format = tables.descr_from_dtype(self.dtype)[0]
-        except NotImplementedError:
-            dtype = _convert_dtype(dtype)
-            self.dtype = np.dtype(dtype)
-            self.Format = tables.descr_from_dtype(self.dtype)[0]
-
-        self.subtables = subtables
-
-        self.attrs = list(self.dtype.names)
-
-        try:
-            self.attrs.remove('DOMAIN_ID')
-        except ValueError:
-            pass
-
-        def _zero():
-            return 0
-
-        self._pos = defaultdict(_zero)
-
-        _dtypes = {_[0]: (_[1], _[2]) for _ in dtype}
-
-        for subtable in self.subtables:
-            try:
-                self.attrs.remove(subtable.pos_id)
-                self.attrs.remove(subtable.len_id)
-            except ValueError:
-                print(self.path(), self.attrs, subtable.pos_id, subtable.len_id)
-                raise
-
-        self.table = None
-
-        self.h5f = None
-
-        if defaults is not None:
-            self.defaults = defaults
-        else:
-            self.defaults = {}
-            for i in range(len(self.attrs)):
-                name = self.attrs[i]
-                _type = _dtypes[name][0]
-                if _type.startswith('S'):
-                    self.defaults[name] = ''
-                else:
-                    self.defaults[name] = _defaults[_type]
-
-        if len_id is None:
-            len_id = '%s_LEN' % self.table_id.replace('_', '')
-
-        if pos_id is None:
-            pos_id = '%s_POS' % self.table_id.replace('_', '')
-
-        if rename is None:
-            rename = {}
-
-        self.len_id = rename.get(len_id, len_id)
-        self.pos_id = rename.get(pos_id, pos_id)
-
-        cols = set(self.dtype.names)
-
-        for subtable in self.subtables:
-            assert subtable.len_id in cols
-            assert subtable.pos_id in cols
-
-    def not_implemented(self):
-        self.implemented = False
-
-    def set_h5f(self, h5f):
-        self.h5f = h5f
-        for subtable in self.subtables:
-            subtable.set_h5f(h5f)
-
-    def _make_table(self, expected_rows=100000):
-        if self.implemented is False:
-            return None
-        try:
-            return self.h5f.get_node(self.path())
-        except tables.NoSuchNodeError:
-            try:
-                self.h5f.create_table(self.group, self.table_id, self.Format, self.table_id,
-                                        expectedrows=expected_rows, createparents=True)
-            except tables.FileModeError:
-                return None
-            return self.h5f.get_node(self.path())
-
-    def get_table(self):
-        if self.table is None:
-            self.table = self._make_table()
-        return self.table
-
-    def path(self):
-        return self.group + '/' + self.table_id
-
-    def write_subdata(self, data):
-        assert isinstance(data, TableData)
-
-        if len(data.data) == 0:
-            return
-
-        table = self.get_table()
-        table_row = table.row
-
-        for i in range(len(data.data)):
-            _write_data_to_table(self, table_row, data.data[i])
-
-            for j in range(len(self.subtables)):
-                if data.subdata_len[i, j] == 0:
-                    continue
-                subtable = self.subtables[j]
-                table_row[subtable.len_id] = data.subdata_len[i, j]
-                table_row[subtable.pos_id] = self._pos[subtable.pos_id]
-                self._pos[subtable.pos_id] += data.subdata_len[i, j]
-
-            table_row.append()
-
-        for j in range(len(self.subtables)):
-            subdata = data.subdata[j]
-            subtable = self.subtables[j]
-            subtable.write_subdata(subdata)
-
-    def write_data(self, cards, domain, from_bdf):
-        ids = sorted(cards.keys())
-
-        table = self.get_table()
-        table_row = table.row
-
-        for card_id in ids:
-            card = cards[card_id]
-
-            # if isinstance(card, list):
-            #     card_data = [from_bdf(card[i]).data[0] for i in range(len(card))]
-            #     self.write_subdata(TableData(card_data))
-            #     continue
-
-            data = from_bdf(card)
-            assert isinstance(data, TableData)
-
-            for i in range(len(data.data)):
-                _write_data_to_table(self, table_row, data.data[i])
-
-                for j in range(len(self.subtables)):
-                    if data.subdata_len[i, j] == 0:
-                        continue
-                    subtable = self.subtables[j]
-                    table_row[subtable.len_id] = data.subdata_len[i, j]
-                    table_row[subtable.pos_id] = self._pos[subtable.pos_id]
-                    self._pos[subtable.pos_id] += data.subdata_len[i, j]
-
-                table_row['DOMAIN_ID'] = domain
-                table_row.append()
-
-            for j in range(len(self.subtables)):
-                subdata = data.subdata[j]
-                subtable = self.subtables[j]
-                subtable.write_subdata(subdata)
-
-            # _write_data_to_table(self, table_row, data.data[0])
-            #
-            # for i in range(len(self.subtables)):
-            #     if data.subdata_len[0, i] == 0:
-            #         continue
-            #     subdata = data.subdata[i]
-            #     subtable = self.subtables[i]
-            #     subtable.write_subdata(subdata)
-            #     table_row[subtable.len_id] = data.subdata_len[0, i]
-            #     table_row[subtable.pos_id] = self._pos[subtable.pos_id]
-            #     self._pos[subtable.pos_id] += data.subdata_len[0, i]
-
-            # table_row['DOMAIN_ID'] = domain
-            # table_row.append()
-
-        self.h5f.flush()
-
-    def read(self):
-        table = self.get_table()
-        if table is None:
-            return None
-        return table.read()
-
-
-def _get_value(value, default):
-    if isinstance(value, (list, tuple, np.ndarray)):
-        return [_get_value(_, default) for _ in value]
-
-    if value in ('', None):
-        return default
-
-    return value
-
-
-def _write_data_to_table(table_def, table_row, data, append=False):
-    attrs = table_def.attrs
-    defaults = table_def.defaults
-
-    # if len(data) == 0:
-    #     return
-
-    for i in range(len(attrs)):
-        attr = attrs[i]
-        table_row[attr] = _get_value(data[i], defaults[attr])
-
-    if append:
-        table_row.append()
-
-
-class TableData(object):
-    def __init__(self, data=None, subdata_len=None, subdata=None):
-
-        if data is None:
-            data = []
-
-        if subdata_len is None:
-            subdata_len = np.zeros((1, 1))
-
-        if subdata is None:
-            subdata = []
-
-        self.data = data
-        self.subdata_len = subdata_len  # type: np.ndarray
-        self.subdata = subdata  # type: list[TableData]
-
-    def __repr__(self):
-        result = [str(self.data)]
-        for subdata in self.subdata:
-            result.append(subdata.__repr__())
-        return ';'.join(result)
-
-    def validate(self):
-        if len(self.subdata) > 0:
-            shape = self.subdata_len.shape
-            assert shape[0] == len(self.data), (shape[0], len(self.data))
-            assert shape[1] == len(self.subdata), (shape[1], len(self.subdata))
-        for subdata in self.subdata:
-            subdata.validate()
-
-
-class CardTable(object):
-    card_id = ''
-    table_def = None  # type: TableDef
-
-    @staticmethod
-    def from_bdf(card):
-        raise NotImplementedError
-
-    @staticmethod
-    def to_bdf(data):
-        raise NotImplementedError
-
-    def __init__(self, h5n, parent):
-        self._h5n = h5n
-        self._parent = parent
-        self._table_def = deepcopy(self.table_def)
-        self._table_def.set_h5f(self._h5n.h5f)
-        self.data = OrderedDict()
-
-        if self.card_id is not None:
-            if self.card_id == '':
-                self.__class__.card_id = self.__class__.__name__
-
-            self._h5n.register_card_table(self)
-
-    def write_data(self, cards, domain):
-        if self.from_bdf is CardTable.from_bdf:
-            self._table_def.not_implemented()
-            raise NotImplementedError
-        self._table_def.write_data(cards, domain, self.from_bdf)
-
-    def finalize(self):
-        pass
-
-    def read(self):
-        if self.from_bdf is CardTable.from_bdf:
-            # if not implemented, then bail now so the table isn't created in the h5 file
-            return
-
-        self.data.clear()
-        # main table should ALWAYS be identity, regardless of inconsistencies in MSC spec
-        self.data['identity'] = self._table_def.read()
-        self.data[self._table_def.table_id.lower()] = self.data['identity']  # set to actual table id for convenience
-
-        def _get_subtable_data(subtable):
-            assert subtable.table_id not in self.data, subtable.table_id
-            self.data[subtable.table_id.lower()] = subtable.read()
-
-            for _ in subtable.subtables:
-                _get_subtable_data(_)
-
-        for subtable in self._table_def.subtables:
-            _get_subtable_data(subtable)
-
-    def __getattr__(self, item):
-        if len(self.data) == 0:
-            self.read()
-        try:
-            return self.data[item]
-        except KeyError:
-            raise AttributeError('Attribute %s not found on CardTable.' % (item))
+from collections import defaultdict, OrderedDict
+from copy import deepcopy
+
+import numpy as np
+import tables
+
+from h5Nastran.msc import data_tables
+from ..table_group import LazyTableDef
+
+_defaults = {
+    '<f8': np.nan,
+    '<i8': -10
+}
+
+
+def _get_dtype(table):
+    try:
+        return data_tables[table.same_as].dtype
+    except KeyError:
+        return table.dtype
+
+
+def _convert_dtype(dtype):
+    new_dtype = []
+
+    for i in range(len(dtype)-1):
+        _dtype = dtype[i]
+
+        if not isinstance(_dtype[1], list):
+            new_dtype.append(_dtype)
+        else:
+            _shape = _dtype[2]
+            for j in range(len(_dtype[1])):
+                _ = _dtype[1][j]
+                assert not isinstance(_, list)  # not doing multiple levels
+                _name = _[0]
+                _type = _[1]
+                new_dtype.append((_name, _type, _shape))
+
+    new_dtype.append(dtype[-1])  # add DOMAIN_ID
+
+    return new_dtype
+
+
+class TableDef(object):
+
+    @classmethod
+    def lazy(cls, *args, **kwargs):
+        # table definition created on first use, see LazyTableDef
+        return LazyTableDef(cls.create, args, kwargs)
+
+    @classmethod
+    def create(cls, table_def, defaults=None, len_id=None, pos_id=None, subtables=None, rename=None):
+        if isinstance(table_def, str):
+            table_def = data_tables[table_def]
+        if subtables is None:
+            subtables = [TableDef.create(data_tables[_], rename=rename) for _ in table_def.subtables]
+        return cls(table_def.name, table_def.path, _get_dtype(table_def), defaults, len_id, pos_id, subtables, rename)
+
+    def __init__(self, table_id, group, dtype, defaults=None, len_id=None, pos_id=None, subtables=None, rename=None):
+        self.implemented = True
+        self.table_id = table_id
+        self.group = group
+
+        self.dtype = np.dtype(dtype)
+
+        try:
+            self.Format = tables.descr_from_dtype(self.dtype)[0]
+        except NotImplementedError:
+            dtype = _convert_dtype(dtype)
+            self.dtype = np.dtype(dtype)
+            self.Format = tables.descr_from_dtype(self.dtype)[0]
+
+        self.subtables = subtables
+
+        self.attrs = list(self.dtype.names)
+
+        try:
+            self.attrs.remove('DOMAIN_ID')
+        except ValueError:
+            pass
+
+        def _zero():
+            return 0
+
+        self._pos = defaultdict(_zero)
+
+        _dtypes = {_[0]: (_[1], _[2]) for _ in dtype}
+
+        for subtable in self.subtables:
+            try:
+                self.attrs.remove(subtable.pos_id)
+                self.attrs.remove(subtable.len_id)
+            except ValueError:
+                print(self.path(), self.attrs, subtable.pos_id, subtable.len_id)
+                raise
+
+        self.table = None
+
+        self.h5f = None
+
+        self.expected_rows = None  # sizes the chunks of the table, i.e. from the card count of the bdf
+        self.chunkshape = None  # overrides the chunkshape pytables computes from expected_rows
+
+        if defaults is not None:
+            self.defaults = defaults
+        else:
+            self.defaults = {}
+            for i in range(len(self.attrs)):
+                name = self.attrs[i]
+                _type = _dtypes[name][0]
+                if _type.startswith('S'):
+                    self.defaults[name] = ''
+                else:
+                    self.defaults[name] = _defaults[_type]
+
+        if len_id is None:
+            len_id = '%s_LEN' % self.table_id.replace('_', '')
+
+        if pos_id is None:
+            pos_id = '%s_POS' % self.table_id.replace('_', '')
+
+        if rename is None:
+            rename = {}
+
+        self.len_id = rename.get(len_id, len_id)
+        self.pos_id = rename.get(pos_id, pos_id)
+
+        cols = set(self.dtype.names)
+
+        for subtable in self.subtables:
+            assert subtable.len_id in cols
+            assert subtable.pos_id in cols
+
+    def not_implemented(self):
+        self.implemented = False
+
+    def set_h5f(self, h5f):
+        self.h5f = h5f
+        for subtable in self.subtables:
+            subtable.set_h5f(h5f)
+
+    def set_expected_rows(self, expected_rows):
+        # rows of the subtables aren't known before the cards are converted, the card count is used for them too
+        self.expected_rows = expected_rows
+        for subtable in self.subtables:
+            subtable.set_expected_rows(expected_rows)
+
+    def _make_table(self, expected_rows=100000):
+        if self.implemented is False:
+            return None
+        try:
+            return self.h5f.get_node(self.path())
+        except tables.NoSuchNodeError:
+            try:
+                self.h5f.create_table(self.group, self.table_id, self.Format, self.table_id,
+                                        expectedrows=expected_rows, chunkshape=self.chunkshape, createparents=True)
+            except tables.FileModeError:
+                return None
+            return self.h5f.get_node(self.path())
+
+    def get_table(self):
+        if self.table is None:
+            if self.expected_rows:
+                self.table = self._make_table(self.expected_rows)
+            else:
+                self.table = self._make_table()
+        return self.table
+
+    def path(self):
+        return self.group + '/' + self.table_id
+
+    def write_subdata(self, data):
+        assert isinstance(data, TableData)
+        self._append_table_data([data], None)
+
+    def write_data(self, cards, domain, from_bdf, data=None):
+        """
+        data is an array of cards already converted to the table dtype, i.e. by the bdf reader, they are written
+        with the cards, in id order.
+        """
+        ids = sorted(cards.keys())
+
+        table_data = []
+
+        for card_id in ids:
+            _data = from_bdf(cards[card_id])
+            assert isinstance(_data, TableData)
+            table_data.append(_data)
+
+        self._append_table_data(table_data, domain, data)
+
+    def _append_table_data(self, table_data, domain, data=None):
+        # the rows of all the cards are written to the table with a single append, then each subtable is written
+        # the same way with the subdata of all the cards
+        table_data = [_data for _data in table_data if len(_data.data) > 0]
+
+        if len(table_data) == 0 and data is None:
+            return
+
+        rows = []
+        for _data in table_data:
+            rows.extend(_data.data)
+
+        result = np.zeros(len(rows), dtype=self.dtype)
+
+        if len(rows) > 0:
+            columns = list(zip(*rows))
+
+            for i in range(len(self.attrs)):
+                attr = self.attrs[i]
+                result[attr] = _get_column(columns[i], self.defaults[attr], self.dtype[attr])
+
+            for j in range(len(self.subtables)):
+                subtable = self.subtables[j]
+
+                lens = np.concatenate(
+                    [np.asarray(_data.subdata_len).reshape((len(_data.data), -1))[:, j] for _data in table_data]
+                ).astype(np.int64)
+
+                # rows without subdata have 0 position and length
+                pos = self._pos[subtable.pos_id] + np.cumsum(lens) - lens
+                result[subtable.len_id] = lens
+                result[subtable.pos_id] = np.where(lens > 0, pos, 0)
+                self._pos[subtable.pos_id] += int(lens.sum())
+
+        if data is not None:
+            assert len(self.subtables) == 0
+
+            result = np.concatenate([result, np.asarray(data, dtype=self.dtype)])
+            ids = result[self.attrs[0]]
+            index = np.argsort(ids, kind='stable')
+            result = result[index]
+            ids = ids[index]
+
+            if np.any(ids[1:] == ids[:-1]):
+                raise Exception('Duplicate ids in %s!' % self.path())
+
+            if len(result) == 0:
+                return
+
+        if domain is not None:
+            result['DOMAIN_ID'] = domain
+
+        self.get_table().append(result)
+
+        for j in range(len(self.subtables)):
+            self.subtables[j]._append_table_data([_data.subdata[j] for _data in table_data], None)
+
+    def finalize(self):
+        """
+        Writes the rows still buffered by the table and its subtables.
+        """
+        if self.table is not None:
+            self.table.flush()
+        for subtable in self.subtables:
+            subtable.finalize()
+
+    def read(self):
+        table = self.get_table()
+        if table is None:
+            return None
+        return table.read()
+
+
+def _get_value(value, default):
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_get_value(_, default) for _ in value]
+
+    if value in ('', None):
+        return default
+
+    return value
+
+
+def _get_column(values, default, dtype):
+    # blank ('' or None) values are replaced by the default of the column
+    shape = (len(values),) + dtype.shape
+
+    try:
+        column = np.array(values, dtype=object)
+    except ValueError:
+        column = None
+
+    if column is None or column.shape != shape:
+        # ragged values, let numpy sort it out after the defaults are set
+        return np.array([_get_value(_, default) for _ in values], dtype=dtype.base)
+
+    blank = (column == None) | (column == '')
+    column[blank] = default
+
+    return column.astype(dtype.base)
+
+
+def _get_list(column):
+    # values of a column as python objects, with None for the blank values so that pyNastran sets its own defaults
+    kind = column.dtype.kind
+
+    if kind == 'S':
+        return [_.decode().strip() for _ in column.tolist()]
+
+    if kind == 'f':
+        blank = np.isnan(column)
+    else:
+        blank = column == _defaults['<i8']
+
+    if not blank.any():
+        return column.tolist()
+
+    column = column.astype(object)
+    column[blank] = None
+
+    return column.tolist()
+
+
+def _get_rows(data, names):
+    # rows of the columns names of a table, see _get_list
+    return zip(*[_get_list(data[name]) for name in names])
+
+
+def _split_list(values, pos, length):
+    # rows of a subtable for each row of its table, from the POS and LEN columns of the table
+    if values is None:
+        values = []
+    pos = pos.tolist()
+    length = length.tolist()
+    return [values[pos[i]:pos[i] + length[i]] for i in range(len(pos))]
+
+
+class TableData(object):
+    def __init__(self, data=None, subdata_len=None, subdata=None):
+
+        if data is None:
+            data = []
+
+        if subdata_len is None:
+            subdata_len = np.zeros((1, 1))
+
+        if subdata is None:
+            subdata = []
+
+        self.data = data
+        self.subdata_len = subdata_len  # type: np.ndarray
+        self.subdata = subdata  # type: list[TableData]
+
+    def __repr__(self):
+        result = [str(self.data)]
+        for subdata in self.subdata:
+            result.append(subdata.__repr__())
+        return ';'.join(result)
+
+    def validate(self):
+        if len(self.subdata) > 0:
+            shape = self.subdata_len.shape
+            assert shape[0] == len(self.data), (shape[0], len(self.data))
+            assert shape[1] == len(self.subdata), (shape[1], len(self.subdata))
+        for subdata in self.subdata:
+            subdata.validate()
+
+
+class CardTable(object):
+    card_id = ''
+    table_def = None  # type: TableDef
+
+    @staticmethod
+    def from_bdf(card):
+        raise NotImplementedError
+
+    @staticmethod
+    def to_bdf(bdf, data):
+        """
+        Adds the cards of data (the table and subtable arrays, see read) to the pyNastran bdf.  Only implemented for
+        cards that the tables hold exactly.  Returns the number of cards added if not every row of the table is a
+        card of the deck, None otherwise.
+        """
+        raise NotImplementedError
+
+    def __init__(self, h5n, parent):
+        self._h5n = h5n
+        self._parent = parent
+        self._table_def = deepcopy(self.table_def)
+        self._table_def.set_h5f(self._h5n.h5f)
+        self.data = OrderedDict()
+
+        if self.card_id is not None:
+            if self.card_id == '':
+                self.__class__.card_id = self.__class__.__name__
+
+            self._h5n.register_card_table(self)
+
+    def write_data(self, cards, domain, data=None):
+        if self.from_bdf is CardTable.from_bdf:
+            self._table_def.not_implemented()
+            raise NotImplementedError
+        self._table_def.write_data(cards, domain, self.from_bdf, data)
+
+    def add_to_bdf(self, bdf):
+        """
+        Adds the cards of the table to the pyNastran bdf, see to_bdf.
+        """
+        if self.to_bdf is CardTable.to_bdf:
+            raise NotImplementedError
+
+        if self._table_def.path() not in self._h5n.h5f:
+            return
+
+        if len(self.data) == 0:
+            self.read()
+
+        count = self.to_bdf(bdf, self.data)
+
+        if count is None:
+            count = len(self.data['identity'])
+
+        if count > 0:
+            bdf.increase_card_count(self.card_id, count)
+
+    def finalize(self):
+        self._table_def.finalize()
+
+    @property
+    def expected_rows(self):
+        return self._table_def.expected_rows
+
+    @expected_rows.setter
+    def expected_rows(self, value):
+        self._table_def.set_expected_rows(value)
+
+    @property
+    def chunkshape(self):
+        return self._table_def.chunkshape
+
+    @chunkshape.setter
+    def chunkshape(self, value):
+        self._table_def.chunkshape = value
+
+    def read(self):
+        if self.from_bdf is CardTable.from_bdf:
+            # if not implemented, then bail now so the table isn't created in the h5 file
+            return
+
+        self.data.clear()
+        # main table should ALWAYS be identity, regardless of inconsistencies in MSC spec
+        self.data['identity'] = self._table_def.read()
+        self.data[self._table_def.table_id.lower()] = self.data['identity']  # set to actual table id for convenience
+
+        def _get_subtable_data(subtable):
+            assert subtable.table_id not in self.data, subtable.table_id
+            self.data[subtable.table_id.lower()] = subtable.read()
+
+            for _ in subtable.subtables:
+                _get_subtable_data(_)
+
+        for subtable in self._table_def.subtables:
+            _get_subtable_data(subtable)
+
+    def __getattr__(self, item):
+        if len(self.data) == 0:
+            self.read()
+        try:
+            return self.data[item]
+        except KeyError:
+            raise AttributeError('Attribute %s not found on CardTable.' % (item))
@@ -1,107 +1,123 @@
-from __future__ import print_function, absolute_import
-from six import iteritems, itervalues
-from six.moves import range
-
-import tables
-import numpy as np
-
-from .card_table import CardTable, TableDef, TableData
-
-
-class CoordinateSystem(object):
-    def __init__(self, h5n, input):
-        self._h5n = h5n
-        self._input = input
-
-        self.cord1c = CORD1C(self._h5n, self)
-        self.cord1r = CORD1R(self._h5n, self)
-        self.cord1s = CORD1S(self._h5n, self)
-        self.cord2c = CORD2C(self._h5n, self)
-        self.cord2r = CORD2R(self._h5n, self)
-        self.cord2s = CORD2S(self._h5n, self)
-        self.cord3g = CORD3G(self._h5n, self)
-        self.cord3r = CORD3R(self._h5n, self)
-        # self.transformation = TRANSFORMATION(self._h5n, self)
-
-    def path(self):
-        return self._input.path() + ['COORDINATE_SYSTEM']
-
-    def read(self):
-        for key, item in iteritems(self.__dict__):
-            if key.startswith('_'):
-                continue
-            try:
-                item.read()
-            except AttributeError:
-                pass
-
-
-########################################################################################################################
-
-
-class CORD1C(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD1C')
-
-########################################################################################################################
-
-
-class CORD1R(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD1R')
-
-########################################################################################################################
-
-class CORD1S(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD1S')
-
-########################################################################################################################
-
-
-def _cord2c_from_bdf(card):
-    data = TableData()
-    e1 = card.e1
-    e2 = card.e2
-    e3 = card.e3
-    data.data = [[card.cid, card.rid, e1[0], e1[1], e1[2], e2[0], e2[1], e2[2], e3[0], e3[1], e3[2]]]
-    return data
-
-
-class CORD2C(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD2C')
-
-    from_bdf = staticmethod(_cord2c_from_bdf)
-
-########################################################################################################################
-
-
-class CORD2R(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD2R')
-
-    from_bdf = staticmethod(_cord2c_from_bdf)
-
-########################################################################################################################
-
-
-class CORD2S(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD2S')
-
-    from_bdf = staticmethod(_cord2c_from_bdf)
-
-########################################################################################################################
-
-
-class CORD3G(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD3G')
-
-########################################################################################################################
-
-
-class CORD3R(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD3R')
-
-########################################################################################################################
-
-
-# class TRANSFORMATION(CardTable):
-#     table_def = TableDef.create('/NASTRAN/INPUT/COORDINATE_SYSTEM/TRANSFORMATION/IDENTITY')
-
-########################################################################################################################
+from __future__ import print_function, absolute_import
+from six import iteritems, itervalues
+from six.moves import range
+
+import tables
+import numpy as np
+
+from .card_table import CardTable, TableDef, TableData, _get_rows
+from ..table_group import TableGroup
+
+
+class CoordinateSystem(TableGroup):
+    def __init__(self, h5n, input):
+        super(CoordinateSystem, self).__init__(h5n)
+        self._input = input
+
+        self._add_table('cord1c', CORD1C)
+        self._add_table('cord1r', CORD1R)
+        self._add_table('cord1s', CORD1S)
+        self._add_table('cord2c', CORD2C)
+        self._add_table('cord2r', CORD2R)
+        self._add_table('cord2s', CORD2S)
+        self._add_table('cord3g', CORD3G)
+        self._add_table('cord3r', CORD3R)
+        # self.transformation = TRANSFORMATION(self._h5n, self)
+
+    def path(self):
+        return self._input.path() + ['COORDINATE_SYSTEM']
+
+
+########################################################################################################################
+
+
+class CORD1C(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD1C')
+
+########################################################################################################################
+
+
+class CORD1R(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD1R')
+
+########################################################################################################################
+
+class CORD1S(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD1S')
+
+########################################################################################################################
+
+
+def _cord2c_from_bdf(card):
+    data = TableData()
+    e1 = card.e1
+    e2 = card.e2
+    e3 = card.e3
+    data.data = [[card.cid, card.rid, e1[0], e1[1], e1[2], e2[0], e2[1], e2[2], e3[0], e3[1], e3[2]]]
+    return data
+
+
+def _cord2_to_bdf(add_cord2, data):
+    # the basic system (CID 0) is in every pyNastran bdf and isn't a card of the deck
+    count = 0
+    names = ('CID', 'RID', 'A1', 'A2', 'A3', 'B1', 'B2', 'B3', 'C1', 'C2', 'C3')
+    for cid, rid, a1, a2, a3, b1, b2, b3, c1, c2, c3 in _get_rows(data['identity'], names):
+        if cid == 0:
+            continue
+        add_cord2(cid, [a1, a2, a3], [b1, b2, b3], [c1, c2, c3], rid)
+        count += 1
+    return count
+
+
+class CORD2C(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD2C')
+
+    from_bdf = staticmethod(_cord2c_from_bdf)
+
+    @staticmethod
+    def to_bdf(bdf, data):
+        return _cord2_to_bdf(bdf.add_cord2c, data)
+
+########################################################################################################################
+
+
+class CORD2R(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD2R')
+
+    from_bdf = staticmethod(_cord2c_from_bdf)
+
+    @staticmethod
+    def to_bdf(bdf, data):
+        return _cord2_to_bdf(bdf.add_cord2r, data)
+
+########################################################################################################################
+
+
+class CORD2S(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD2S')
+
+    from_bdf = staticmethod(_cord2c_from_bdf)
+
+    @staticmethod
+    def to_bdf(bdf, data):
+        return _cord2_to_bdf(bdf.add_cord2s, data)
+
+########################################################################################################################
+
+
+class CORD3G(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD3G')
+
+########################################################################################################################
+
+
+class CORD3R(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/CORD3R')
+
+########################################################################################################################
+
+
+# class TRANSFORMATION(CardTable):
+#     table_def = TableDef.lazy('/NASTRAN/INPUT/COORDINATE_SYSTEM/TRANSFORMATION/IDENTITY')
+
+########################################################################################################################
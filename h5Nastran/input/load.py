@@ -1,55 +1,65 @@
-from __future__ import print_function, absolute_import
-from six import iteritems, itervalues
-from six.moves import range
-
-import tables
-import numpy as np
-
-from .card_table import CardTable, TableDef, TableData
-
-
-class Load(object):
-    def __init__(self, h5n, input):
-        self._h5n = h5n
-        self._input = input
-
-        self.force = FORCE(self._h5n, self)
-        self.moment = MOMENT(self._h5n, self)
-
-    def path(self):
-        return self._input.path() + ['LOAD']
-
-    def read(self):
-        for key, item in iteritems(self.__dict__):
-            if key.startswith('_'):
-                continue
-            try:
-                item.read()
-            except AttributeError:
-                pass
-
-########################################################################################################################
-
-
-class FORCE(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/LOAD/FORCE')
-
-    @staticmethod
-    def from_bdf(card):
-        data = []
-        for _ in card:
-            data.append([_.sid, _.node, _.cid, _.mag, _.xyz])
-        return TableData(list(sorted(data, key=lambda x: x[1])))
-
-########################################################################################################################
-
-
-class MOMENT(CardTable):
-    table_def = TableDef.create('/NASTRAN/INPUT/LOAD/MOMENT')
-
-    @staticmethod
-    def from_bdf(card):
-        data = []
-        for _ in card:
-            data.append([_.sid, _.node, _.cid, _.mag, _.xyz])
-        return TableData(list(sorted(data, key=lambda x: x[1])))
+from __future__ import print_function, absolute_import
+from six import iteritems, itervalues
+from six.moves import range
+
+import tables
+import numpy as np
+
+from .card_table import CardTable, TableDef, TableData, _get_rows
+from ..table_group import TableGroup
+
+
+class Load(TableGroup):
+    def __init__(self, h5n, input):
+        super(Load, self).__init__(h5n)
+        self._input = input
+
+        self._add_table('force', FORCE)
+        self._add_table('moment', MOMENT)
+
+    def path(self):
+        return self._input.path() + ['LOAD']
+
+########################################################################################################################
+
+
+class FORCE(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/LOAD/FORCE')
+
+    @staticmethod
+    def from_bdf(card):
+        data = []
+        for _ in card:
+            data.append([_.sid, _.node, _.cid, _.mag, _.xyz])
+        return TableData(list(sorted(data, key=lambda x: x[1])))
+
+    @staticmethod
+    def to_bdf(bdf, data):
+        """
+        The loads of a set are rebuilt by card type: the loads read by pyNastran, then the FORCE and then the MOMENT
+        cards (see H5Nastran._load_bdf).  A set that mixes them in the deck isn't in the order of the deck, so the
+        deck saved from the rebuilt bdf isn't line for line the same, the loads of each set are.
+        """
+        for sid, nid, cid, mag, xyz in _get_rows(data['identity'], ('SID', 'G', 'CID', 'F', 'N')):
+            bdf.add_force(sid, nid, mag, xyz, cid)
+
+########################################################################################################################
+
+
+class MOMENT(CardTable):
+    table_def = TableDef.lazy('/NASTRAN/INPUT/LOAD/MOMENT')
+
+    @staticmethod
+    def from_bdf(card):
+        data = []
+        for _ in card:
+            data.append([_.sid, _.node, _.cid, _.mag, _.xyz])
+        return TableData(list(sorted(data, key=lambda x: x[1])))
+
+    @staticmethod
+    def to_bdf(bdf, data):
+        """
+        Added after the FORCE cards of the same set, see FORCE.to_bdf.
+        """
+        for sid, nid, cid, mag, xyz in _get_rows(data['identity'], ('SID', 'G', 'CID', 'M', 'N')):
+            bdf.add_moment(sid, nid, mag, xyz, cid)
@@ -0,0 +1,62 @@
+from __future__ import print_function, absolute_import
+
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """
+    Least recently used cache limited by the total size in bytes of its items.  Keys are tuples, the first item of
+    a key is the name used by clear, i.e. the table path.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        try:
+            value, nbytes = self._data.pop(key)
+        except KeyError:
+            return default
+
+        self._data[key] = (value, nbytes)
+
+        return value
+
+    def put(self, key, value, nbytes):
+        self._remove(key)
+
+        if nbytes > self.max_bytes:
+            return
+
+        self._data[key] = (value, nbytes)
+        self.nbytes += nbytes
+
+        while self.nbytes > self.max_bytes:
+            _key, (_value, _nbytes) = self._data.popitem(last=False)
+            self.nbytes -= _nbytes
+
+    def clear(self, name=None):
+        if name is None:
+            self._data.clear()
+            self.nbytes = 0
+            return
+
+        for key in [_ for _ in self._data if _[0] == name]:
+            self._remove(key)
+
+    def _remove(self, key):
+        try:
+            value, nbytes = self._data.pop(key)
+        except KeyError:
+            return
+
+        self.nbytes -= nbytes
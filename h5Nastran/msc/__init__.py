@@ -1,2 +1,2 @@
-from __future__ import print_function, absolute_import
-from .msc_data_tables import data_tables
+from __future__ import print_function, absolute_import
+from .msc_data_tables import data_tables
@@ -1,3 +1,4 @@
-from __future__ import print_function, absolute_import
-from ._punch_reader import PunchReader
-from ._table_data import PunchTableData
+from __future__ import print_function, absolute_import
+from ._punch_reader import PunchReader
+from ._table_data import PunchTableData, convert_tokens
+from ._table_index import PunchTableIndex
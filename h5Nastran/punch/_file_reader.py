@@ -1,99 +1,257 @@
-from __future__ import print_function, absolute_import
-from six import iteritems, itervalues
-from six.moves import range
-
-import os
-
-
-class FileReader(object):
-    def __init__(self, filename):
-        self.filename = filename
-
-        self.filesize = os.path.getsize(self.filename)
-
-        if self.filesize % 82 == 0:
-            self.separator = b'\r\n'
-            self.linesize = 82
-        elif self.filesize % 81 == 0:
-            self.separator = b'\n'
-            self.linesize = 81
-        else:
-            raise Exception('%s is not a valid punch file!' % self.filename)
-
-        self.f = open(self.filename, 'rb')
-
-        self.chunksize = 10000 * self.linesize
-
-        self._counter = 0
-
-        self._data = []
-        self._old_data = None
-        self._new_data = None
-
-        self._data_read = 0
-        self._old_data_read = 0
-
-    def __del__(self):
-        self.close()
-
-    def close(self):
-        try:
-            self.f.close()
-        except AttributeError:
-            pass
-
-        self.f = None
-
-    def next_line(self):
-        try:
-            tmp = self._data[self._counter]
-            self._counter += 1
-            return tmp[:72]
-        except IndexError:
-            if self._new_data is not None:
-                self._data = self._new_data
-                self._new_data = None
-                self._counter = 0
-
-                return self._data[self._counter][:72]
-
-            self._old_data = self._data
-
-            self._old_data_read = self._data_read
-
-            _data = self.f.read(self.chunksize)
-
-            self._data_read += len(_data)
-
-            if len(_data) == 0:
-                return None
-
-            self._data = _data.split(self.separator)
-            self._data.pop()
-            self._counter = 0
-
-            try:
-                tmp = self._data[self._counter]
-                self._counter += 1
-                return tmp[:72]
-            except IndexError:
-                return None
-
-    def previous_line(self):
-        self._counter -= 1
-
-        try:
-            return self._data[self._counter][:72]
-        except IndexError:
-            if self._old_data is not None:
-                self._new_data = self._data
-                self._data = self._old_data
-                self._old_data = None
-                self._counter = len(self._data) - 1
-
-                return self._data[self._counter][:72]
-            else:
-                return None
-
-    def line_number(self):
-        return self._data_read / self.linesize + self._counter
+from __future__ import print_function, absolute_import
+from six import iteritems, itervalues
+from six.moves import range
+
+import os
+import mmap
+from collections import deque
+
+import numpy as np
+
+from ..compressed_file import open_file
+from ._table_data import punch_line_dtype
+
+
+def _detect_record_format(filename, data):
+    # punch lines are 80 characters, followed by the separator
+    if len(data) == 0:
+        return b'\n', 81
+
+    i = data.find(b'\n')
+
+    if i == 81 and data[80:81] == b'\r':
+        return b'\r\n', 82
+    elif i == 80 or (i == -1 and len(data) <= 80):
+        return b'\n', 81
+    else:
+        raise Exception('%s is not a valid punch file!' % filename)
+
+
+class FileReader(object):
+    """
+    Sequential punch file reader that also reads compressed files (see h5Nastran.compressed_file) as they are
+    decompressed.  The record length is found from the first line.  previous_line can step back up to lookback
+    lines.
+    """
+
+    def __init__(self, filename, lookback=10000):
+        self.filename = filename
+
+        self.f = open_file(self.filename)
+
+        self._buffer = self.f.read(1024)
+
+        self.separator, self.linesize = _detect_record_format(self.filename, self._buffer)
+
+        self.chunksize = 10000 * self.linesize
+
+        self._lines = deque()  # lines read but not returned yet
+        self._history = deque(maxlen=lookback)  # lines returned
+        self._pushback = []  # lines stepped back over with previous_line
+
+        self._line_number = 0
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        try:
+            self.f.close()
+        except AttributeError:
+            pass
+
+        self.f = None
+
+    def next_line(self):
+        if len(self._pushback) > 0:
+            tmp = self._pushback.pop()
+        else:
+            if len(self._lines) == 0 and not self._read_chunk():
+                return None
+            tmp = self._lines.popleft()
+
+        self._history.append(tmp)
+        self._line_number += 1
+
+        return tmp
+
+    def previous_line(self):
+        try:
+            tmp = self._history.pop()
+        except IndexError:
+            return None
+
+        self._pushback.append(tmp)
+        self._line_number -= 1
+
+        return tmp
+
+    def line_number(self):
+        return self._line_number
+
+    def _read_chunk(self):
+        _data = self.f.read(self.chunksize)
+
+        data = self._buffer + _data
+
+        if len(_data) == 0:
+            # last line might not have a separator
+            data = data.ljust(len(data) + (-len(data)) % self.linesize)
+            size = len(data)
+        else:
+            size = len(data) - len(data) % self.linesize
+
+        self._buffer = data[size:]
+
+        if size == 0:
+            return False
+
+        linesize = self.linesize
+
+        self._lines.extend(data[i: i + 72] for i in range(0, size, linesize))
+
+        return True
+
+
+class MMapFileReader(object):
+    """
+    Punch file reader backed by a read only memory map.  Every line is a fixed size record, so lines are found by
+    offset arithmetic and records exposes the whole file as a 2-D uint8 view (line, column) without copying.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+        self.filesize = os.path.getsize(self.filename)
+
+        self.f = open(self.filename, 'rb')
+
+        if self.filesize > 0:
+            self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.mm = None
+
+        # the size alone can't tell the separator, 82 * k LF lines are as long as 81 * k CRLF lines
+        self.separator, self.linesize = _detect_record_format(self.filename, self.mm[:1024] if self.mm else b'')
+
+        if self.filesize % self.linesize != 0:
+            self.close()
+            raise Exception('%s is not a valid punch file!' % self.filename)
+
+        if self.mm is not None:
+            self.records = np.frombuffer(self.mm, dtype='u1').reshape((-1, self.linesize))
+        else:
+            self.records = np.empty((0, self.linesize), dtype='u1')
+
+        self.line_count = self.records.shape[0]
+
+        self.chunksize = 10000
+
+        self._counter = 0
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        # views must be released before the map can be closed
+        self.records = None
+
+        try:
+            self.mm.close()
+        except (AttributeError, BufferError):
+            pass
+
+        self.mm = None
+
+        try:
+            self.f.close()
+        except AttributeError:
+            pass
+
+        self.f = None
+
+    def next_line(self):
+        if self._counter >= self.line_count:
+            return None
+
+        tmp = self.line(self._counter)
+        self._counter += 1
+        return tmp
+
+    def previous_line(self):
+        self._counter -= 1
+
+        if self._counter < 0:
+            self._counter = 0
+            return None
+
+        return self.line(self._counter)
+
+    def line_number(self):
+        return self._counter
+
+    def line(self, index):
+        offset = index * self.linesize
+        return self.mm[offset: offset + 72]
+
+    def lines(self, start, stop):
+        """
+        Strided view of lines start:stop split into the fixed punch columns.  No data is copied.
+        """
+        count = max(stop - start, 0)
+
+        if count == 0:
+            return np.empty(0, dtype=punch_line_dtype)
+
+        return np.ndarray((count,), dtype=punch_line_dtype, buffer=self.mm, offset=start * self.linesize,
+                          strides=(self.linesize,))
+
+    def seek_line(self, index):
+        self._counter = index
+
+    def tell_line(self):
+        return self._counter
+
+    def find_line(self, start, char, column=0, invert=False):
+        """
+        Returns the index of the first line at or after start with (or, if invert, without) char in column.
+        Returns line_count if there is no such line.
+        """
+        char = ord(char)
+
+        records = self.records
+
+        chunksize = self.chunksize
+
+        while start < self.line_count:
+            stop = min(start + chunksize, self.line_count)
+
+            chars = records[start:stop, column]
+
+            if invert:
+                found = np.flatnonzero(chars != char)
+            else:
+                found = np.flatnonzero(chars == char)
+
+            if found.shape[0] > 0:
+                return start + int(found[0])
+
+            start = stop
+            chunksize = min(2 * chunksize, 100 * self.chunksize)
+
+        return self.line_count
+
+    def find_blank_line(self, start, stop):
+        """
+        Returns the index of the first blank line in start:stop, or stop if there is none.
+        """
+        records = self.records[start:stop]
+
+        # data lines always have the id right justified in the first 10 columns
+        candidates = np.flatnonzero((records[:, 0] == 32) & (records[:, 9] == 32))
+
+        for i in candidates:
+            if np.all(records[i, :72] == 32):
+                return start + int(i)
+
+        return stop
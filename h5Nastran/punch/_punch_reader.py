@@ -1,156 +1,362 @@
-from __future__ import print_function, absolute_import
-from six import iteritems, itervalues
-from six.moves import range
-
-from ._file_reader import FileReader
-from ._table_data import PunchTableData
-
-
-def _default_callback(table_data):
-    print(table_data.header)
-
-
-def _worker(data, lineno, d):
-    try:
-        tmp = PunchTableData(data)
-        tmp.header.lineno = lineno
-    except TypeError:
-        d['error'] = True
-        return
-
-    d['error'] = False
-    d['table_data'] = tmp.serialize()
-
-
-class PunchReader(object):
-    def __init__(self, filename):
-        self.file = FileReader(filename)
-
-        self._done_reading = False
-
-        self._callback = _default_callback
-
-    def register_callback(self, callback):
-        assert callable(callback)
-
-        self._callback = callback
-
-    def close(self):
-        self.file.close()
-
-    def read_multiprocess(self):
-
-        from multiprocessing import Process, Manager, cpu_count
-
-        _count = 0
-
-        _process = []
-        _data = []
-        _ln = []
-
-        manager = Manager()
-
-        max_count = cpu_count() - 1
-
-        while not self._done_reading:
-            table_data, line_number = self._read_table()
-
-            # print(self.file.status())
-
-            _ln.append(line_number)
-            _data.append(manager.dict())
-
-            d = _data[-1]
-
-            p = Process(target=_worker, args=(table_data, line_number, d))
-            p.start()
-
-            _process.append(p)
-
-            _count += 1
-
-            breakout = False
-            if _count == max_count:
-                for i in range(len(_process)):
-                    _process[i].join()
-                    d = _data[i]
-
-                    if d['error'] is True:
-                        breakout = True
-                        continue
-
-                    td = PunchTableData()
-                    td.load(d['table_data'])
-                    self._callback(td)
-
-                _process.clear()
-                _data.clear()
-                _count = 0
-
-            if breakout:
-                break
-
-        for i in range(len(_process)):
-            _process[i].join()
-            d = _data[i]
-
-            if d['error'] is True:
-                continue
-
-            td = PunchTableData()
-            td.load(d['table_data'])
-            self._callback(td)
-
-    def read(self):
-        while not self._done_reading:
-            table_data, line_number = self._read_table()
-
-            data = PunchTableData(table_data)
-            data.header.lineno = line_number
-
-            self._callback(data)
-
-    def _read_table(self):
-
-        table_data = []
-
-        reading_data = False
-
-        line_number = -1
-
-        while True:
-            next_line = self.file.next_line()
-
-            if next_line is None:
-                self._done_reading = True
-                break
-
-            if next_line.strip() == b'':
-                break
-
-            first_char = chr(next_line[0])
-
-            if first_char == '$' and reading_data:
-                self.file.previous_line()
-                reading_data = False
-                break
-
-            if first_char != '$':
-                reading_data = True
-
-            if first_char == '-':
-                try:
-                    table_data[-1] += next_line[18:]
-                except IndexError:
-                    raise Exception('Error reading punch file %s!' % self.file.filename)
-
-            else:
-                if len(table_data) == 0:
-                    line_number = self.file.line_number()
-
-                table_data.append(next_line)
-
-        if len(table_data) == 0:
-            return None
-
-        return table_data, line_number
+from __future__ import print_function, absolute_import
+from six import iteritems, itervalues
+from six.moves import range
+
+import numpy as np
+
+from ._file_reader import FileReader, MMapFileReader
+from ._table_data import PunchTableData, PunchHeaderData, make_id_ranges
+from ._table_index import PunchTableIndex, Selection, table_index_dtype
+from ..compressed_file import is_compressed
+
+
+def _default_callback(table_data):
+    print(table_data.header)
+
+
+# reader and converter of each pool worker process, see PunchReader.read_multiprocess
+_worker_reader = None
+_worker_converter = None
+
+
+def _init_worker(filename, id_ranges, converter):
+    global _worker_reader, _worker_converter
+    _worker_reader = PunchReader(filename, cache_index=False)
+    _worker_reader.id_ranges = id_ranges
+    _worker_converter = converter
+
+
+def _worker(entries):
+    result = []
+
+    for i in range(entries.shape[0]):
+        data = _worker_reader._read_indexed_table(entries[i])
+
+        if _worker_converter is not None and len(data.data) > 0:
+            data.data = _worker_converter(data)
+
+        result.append(data.serialize())
+
+    return result
+
+
+class PunchReader(object):
+    def __init__(self, filename, cache_index=True, results_types=None, subcase_ids=None, ids=None):
+        # compressed files are decompressed as they are read, so they can't be indexed or read in parallel
+        self.is_stream = is_compressed(filename)
+
+        if self.is_stream:
+            self.file = FileReader(filename)
+        else:
+            self.file = MMapFileReader(filename)
+
+        self.cache_index = cache_index
+
+        # table selection, see PunchTableIndex.select and make_id_ranges
+        self.results_types = results_types
+        self.subcase_ids = subcase_ids
+
+        if ids is not None:
+            self.id_ranges = make_id_ranges(ids)
+        else:
+            self.id_ranges = None
+
+        self._done_reading = False
+
+        self._callback = _default_callback
+
+        self._table_index = None
+
+        # number (in file order) of the table last passed to the callback
+        self.position = -1
+
+    def register_callback(self, callback):
+        assert callable(callback)
+
+        self._callback = callback
+
+    def close(self):
+        self.file.close()
+
+    def read_multiprocess(self, processes=None, lines_per_task=100000, start=0, converter=None):
+        """
+        Same as read, but tables are parsed by a pool of worker processes.  Each task is a run of consecutive tables
+        from the table index (about lines_per_task lines) that the worker reads from its own memory map, so only
+        index entries and the parsed arrays are sent between processes.  Tables are passed to the callback
+        in file order.
+
+        converter is a picklable callable run by the workers on each PunchTableData, it returns the array that
+        replaces the field tokens of the table (for example the typed records of its result table).
+        """
+        if self.is_stream:
+            return self.read(start)
+
+        from collections import deque
+        from multiprocessing import Pool, cpu_count
+
+        if processes is None:
+            processes = max(cpu_count() - 1, 1)
+
+        index = self.table_index()
+
+        tasks = []
+        task = []
+        task_lines = 0
+
+        for i in self.selection(start):
+            task.append(i)
+            task_lines += index[i]['LINE_COUNT']
+
+            if task_lines >= lines_per_task:
+                tasks.append(task)
+                task = []
+                task_lines = 0
+
+        if len(task) > 0:
+            tasks.append(task)
+
+        pool = Pool(processes, _init_worker, (self.file.filename, self.id_ranges, converter))
+
+        try:
+            # limit the parsed tables waiting for the callback
+            pending = deque()
+            tasks = deque(tasks)
+
+            while len(tasks) > 0 or len(pending) > 0:
+                while len(tasks) > 0 and len(pending) < 2 * processes:
+                    task = tasks.popleft()
+                    pending.append((task, pool.apply_async(_worker, (index[task],))))
+
+                task, result = pending.popleft()
+                result = result.get()
+
+                for i in range(len(task)):
+                    data = PunchTableData()
+                    data.load(result[i])
+
+                    if self.id_ranges is not None and len(data.data) == 0:
+                        continue
+
+                    self.position = task[i]
+                    self._callback(data)
+
+        except BaseException:
+            pool.terminate()
+            raise
+
+        pool.close()
+        pool.join()
+
+        self._done_reading = True
+
+    def read(self, start=0):
+        """
+        Passes the selected tables to the callback in file order, starting at table number start.
+        """
+        if self.is_stream:
+            return self._read_stream(start)
+
+        index = self.table_index()
+
+        for i in self.selection(start):
+            data = self._read_indexed_table(index[i])
+
+            if self.id_ranges is not None and len(data.data) == 0:
+                continue
+
+            self.position = i
+            self._callback(data)
+
+        self._done_reading = True
+
+    def selection(self, start=0):
+        """
+        Positions in table_index() of the tables that will be read, starting at table number start.
+        """
+        selection = self.table_index().select(self.results_types, self.subcase_ids)
+        return selection[selection >= start]
+
+    def table_index(self):
+        """
+        Returns the PunchTableIndex of the file, scanning the file only if there isn't an up to date saved index.
+        """
+        if self._table_index is not None:
+            return self._table_index
+
+        index = None
+
+        if self.cache_index:
+            index = PunchTableIndex.load(self.file.filename)
+
+        if index is None:
+            index = self._scan_tables()
+
+            if self.cache_index:
+                index.save()
+
+        self._table_index = index
+
+        return index
+
+    def _read_stream(self, start=0):
+        selection = Selection(self.results_types, self.subcase_ids)
+
+        position = -1
+
+        while not self._done_reading:
+            header_lines, block, line_number = self._read_table_block()
+
+            if len(header_lines) == 0 and len(block) == 0:
+                continue
+
+            position += 1
+
+            if position < start:
+                continue
+
+            header = PunchHeaderData()
+
+            for line in header_lines:
+                header.set_data(line.decode())
+
+            if not selection.is_selected(header.results_type, header.subcase_id):
+                continue
+
+            data = PunchTableData()
+            data.load_block(header_lines, block, self.id_ranges)
+            data.header.lineno = line_number
+
+            if self.id_ranges is not None and len(data.data) == 0:
+                continue
+
+            self.position = position
+            self._callback(data)
+
+    def _read_indexed_table(self, entry):
+        f = self.file
+
+        start = int(entry['LINE'])
+        header_end = start + int(entry['HEADER_LINES'])
+        end = start + int(entry['LINE_COUNT'])
+
+        data = PunchTableData()
+        data.load_block([f.line(i) for i in range(start, header_end)], f.lines(header_end, end), self.id_ranges)
+        data.header.lineno = start + 1
+
+        return data
+
+    def _scan_tables(self):
+        f = self.file
+
+        f.seek_line(0)
+        self._done_reading = False
+
+        entries = []
+
+        while not self._done_reading:
+            start = f.tell_line()
+
+            header_lines, lines, line_number = self._read_table_block()
+
+            if len(header_lines) == 0 and len(lines) == 0:
+                continue
+
+            header = PunchHeaderData()
+
+            for line in header_lines:
+                header.set_data(line.decode())
+
+            header_end = start + len(header_lines)
+            end = header_end + len(lines)
+
+            row_count = np.count_nonzero(f.records[header_end:end, 0] != ord('-'))
+
+            entries.append((start * f.linesize, start, len(header_lines), end - start, row_count,
+                            header.results_type.encode(), header.subcase_id.encode(),
+                            header.other.get('ELEMENT TYPE', '').encode()))
+
+        f.seek_line(0)
+        self._done_reading = False
+
+        return PunchTableIndex(f.filename, np.array(entries, dtype=table_index_dtype))
+
+    def _read_table_block(self):
+        if isinstance(self.file, MMapFileReader):
+            return self._read_table_records()
+
+        # a table is its $ header lines followed by data lines up to the next header or blank line; the data lines
+        # (including continuations) are left as one buffer to be split by PunchTableData.load_block
+
+        header_lines = []
+        data_lines = []
+
+        line_number = -1
+
+        while True:
+            next_line = self.file.next_line()
+
+            if next_line is None:
+                self._done_reading = True
+                break
+
+            if next_line.strip() == b'':
+                break
+
+            first_char = chr(next_line[0])
+
+            if first_char == '$':
+                if len(data_lines) > 0:
+                    self.file.previous_line()
+                    break
+
+                if len(header_lines) == 0:
+                    line_number = self.file.line_number()
+
+                header_lines.append(next_line)
+
+            else:
+                if len(data_lines) == 0:
+                    if first_char == '-':
+                        raise Exception('Error reading punch file %s!' % self.file.filename)
+
+                    if len(header_lines) == 0:
+                        line_number = self.file.line_number()
+
+                data_lines.append(next_line)
+
+        return header_lines, b''.join(data_lines), line_number
+
+    def _read_table_records(self):
+        # _read_table_block using offsets into the memory mapped file; the data lines are returned as a view
+
+        f = self.file
+
+        start = f.tell_line()
+
+        header_end = f.find_line(start, '$', invert=True)
+        end = f.find_line(header_end, '$')
+
+        blank = f.find_blank_line(start, end)
+
+        if blank < end:
+            end = blank
+            f.seek_line(blank + 1)
+        else:
+            f.seek_line(end)
+
+        if f.tell_line() >= f.line_count:
+            self._done_reading = True
+
+        header_end = min(header_end, end)
+
+        if header_end < end and f.records[header_end, 0] == ord('-'):
+            raise Exception('Error reading punch file %s!' % f.filename)
+
+        header_lines = [f.line(i) for i in range(start, header_end)]
+
+        if start < end:
+            line_number = start + 1
+        else:
+            line_number = -1
+
+        return header_lines, f.lines(header_end, end), line_number
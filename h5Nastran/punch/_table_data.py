@@ -1,138 +1,281 @@
-from __future__ import print_function, absolute_import
-from six import iteritems, itervalues
-from six.moves import range
-
-
-def convert_data(data):
-    return data.strip()
-
-
-class PunchHeaderData(object):
-    def __init__(self):
-        self.title = ''
-        self.subtitle = ''
-        self.label = ''
-        self._subcase_id = ''
-        self._results_type = ''
-        self.real_output = False
-        self.other = {}
-        self.lineno = -1
-
-    def clear(self):
-        self.title = ''
-        self.subtitle = ''
-        self.label = ''
-        self._subcase_id = ''
-        self._results_type = ''
-        self.real_output = False
-        self.other.clear()
-
-    def set_data(self, line):
-        if line.startswith('$TITLE'):
-            self.title = line.split('=')[1].strip()
-        elif line.startswith('$SUBTITLE'):
-            self.subtitle = line.split('=')[1].strip()
-        elif line.startswith('$LABEL'):
-            self.label = line.split('=')[1].strip()
-        elif line.startswith('$SUBCASE ID'):
-            self._subcase_id = line.split('=')[1].strip()
-        elif line.startswith('$REAL OUTPUT'):
-            self.real_output = True
-        # elif line.startswith('$ELEMENT TYPE'):
-        #     tmp = line[1:].split('=')
-        #     right = tmp[1].strip().split()
-        #     # TODO: needs to be done right
-        #     if len(right) == 3:
-        #         self.other['ELEMENT TYPE INFO'] = right[2]
-        #     self.other['ELEMENT TYPE'] = ' '.join(right[:2])
-        elif '=' in line:
-            tmp = line[1:].split('=')
-            left = tmp[0].strip()
-            right = tmp[1].strip()
-            self.other[left] = ' '.join(right.split())
-        else:
-            self._results_type = ' '.join(line[1:].strip().split())
-
-    def __str__(self):
-        return 'LINENO=%d, TITLE=%s, SUBTITLE=%s, LABEL=%s, SUBCASE ID=%s, Results Type=%s, REAL OUTPUT=%s, OTHER=%s' % (
-            self.lineno, self.title, self.subtitle, self.label, self._subcase_id, self._results_type, str(self.real_output),
-            str(self.other)
-        )
-
-    @property
-    def results_type(self):
-        try:
-            results_type = '%s %s' % (self._results_type, self.other['ELEMENT TYPE'])
-        except KeyError:
-            results_type = self._results_type
-
-        if self.real_output:
-            return '%s REAL OUTPUT' % results_type
-        else:
-            return '%s COMPLEX' % results_type
-
-    @property
-    def subcase_id(self):
-        try:
-            return '%s Load Factor=%s' % (self._subcase_id, self.other['LOAD FACTOR'])
-        except KeyError:
-            return self._subcase_id
-
-    def serialize(self):
-        return self.title, self.subtitle, self.label, self._subcase_id, self._results_type, self.real_output, dict(self.other), self.lineno
-
-    def load(self, data):
-        self.title = data[0]
-        self.subtitle = data[1]
-        self.label = data[2]
-        self._subcase_id = data[3]
-        self._results_type = data[4]
-        self.real_output = data[5]
-        self.other = dict(data[6])
-        self.lineno = data[7]
-
-
-class PunchTableData(object):
-    def __init__(self, table_data=None):
-        self.header = PunchHeaderData()
-        self.data = []
-
-        if table_data is not None:
-            self._load_data(table_data)
-
-    def _load_data(self, table_data):
-        self.header.clear()
-        self.data.clear()
-
-        for line in table_data:
-            if chr(line[0]) == '$':
-                self.header.set_data(line.decode())
-                continue
-
-            # _data = [convert_data(line[:10]), convert_data(line[10:18])]
-            _data = [line[:10].strip(), line[10:18].strip()]
-
-            i1 = 18
-            i2 = 36
-
-            line_len = len(line)
-
-            while True:
-                if i1 >= line_len:
-                    break
-
-                # _data.append(convert_data(line[i1:i2]))
-                _data.append(line[i1:i2].strip())
-
-                i1 = i2
-                i2 += 18
-
-            self.data.append(_data)
-
-    def serialize(self):
-        return list(self.data), self.header.serialize()
-
-    def load(self, data):
-        self.data.clear()
-        self.data.extend(data[0])
-        self.header.load(data[1])
+from __future__ import print_function, absolute_import
+from six import iteritems, itervalues
+from six.moves import range
+
+import numpy as np
+
+
+def convert_data(data):
+    return data.strip()
+
+
+# fixed columns of a 72 character punch line
+punch_line_dtype = np.dtype([('ID', 'S10'), ('FIELD1', 'S8'), ('FIELD2', 'S18'), ('FIELD3', 'S18'), ('FIELD4', 'S18')])
+
+
+def make_id_ranges(ids):
+    """
+    Converts ids, a list of ids and inclusive (first, last) ranges, into a sorted (n, 2) array of disjoint ranges.
+    """
+    ranges = []
+
+    for _id in ids:
+        if isinstance(_id, (list, tuple)):
+            ranges.append((int(_id[0]), int(_id[1])))
+        else:
+            ranges.append((int(_id), int(_id)))
+
+    if len(ranges) == 0:
+        return np.empty((0, 2), dtype='<i8')
+
+    ranges = np.array(sorted(ranges), dtype='<i8')
+
+    # merge overlapping and adjacent ranges
+    last = np.maximum.accumulate(ranges[:, 1])
+    new_range = np.ones(ranges.shape[0], dtype=bool)
+    new_range[1:] = ranges[1:, 0] > last[:-1] + 1
+
+    first = np.flatnonzero(new_range)
+    stop = np.append(first[1:], ranges.shape[0]) - 1
+
+    return np.column_stack((ranges[first, 0], last[stop]))
+
+
+def in_id_ranges(ids, id_ranges):
+    i = np.searchsorted(id_ranges[:, 0], ids, side='right') - 1
+    return (i >= 0) & (ids <= id_ranges[np.maximum(i, 0), 1])
+
+
+def split_records(block, id_ranges=None):
+    """
+    Splits 72 character punch lines into a 2-D array of stripped fields, one row per record.  block is either a
+    buffer of lines or an array of punch_line_dtype.  Continuation lines (-CONT-) are appended to their record.
+    If id_ranges (see make_id_ranges) is given, only records with an id in the ranges are kept.  Records whose
+    first field isn't an integer aren't keyed by id (SORT2 tables are keyed by time or frequency) and are all kept.
+    """
+    if isinstance(block, np.ndarray):
+        lines = block
+    else:
+        lines = np.frombuffer(block, dtype=punch_line_dtype)
+
+    line_count = lines.shape[0]
+
+    if line_count == 0:
+        return np.empty((0, 2), dtype='S18')
+
+    is_cont = lines['ID'].astype('S1') == b'-'
+
+    if is_cont[0]:
+        raise ValueError('Continuation line without a record!')
+
+    starts = np.flatnonzero(~is_cont)
+    counts = np.diff(np.append(starts, line_count))
+
+    if id_ranges is not None:
+        try:
+            ids = lines['ID'][starts].astype('<i8')
+        except ValueError:
+            id_ranges = None
+
+    if id_ranges is not None:
+        keep = in_id_ranges(ids, id_ranges)
+        starts = starts[keep]
+        counts = counts[keep]
+
+        if starts.shape[0] == 0:
+            return np.empty((0, 2), dtype='S18')
+
+    max_count = counts.max()
+
+    tokens = np.zeros((starts.shape[0], 2 + 3 * max_count), dtype='S18')
+
+    tokens[:, 0] = lines['ID'][starts]
+    tokens[:, 1] = lines['FIELD1'][starts]
+
+    for i in range(max_count):
+        if i == 0:
+            rows = slice(None)
+            _lines = lines[starts]
+        else:
+            rows = counts > i
+            _lines = lines[starts[rows] + i]
+
+        j = 2 + 3 * i
+
+        tokens[rows, j] = _lines['FIELD2']
+        tokens[rows, j + 1] = _lines['FIELD3']
+        tokens[rows, j + 2] = _lines['FIELD4']
+
+    return np.char.strip(tokens)
+
+
+def convert_tokens(tokens, dtype):
+    """
+    Converts an array of stripped punch fields to dtype in bulk.  Blank numeric fields become 0 (integer) or nan (float).
+    """
+    dtype = np.dtype(dtype)
+
+    if dtype.kind not in ('i', 'u', 'f'):
+        return tokens.astype(dtype)
+
+    blank = tokens == b''
+
+    if blank.any():
+        tokens = np.where(blank, b'nan' if dtype.kind == 'f' else b'0', tokens)
+
+    return tokens.astype(dtype)
+
+
+class PunchHeaderData(object):
+    def __init__(self):
+        self.title = ''
+        self.subtitle = ''
+        self.label = ''
+        self._subcase_id = ''
+        self._results_type = ''
+        self.real_output = False
+        self.other = {}
+        self.lineno = -1
+
+    def clear(self):
+        self.title = ''
+        self.subtitle = ''
+        self.label = ''
+        self._subcase_id = ''
+        self._results_type = ''
+        self.real_output = False
+        self.other.clear()
+
+    def set_data(self, line):
+        if line.startswith('$TITLE'):
+            self.title = line.split('=')[1].strip()
+        elif line.startswith('$SUBTITLE'):
+            self.subtitle = line.split('=')[1].strip()
+        elif line.startswith('$LABEL'):
+            self.label = line.split('=')[1].strip()
+        elif line.startswith('$SUBCASE ID'):
+            self._subcase_id = line.split('=')[1].strip()
+        elif line.startswith('$REAL OUTPUT'):
+            self.real_output = True
+        # elif line.startswith('$ELEMENT TYPE'):
+        #     tmp = line[1:].split('=')
+        #     right = tmp[1].strip().split()
+        #     # TODO: needs to be done right
+        #     if len(right) == 3:
+        #         self.other['ELEMENT TYPE INFO'] = right[2]
+        #     self.other['ELEMENT TYPE'] = ' '.join(right[:2])
+        elif '=' in line:
+            tmp = line[1:].split('=')
+            left = tmp[0].strip()
+            right = tmp[1].strip()
+            self.other[left] = ' '.join(right.split())
+        else:
+            self._results_type = ' '.join(line[1:].strip().split())
+
+    def __str__(self):
+        return 'LINENO=%d, TITLE=%s, SUBTITLE=%s, LABEL=%s, SUBCASE ID=%s, Results Type=%s, REAL OUTPUT=%s, OTHER=%s' % (
+            self.lineno, self.title, self.subtitle, self.label, self._subcase_id, self._results_type, str(self.real_output),
+            str(self.other)
+        )
+
+    @property
+    def results_type(self):
+        try:
+            results_type = '%s %s' % (self._results_type, self.other['ELEMENT TYPE'])
+        except KeyError:
+            results_type = self._results_type
+
+        if self.real_output:
+            return '%s REAL OUTPUT' % results_type
+        else:
+            return '%s COMPLEX' % results_type
+
+    @property
+    def subcase_id(self):
+        try:
+            return '%s Load Factor=%s' % (self._subcase_id, self.other['LOAD FACTOR'])
+        except KeyError:
+            return self._subcase_id
+
+    @property
+    def is_sort1(self):
+        # SORT2 tables are of a single point or element, their records are keyed by time or frequency
+        return 'POINT ID' not in self.other and 'ELEMENT ID' not in self.other
+
+    def serialize(self):
+        return self.title, self.subtitle, self.label, self._subcase_id, self._results_type, self.real_output, dict(self.other), self.lineno
+
+    def load(self, data):
+        self.title = data[0]
+        self.subtitle = data[1]
+        self.label = data[2]
+        self._subcase_id = data[3]
+        self._results_type = data[4]
+        self.real_output = data[5]
+        self.other = dict(data[6])
+        self.lineno = data[7]
+
+
+class PunchTableData(object):
+    def __init__(self, table_data=None):
+        self.header = PunchHeaderData()
+        self.data = []
+
+        if table_data is not None:
+            self._load_data(table_data)
+
+    def load_block(self, header_lines, block, id_ranges=None):
+        """
+        Loads a table from its header lines and its 72 character data lines (see split_records).  data is a 2-D
+        array of fields.  id_ranges only applies to SORT1 tables, the records of SORT2 tables are all kept.
+        """
+        self.header.clear()
+
+        for line in header_lines:
+            self.header.set_data(line.decode())
+
+        if not self.header.is_sort1:
+            id_ranges = None
+
+        self.data = split_records(block, id_ranges)
+
+    def _load_data(self, table_data):
+        self.header.clear()
+        self.data = []
+
+        for line in table_data:
+            if chr(line[0]) == '$':
+                self.header.set_data(line.decode())
+                continue
+
+            # _data = [convert_data(line[:10]), convert_data(line[10:18])]
+            _data = [line[:10].strip(), line[10:18].strip()]
+
+            i1 = 18
+            i2 = 36
+
+            line_len = len(line)
+
+            while True:
+                if i1 >= line_len:
+                    break
+
+                # _data.append(convert_data(line[i1:i2]))
+                _data.append(line[i1:i2].strip())
+
+                i1 = i2
+                i2 += 18
+
+            self.data.append(_data)
+
+    def serialize(self):
+        if isinstance(self.data, np.ndarray):
+            return self.data, self.header.serialize()
+        return list(self.data), self.header.serialize()
+
+    def load(self, data):
+        if isinstance(data[0], np.ndarray):
+            self.data = data[0]
+        else:
+            self.data = list(data[0])
+        self.header.load(data[1])
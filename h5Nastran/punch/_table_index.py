@@ -0,0 +1,143 @@
+from __future__ import print_function, absolute_import
+from six import iteritems, itervalues, string_types, integer_types
+from six.moves import range
+
+import os
+from zipfile import BadZipfile
+
+import numpy as np
+
+
+table_index_dtype = np.dtype([
+    ('OFFSET', '<i8'),  # byte offset of the first line of the table
+    ('LINE', '<i8'),  # index of the first line of the table
+    ('HEADER_LINES', '<i8'),
+    ('LINE_COUNT', '<i8'),  # header and data lines
+    ('ROW_COUNT', '<i8'),  # records, continuation lines not included
+    ('RESULTS_TYPE', 'S256'),
+    ('SUBCASE_ID', 'S64'),
+    ('ELEMENT_TYPE', 'S64')
+])
+
+
+class Selection(object):
+    """
+    Table selection by results type and subcase id.  A results type matches if it is the full results type or its
+    leading words, i.e. 'ELEMENT FORCES 33 QUAD4' matches 'ELEMENT FORCES 33 QUAD4 REAL OUTPUT'.  Subcase ids are
+    compared without the load factor.  None selects everything.
+    """
+
+    def __init__(self, results_types=None, subcase_ids=None):
+        if isinstance(results_types, string_types):
+            results_types = [results_types]
+
+        if isinstance(subcase_ids, integer_types + string_types):
+            subcase_ids = [subcase_ids]
+
+        if results_types is not None:
+            results_types = list(results_types)
+
+        if subcase_ids is not None:
+            subcase_ids = set(str(_) for _ in subcase_ids)
+
+        self.results_types = results_types
+        self.subcase_ids = subcase_ids
+
+    def is_selected(self, results_type, subcase_id):
+        if self.subcase_ids is not None and subcase_id.split(' ', 1)[0] not in self.subcase_ids:
+            return False
+
+        if self.results_types is None:
+            return True
+
+        for _results_type in self.results_types:
+            if results_type == _results_type or results_type.startswith(_results_type + ' '):
+                return True
+
+        return False
+
+
+def sidecar_filename(filename):
+    return filename + '.idx.npz'
+
+
+class PunchTableIndex(object):
+    """
+    Location, size and header summary of every table in a punch file.  The index is saved next to the punch file
+    and is only reused if the punch file size and modification time have not changed.
+    """
+
+    version = 1
+
+    def __init__(self, filename, data=None):
+        self.filename = filename
+
+        self.filesize = os.path.getsize(filename)
+        self.mtime = os.path.getmtime(filename)
+
+        if data is None:
+            data = np.empty(0, dtype=table_index_dtype)
+
+        self.data = data
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Returns the saved index for filename, or None if there isn't one or it is out of date.
+        """
+        try:
+            with np.load(sidecar_filename(filename), allow_pickle=False) as saved:
+                data = saved['data']
+                info = saved['info']
+        except (IOError, OSError, KeyError, ValueError, BadZipfile):
+            # missing, unreadable or saved in another layout, the file is scanned again
+            return None
+
+        index = cls(filename, data)
+
+        if (info.shape != (3,) or int(info[0]) != cls.version or int(info[1]) != index.filesize or
+                float(info[2]) != index.mtime or index.data.dtype != table_index_dtype):
+            return None
+
+        return index
+
+    def save(self):
+        info = np.array([self.version, self.filesize, self.mtime], dtype='<f8')
+
+        try:
+            with open(sidecar_filename(self.filename), 'wb') as f:
+                np.savez(f, data=self.data, info=info)
+        except (IOError, OSError):
+            # index is only a cache, a read only location isn't an error
+            pass
+
+    def select(self, results_types=None, subcase_ids=None):
+        """
+        Returns the positions of the tables matching any of results_types and any of subcase_ids, see Selection.
+        """
+        selection = Selection(results_types, subcase_ids)
+
+        data = self.data
+
+        return np.array([i for i in range(data.shape[0])
+                         if selection.is_selected(data['RESULTS_TYPE'][i].decode(), data['SUBCASE_ID'][i].decode())],
+                        dtype='<i8')
+
+    def row_counts(self, selection=None):
+        """
+        Total number of records of each results type, only counting the tables in selection if given.
+        """
+        data = self.data
+
+        if selection is not None:
+            data = data[selection]
+
+        results_types, inverse = np.unique(data['RESULTS_TYPE'], return_inverse=True)
+        counts = np.bincount(inverse, weights=data['ROW_COUNT'], minlength=results_types.shape[0])
+        return {results_types[i].decode(): int(counts[i]) for i in range(results_types.shape[0])}
@@ -1,3 +1,3 @@
-from __future__ import print_function, absolute_import
-
-from .result import Result
+from __future__ import print_function, absolute_import
+
+from .result import Result
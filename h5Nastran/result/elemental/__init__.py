@@ -1,6 +1,6 @@
-from __future__ import print_function, absolute_import
-from six import iteritems, itervalues
-from six.moves import range
-
-
-from .elemental import Elemental
+from __future__ import print_function, absolute_import
+from six import iteritems, itervalues
+from six.moves import range
+
+
+from .elemental import Elemental
@@ -1,2 +1,2 @@
-
-from .nodal import Nodal
+
+from .nodal import Nodal
@@ -1,704 +1,1348 @@
-from __future__ import print_function, absolute_import
-
-from collections import defaultdict
-from copy import deepcopy
-
-import numpy as np
-import tables
-
-from h5Nastran.msc import data_tables
-from ..punch import PunchTableData
-
-
-########################################################################################################################
-
-
-def _get_dtype(table):
-    try:
-        return data_tables[table.same_as].dtype
-    except KeyError:
-        return table.dtype
-
-
-########################################################################################################################
-
-
-class _Format(object):
-    def __init__(self):
-        raise NotImplementedError
-
-
-class IndexFormat(tables.IsDescription):
-    DOMAIN_ID = tables.Int64Col(pos=1)
-    POSITION = tables.Int64Col(pos=2)
-    LENGTH = tables.Int64Col(pos=3)
-
-
-class PrivateIndexFormat(tables.IsDescription):
-    LOCATION = tables.Int64Col(pos=1)
-    LENGTH = tables.Int64Col(pos=2)
-    OFFSET = tables.Int64Col(pos=3)
-
-
-private_index_format_dtype = tables.dtype_from_descr(PrivateIndexFormat)
-
-
-class PrivateIndexDataFormat(tables.IsDescription):
-    ID = tables.Int64Col(pos=1)
-
-
-private_index_data_format_dtype = tables.dtype_from_descr(PrivateIndexDataFormat)
-
-########################################################################################################################
-
-
-def _validator(data):
-    return data
-
-########################################################################################################################
-
-
-def _convert_dtype(dtype, indices):
-    new_dtype = []
-    new_indices = DataGetter()
-
-    for i in range(len(dtype)-1):
-        _dtype = dtype[i]
-        _indices = indices.indices[i]
-
-        if not isinstance(_dtype[1], list):
-            new_dtype.append(_dtype)
-            new_indices.indices.append(_indices)
-        else:
-            for j in range(len(_dtype[1])):
-                _ = _dtype[1][j]
-                assert not isinstance(_, list)  # not doing multiple levels
-                _name = _[0]
-                _type = _[1]
-                if len(_indices) == 1:
-                    _shape = ()
-                    new_indices.indices.append(_indices[0][j])
-                else:
-                    _shape = (len(_indices),)
-                    new_indices.indices.append([_[j] for _ in _indices])
-
-                new_dtype.append((_name, _type, _shape))
-
-    new_dtype.append(dtype[-1])  # add DOMAIN_ID
-
-    return new_dtype, new_indices
-
-########################################################################################################################
-
-
-class DefinedValue(object):
-    def __init__(self, value):
-        self.value = value
-
-
-class DataGetter(object):
-    def __init__(self, dtype=None, indices=None):
-        self.indices = []
-
-        if dtype is not None:
-            self.make_indices_from_dtype(dtype)
-
-        if indices is not None:
-            self.indices = deepcopy(indices)
-
-    def __len__(self):
-        return len(self.indices)
-
-    def make_indices_from_dtype(self, dtype):
-        del self.indices[:]
-
-        def _make_indices(_dtype, i):
-            indices = []
-
-            for _ in _dtype:
-                if i == 1:
-                    i = 2  # skip 2nd field in punch file by default
-
-                _d = _[1]
-                shape = _[2]
-                try:
-                    size = shape[0]
-                except IndexError:
-                    size = 1
-
-                if isinstance(_d, list):
-                    _indices = _make_indices(_d, i)
-
-                    if size > 1:
-                        _list_indices = [_indices]
-                        for j in range(size-1):
-                            _list_indices.append((np.array(_list_indices[-1]) + len(_list_indices[-1])).tolist())
-                        _indices = _list_indices
-                    else:
-                        _indices = [_indices]
-
-                    def _count(_indices_):
-                        _result = 0
-                        for _i in _indices_:
-                            if isinstance(_i, list):
-                                _result += _count(_i)
-                            else:
-                                _result += 1
-
-                        return _result
-
-                    i += _count(_indices)
-                    indices.append(_indices)
-                else:
-                    indices.append(i)
-                    i += size
-
-            return indices
-
-        self.indices.extend(_make_indices(dtype, 0))
-        self.indices.pop()
-
-    def get_data(self, data, indices=None):
-        result = []
-
-        if indices is None:
-            indices = self.indices
-
-        for i in indices:
-            if isinstance(i, list):
-                result.append(self.get_data(data, i))
-            elif isinstance(i, (int, slice)):
-                result.append(data[i])
-            elif isinstance(i, DefinedValue):
-                result.append(i.value)
-            else:
-                result.append(data[i])
-
-        return result
-
-
-def _get_data(data, index):
-    if isinstance(index, (int, slice)):
-        return data[index]
-    elif isinstance(index, (list, tuple)):
-        return [_get_data(data, i) for i in index]
-    elif isinstance(index, DefinedValue):
-        return index.value
-    elif isinstance(index, DataGetter):
-        return index.get_data(data)
-    else:
-        raise TypeError('Unknown index type! %s' % str(type(index)))
-
-########################################################################################################################
-
-
-class TableDef(object):
-
-    @classmethod
-    def create(cls, table_def, results_type, indices=None, validator=None, len_id=None, pos_id=None, subtables=None, rename=None,
-               is_subtable=False):
-        if isinstance(table_def, str):
-            table_def = data_tables[table_def]
-        try:
-            dtype = data_tables[table_def.same_as].dtype
-        except KeyError:
-            dtype = table_def.dtype
-        index_id = dtype[0][0]
-        if indices is None:
-            indices = DataGetter(dtype)
-        for _ in dtype:
-            if isinstance(_[1], list):
-                # need to convert dtype since pytables doesn't support nested dtypes
-                dtype, indices = _convert_dtype(dtype, indices)
-                break
-        if subtables is None:
-            subtables = [TableDef.create(data_tables[_], '', rename=rename, is_subtable=True) for _ in table_def.subtables]
-        return cls(table_def.name, table_def.path, results_type, index_id, dtype, indices, validator,
-                   len_id, pos_id, subtables, rename, is_subtable=is_subtable)
-
-    def __init__(self, table_id, group, results_type, index_id, dtype, indices, validator=None,
-                 len_id=None, pos_id=None, subtables=None, rename=None, is_subtable=False):
-        self.implemented = True
-        self.table_id = table_id
-        self.group = group
-
-        self.dtype = np.dtype(dtype)
-
-        if subtables is None:
-            subtables = []
-
-        assert len(subtables) == 0, 'Cannot have subtables defined for this result table type.'
-
-        self.subtables = subtables
-
-        self.attrs = list(self.dtype.names)
-
-        try:
-            self.attrs.remove('DOMAIN_ID')
-        except ValueError:
-            pass
-
-        def _zero():
-            return 0
-
-        self._pos = defaultdict(_zero)
-
-        for subtable in self.subtables:
-            try:
-                self.attrs.remove(subtable.pos_id)
-                self.attrs.remove(subtable.len_id)
-            except ValueError:
-                print(self.path(), self.attrs, subtable.pos_id, subtable.len_id)
-                raise
-
-        self.table = None
-
-        self.h5f = None
-
-        if len_id is None:
-            len_id = '%s_LEN' % self.table_id.replace('_', '')
-
-        if pos_id is None:
-            pos_id = '%s_POS' % self.table_id.replace('_', '')
-
-        if rename is None:
-            rename = {}
-
-        self.len_id = rename.get(len_id, len_id)
-        self.pos_id = rename.get(pos_id, pos_id)
-
-        cols = set(self.dtype.names)
-
-        for subtable in self.subtables:
-            assert subtable.len_id in cols
-            assert subtable.pos_id in cols
-
-        ################################################################################################################
-
-        self.is_subtable = is_subtable
-
-        self.index_id = index_id
-
-        try:
-            self.results_type = results_type[0]
-        except IndexError:
-            self.results_type = results_type
-
-        if validator is None:
-            validator = _validator
-
-        self.validator = validator
-
-        try:
-            self.Format = tables.descr_from_dtype(self.dtype)[0]
-        except NotImplementedError:
-            dtype, indices = _convert_dtype(dtype, indices)
-            self.dtype = np.dtype(dtype)
-            self.Format = tables.descr_from_dtype(self.dtype)[0]
-
-        self.indices = deepcopy(indices)
-
-        assert isinstance(self.indices, DataGetter)
-
-        assert len(self.indices) == len(self.dtype.names) - 1
-
-        self.domain_count = 0
-
-        self.IndexFormat = IndexFormat
-        self.PrivateIndexFormat = PrivateIndexFormat
-        self.PrivateIndexDataFormat = PrivateIndexDataFormat
-
-        self._index_table = None
-        self._private_index_table = None
-
-        self._index_data = []
-        self._subcase_index = []
-        self._index_offset = 0
-
-    def __deepcopy__(self, memodict=None):
-        from copy import copy
-        _copy = copy(self)
-        _copy.domain_count = 0
-        _copy._index_offset = 0
-        del _copy._index_data[:]
-        del _copy._subcase_index[:]
-        _copy._index_table = None
-        _copy._private_index_table = None
-
-        memodict[id(_copy)] = _copy
-
-        return _copy
-
-    def finalize(self):
-        if self.is_subtable:
-            return
-        self._write_index()
-        self._write_private_index()
-
-    def get_table(self):
-        if self.table is None:
-            self.table = self._make_table()
-        return self.table
-
-    def not_implemented(self):
-        self.implemented = False
-
-    def read(self, indices):
-        table = self.get_table()
-
-        indices = np.array(indices, dtype='i8')
-
-        data = np.empty(len(indices), dtype=table._v_dtype)
-        table._read_elements(indices, data)
-
-        return data
-
-    def search(self, domains, data_ids, filter=None):
-        private_index_table = self._get_private_index_table()
-
-        indices = set()
-
-        for domain in domains:
-            try:
-                index_dict, offset = private_index_table[domain-1]
-            except IndexError:
-                continue
-
-            for data_id in data_ids:
-                _indices = index_dict[data_id]
-                indices.update(set(index + offset for index in _indices))
-
-        results = self.read(sorted(indices))
-
-        if filter is not None:
-            indices = set()
-            for key in filter.keys():
-                data = set(filter[key])
-                results_data = results[key]
-                for i in range(results_data.shape[0]):
-                    if results_data[i] in data:
-                        indices.add(i)
-            results = results[sorted(indices)]
-
-        return results
-
-    def path(self):
-        return self.group + '/' + self.table_id
-
-    def set_h5f(self, h5f):
-        self.h5f = h5f
-        for subtable in self.subtables:
-            subtable.set_h5f(h5f)
-
-    def to_numpy(self, data):
-        result = np.empty(len(data), dtype=self.dtype)
-
-        validator = self.validator
-
-        names = list(self.dtype.names)
-
-        _result = {name: result[name] for name in names}
-
-        for i in range(len(data)):
-            _data = validator(self.indices.get_data(data[i]))
-            _data.append(self.domain_count)
-
-            for j in range(len(names)):
-                _result[names[j]][i] = _data[j]
-
-        return result
-
-    def write_data(self, data):
-        assert isinstance(data, PunchTableData)
-
-        if len(data.data) == 0:
-            return
-
-        table = self.get_table()
-
-        self.domain_count += 1
-
-        data = self.to_numpy(data.data)
-        table.append(data)
-        self._record_data_indices(data)
-
-        self.h5f.flush()
-
-    def _get_index_table(self):
-        if self.is_subtable:
-            return None
-        h5f = self.h5f
-        if self._index_table is None:
-            index_table = h5f.get_node('/INDEX%s' % self.path())
-            index_table = index_table.read()
-
-            self._index_table = [
-                set(range(index_table['POSITION'][i], index_table['POSITION'][i] + index_table['LENGTH'][i]))
-                for i in range(index_table.shape[0])
-            ]
-
-        return self._index_table
-
-    def _get_private_index_table(self):
-        if self.is_subtable:
-            return None
-        h5f = self.h5f
-        if self._private_index_table is None:
-            data = h5f.get_node(self._private_index_path + '/DATA')
-            data = data.read()
-
-            identity = h5f.get_node(self._private_index_path + '/IDENTITY')
-            identity = identity.read()
-
-            private_index_table = self._private_index_table = []
-
-            _index_data = {}
-
-            for i in range(identity.shape[0]):
-                location, length, offset = identity[i]
-
-                try:
-                    private_index_table.append((_index_data[location][0], offset))
-                except KeyError:
-                    _data_dict = load_data_dict(data['ID'][location: location + length])
-                    _index_data[location] = (_data_dict, offset)
-                    private_index_table.append(_index_data[location])
-
-        return self._private_index_table
-
-    def _get_private_index_tables(self):
-        if self.is_subtable:
-            return None, None
-        h5f = self.h5f
-        try:
-            identity = h5f.get_node(self._private_index_path + '/IDENTITY')
-        except tables.NoSuchNodeError:
-            identity = h5f.create_table(self._private_index_path, 'IDENTITY', self.PrivateIndexFormat, 'Private Index',
-                                        expectedrows=len(self._subcase_index), createparents=True)
-        try:
-            data = h5f.get_node(self._private_index_path + '/DATA')
-        except tables.NoSuchNodeError:
-            data = h5f.create_table(self._private_index_path, 'DATA', self.PrivateIndexDataFormat, 'Private Index Data',
-                                    expectedrows=sum([len(_) for _ in self._index_data]), createparents=True)
-
-        return identity, data
-
-    def _make_table(self, expected_rows=100000):
-        if self.implemented is False:
-            return None
-        try:
-            return self.h5f.get_node(self.path())
-        except tables.NoSuchNodeError:
-            try:
-                self.h5f.create_table(self.group, self.table_id, self.Format, self.results_type,
-                                        expectedrows=expected_rows, createparents=True)
-            except tables.FileModeError:
-                return None
-            return self.h5f.get_node(self.path())
-
-    @property
-    def _private_index_path(self):
-        return '/PRIVATE/INDEX' + self.path()
-
-    def _record_data_indices(self, data):
-        if self.is_subtable:
-            return
-
-        serialized_data = serialize_indices(data[self.index_id][:])
-
-        index_data = serialized_data.astype(dtype=private_index_data_format_dtype)
-
-        found_index = False
-
-        index_data_offset = 0
-
-        for i in range(len(self._index_data)):
-            _index_data = self._index_data[i]
-            if _index_data.shape == index_data.shape:
-                if np.all(_index_data == index_data):
-                    self._subcase_index.append((index_data_offset, index_data.shape[0], self._index_offset))
-                    found_index = True
-                    break
-            index_data_offset += _index_data.shape[0]
-
-        if not found_index:
-            self._index_data.append(index_data)
-            self._subcase_index.append((index_data_offset, index_data.shape[0], self._index_offset))
-
-        self._index_offset += data.shape[0]
-
-    def _write_index(self):
-        if self.is_subtable:
-            return
-
-        table = self.get_table()
-
-        # noinspection PyProtectedMember
-        domain_id = table.cols._f_col('DOMAIN_ID')[:]
-
-        unique, counts = np.unique(domain_id, return_counts=True)
-        counts = dict(zip(unique, counts))
-
-        domains = self.h5f.create_table('/INDEX' + self.group, self.table_id, self.IndexFormat, self.results_type,
-                                   expectedrows=len(counts), createparents=True)
-
-        row = domains.row
-
-        pos = 0
-
-        for i in range(len(counts)):
-            d = i + 1
-            count = counts[d]
-
-            row['DOMAIN_ID'] = d
-            row['POSITION'] = pos
-            row['LENGTH'] = count
-
-            row.append()
-
-            pos += count
-
-        domains.flush()
-
-        self._index_table = None
-
-    def _write_private_index(self):
-        if self.is_subtable:
-            return
-
-        identity, data = self._get_private_index_tables()
-
-        identity.append(np.array(self._subcase_index, dtype=private_index_format_dtype))
-
-        for index_data in self._index_data:
-            data.append(index_data)
-
-        self.h5f.flush()
-
-        self._private_index_table = None
-
-        del self._subcase_index[:]
-        del self._index_data[:]
-
-########################################################################################################################
-
-
-def serialize_indices(data):
-    return serialize_data_dict(get_data_dict(data))
-
-
-def get_data_dict(data):
-    from collections import OrderedDict
-    data_dict = OrderedDict()
-
-    for i in range(data.shape[0]):
-        data_id = int(data[i])
-        try:
-            data_dict[data_id].append(i)
-        except KeyError:
-            data_dict[data_id] = [i]
-
-    return data_dict
-
-
-def serialize_data_dict(data_dict):
-    data = []
-
-    for key, _data in data_dict.items():
-        _data_ = [key, len(_data)]
-        _data_.extend(_data)
-        data.extend(_data_)
-
-    return np.array(data)
-
-
-def load_data_dict(serialize_data, offset=0):
-    data_dict = {}
-
-    last_i = serialize_data.shape[0] - 1
-
-    i = 0
-    while True:
-        data_id = serialize_data[i]
-        data_len = serialize_data[i + 1]
-
-        _data = serialize_data[i + 2: i + 2 + data_len]
-
-        data_dict[data_id] = _data + offset
-
-        i += 2 + data_len
-
-        if i >= last_i:
-            break
-
-    assert i == last_i + 1
-
-    return data_dict
-
-
-########################################################################################################################
-
-
-class TableData(object):
-    def __init__(self, data=None, subdata_len=None, subdata=None):
-
-        if data is None:
-            data = []
-
-        if subdata_len is None:
-            subdata_len = np.zeros((1, 1))
-
-        if subdata is None:
-            subdata = []
-
-        self.data = data
-        self.subdata_len = subdata_len  # type: np.ndarray
-        self.subdata = subdata  # type: list[TableData]
-
-    def __repr__(self):
-        result = [str(self.data)]
-        for subdata in self.subdata:
-            result.append(subdata.__repr__())
-        return ';'.join(result)
-
-    def validate(self):
-        if len(self.subdata) > 0:
-            shape = self.subdata_len.shape
-            assert shape[0] == len(self.data), (shape[0], len(self.data))
-            assert shape[1] == len(self.subdata), (shape[1], len(self.subdata))
-        for subdata in self.subdata:
-            subdata.validate()
-
-
-class ResultTable(object):
-    result_type = ''
-    table_def = None  # type: TableDef
-
-    def __init__(self, h5n, parent):
-        self._h5n = h5n
-        self._parent = parent
-        self._table_def = deepcopy(self.table_def)
-        self._table_def.set_h5f(self._h5n.h5f)
-
-        if self.result_type is not None:
-            self._h5n.register_result_table(self)
-
-    def write_data(self, data):
-        self._table_def.write_data(data)
-
-    def finalize(self):
-        self._table_def.finalize()
-
-    def read(self, indices):
-        return self._table_def.read(indices)
-
-    def search(self, domains, data_ids, filter=None):
-        return self._table_def.search(domains, data_ids, filter)
-
-    @property
-    def results_type(self):
-        return self._table_def.results_type
-
-    @results_type.setter
-    def results_type(self, value):
-        self._table_def.results_type = value
+from __future__ import print_function, absolute_import
+from six import string_types
+
+from collections import defaultdict
+from copy import deepcopy
+
+import numpy as np
+import tables
+
+from h5Nastran.msc import data_tables
+from ..punch import PunchTableData, convert_tokens
+from ..table_group import LazyTableDef
+
+
+########################################################################################################################
+
+
+def _get_dtype(table):
+    try:
+        return data_tables[table.same_as].dtype
+    except KeyError:
+        return table.dtype
+
+
+########################################################################################################################
+
+
+class _Format(object):
+    def __init__(self):
+        raise NotImplementedError
+
+
+class IndexFormat(tables.IsDescription):
+    DOMAIN_ID = tables.Int64Col(pos=1)
+    POSITION = tables.Int64Col(pos=2)
+    LENGTH = tables.Int64Col(pos=3)
+
+
+# private index is stored in CSR format, each domain points to the sorted ids of its layout in DATA, each id points
+# to its rows (relative to the first row of the domain) in INDICES
+
+class PrivateIndexFormat(tables.IsDescription):
+    LOCATION = tables.Int64Col(pos=1)  # first row of the layout in DATA
+    LENGTH = tables.Int64Col(pos=2)  # number of ids in the layout
+    OFFSET = tables.Int64Col(pos=3)  # first row of the domain
+
+
+private_index_format_dtype = tables.dtype_from_descr(PrivateIndexFormat)
+
+
+class PrivateIndexDataFormat(tables.IsDescription):
+    ID = tables.Int64Col(pos=1)
+    POSITION = tables.Int64Col(pos=2)  # first row in INDICES
+    LENGTH = tables.Int64Col(pos=3)
+
+
+private_index_data_format_dtype = tables.dtype_from_descr(PrivateIndexDataFormat)
+
+
+class PrivateIndexIndicesFormat(tables.IsDescription):
+    INDEX = tables.Int64Col(pos=1)
+
+
+private_index_indices_format_dtype = tables.dtype_from_descr(PrivateIndexIndicesFormat)
+
+########################################################################################################################
+
+
+def _validator(data):
+    return data
+
+########################################################################################################################
+
+
+def _convert_dtype(dtype, indices):
+    new_dtype = []
+    new_indices = DataGetter()
+
+    for i in range(len(dtype)-1):
+        _dtype = dtype[i]
+        _indices = indices.indices[i]
+
+        if not isinstance(_dtype[1], list):
+            new_dtype.append(_dtype)
+            new_indices.indices.append(_indices)
+        else:
+            for j in range(len(_dtype[1])):
+                _ = _dtype[1][j]
+                assert not isinstance(_, list)  # not doing multiple levels
+                _name = _[0]
+                _type = _[1]
+                if len(_indices) == 1:
+                    _shape = ()
+                    new_indices.indices.append(_indices[0][j])
+                else:
+                    _shape = (len(_indices),)
+                    new_indices.indices.append([_[j] for _ in _indices])
+
+                new_dtype.append((_name, _type, _shape))
+
+    new_dtype.append(dtype[-1])  # add DOMAIN_ID
+
+    return new_dtype, new_indices
+
+########################################################################################################################
+
+
+class DefinedValue(object):
+    def __init__(self, value):
+        self.value = value
+
+
+class DataGetter(object):
+    def __init__(self, dtype=None, indices=None):
+        self.indices = []
+
+        if dtype is not None:
+            self.make_indices_from_dtype(dtype)
+
+        if indices is not None:
+            self.indices = deepcopy(indices)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def make_indices_from_dtype(self, dtype):
+        del self.indices[:]
+
+        def _make_indices(_dtype, i):
+            indices = []
+
+            for _ in _dtype:
+                if i == 1:
+                    i = 2  # skip 2nd field in punch file by default
+
+                _d = _[1]
+                shape = _[2]
+                try:
+                    size = shape[0]
+                except IndexError:
+                    size = 1
+
+                if isinstance(_d, list):
+                    _indices = _make_indices(_d, i)
+
+                    if size > 1:
+                        _list_indices = [_indices]
+                        for j in range(size-1):
+                            _list_indices.append((np.array(_list_indices[-1]) + len(_list_indices[-1])).tolist())
+                        _indices = _list_indices
+                    else:
+                        _indices = [_indices]
+
+                    def _count(_indices_):
+                        _result = 0
+                        for _i in _indices_:
+                            if isinstance(_i, list):
+                                _result += _count(_i)
+                            else:
+                                _result += 1
+
+                        return _result
+
+                    i += _count(_indices)
+                    indices.append(_indices)
+                else:
+                    indices.append(i)
+                    i += size
+
+            return indices
+
+        self.indices.extend(_make_indices(dtype, 0))
+        self.indices.pop()
+
+    def compile(self):
+        """
+        Flattens the index tree into a column gather plan, one entry per index: an integer array of columns shaped
+        like the field (an int for scalar fields), a slice or a DefinedValue.  Returns None if an entry can't be
+        gathered as columns.
+        """
+        plan = []
+
+        for i in self.indices:
+            if isinstance(i, (DefinedValue, slice)):
+                plan.append(i)
+                continue
+
+            try:
+                columns = np.array(i)
+            except ValueError:
+                return None
+
+            if columns.dtype.kind not in ('i', 'u'):
+                return None
+
+            if columns.ndim == 0:
+                columns = int(columns)
+
+            plan.append(columns)
+
+        return plan
+
+    def get_data(self, data, indices=None):
+        result = []
+
+        if indices is None:
+            indices = self.indices
+
+        for i in indices:
+            if isinstance(i, list):
+                result.append(self.get_data(data, i))
+            elif isinstance(i, (int, slice)):
+                result.append(data[i])
+            elif isinstance(i, DefinedValue):
+                result.append(i.value)
+            else:
+                result.append(data[i])
+
+        return result
+
+
+def _get_data(data, index):
+    if isinstance(index, (int, slice)):
+        return data[index]
+    elif isinstance(index, (list, tuple)):
+        return [_get_data(data, i) for i in index]
+    elif isinstance(index, DefinedValue):
+        return index.value
+    elif isinstance(index, DataGetter):
+        return index.get_data(data)
+    else:
+        raise TypeError('Unknown index type! %s' % str(type(index)))
+
+def _rows_to_tokens(rows):
+    # list of rows of fields (bytes) to a 2-D array of stripped fields, short rows are padded with blanks
+    if len(rows) == 0:
+        return np.empty((0, 0), dtype='S1')
+
+    width = max(len(row) for row in rows)
+
+    rows = [row if len(row) == width else list(row) + [b''] * (width - len(row)) for row in rows]
+
+    return np.char.strip(np.array(rows, dtype=bytes))
+
+########################################################################################################################
+
+
+class TableDef(object):
+
+    @classmethod
+    def lazy(cls, *args, **kwargs):
+        # table definition created on first use, see LazyTableDef
+        return LazyTableDef(cls.create, args, kwargs)
+
+    @classmethod
+    def create(cls, table_def, results_type, indices=None, validator=None, len_id=None, pos_id=None, subtables=None, rename=None,
+               is_subtable=False, array_validator=None):
+        if isinstance(table_def, str):
+            table_def = data_tables[table_def]
+        try:
+            dtype = data_tables[table_def.same_as].dtype
+        except KeyError:
+            dtype = table_def.dtype
+        index_id = dtype[0][0]
+        if indices is None:
+            indices = DataGetter(dtype)
+        for _ in dtype:
+            if isinstance(_[1], list):
+                # need to convert dtype since pytables doesn't support nested dtypes
+                dtype, indices = _convert_dtype(dtype, indices)
+                break
+        if subtables is None:
+            subtables = [TableDef.create(data_tables[_], '', rename=rename, is_subtable=True) for _ in table_def.subtables]
+        return cls(table_def.name, table_def.path, results_type, index_id, dtype, indices, validator,
+                   len_id, pos_id, subtables, rename, is_subtable=is_subtable, array_validator=array_validator)
+
+    def __init__(self, table_id, group, results_type, index_id, dtype, indices, validator=None,
+                 len_id=None, pos_id=None, subtables=None, rename=None, is_subtable=False, array_validator=None):
+        self.implemented = True
+        self.table_id = table_id
+        self.group = group
+
+        self.dtype = np.dtype(dtype)
+
+        if subtables is None:
+            subtables = []
+
+        assert len(subtables) == 0, 'Cannot have subtables defined for this result table type.'
+
+        self.subtables = subtables
+
+        self.attrs = list(self.dtype.names)
+
+        try:
+            self.attrs.remove('DOMAIN_ID')
+        except ValueError:
+            pass
+
+        def _zero():
+            return 0
+
+        self._pos = defaultdict(_zero)
+
+        for subtable in self.subtables:
+            try:
+                self.attrs.remove(subtable.pos_id)
+                self.attrs.remove(subtable.len_id)
+            except ValueError:
+                print(self.path(), self.attrs, subtable.pos_id, subtable.len_id)
+                raise
+
+        self.table = None
+
+        self.h5f = None
+
+        self.expected_rows = None  # sizes the chunks of the table, i.e. from the punch file pre-scan
+        self.chunkshape = None  # overrides the chunkshape pytables computes from expected_rows
+
+        if len_id is None:
+            len_id = '%s_LEN' % self.table_id.replace('_', '')
+
+        if pos_id is None:
+            pos_id = '%s_POS' % self.table_id.replace('_', '')
+
+        if rename is None:
+            rename = {}
+
+        self.len_id = rename.get(len_id, len_id)
+        self.pos_id = rename.get(pos_id, pos_id)
+
+        cols = set(self.dtype.names)
+
+        for subtable in self.subtables:
+            assert subtable.len_id in cols
+            assert subtable.pos_id in cols
+
+        ################################################################################################################
+
+        self.is_subtable = is_subtable
+
+        self.index_id = index_id
+
+        try:
+            self.results_type = results_type[0]
+        except IndexError:
+            self.results_type = results_type
+
+        if validator is None:
+            validator = _validator
+
+        self.validator = validator
+
+        # validator (optional) of the whole converted table, takes and returns the structured array
+        self.array_validator = array_validator
+
+        try:
+            self.Format = tables.descr_from_dtype(self.dtype)[0]
+        except NotImplementedError:
+            dtype, indices = _convert_dtype(dtype, indices)
+            self.dtype = np.dtype(dtype)
+            self.Format = tables.descr_from_dtype(self.dtype)[0]
+
+        self.indices = deepcopy(indices)
+
+        assert isinstance(self.indices, DataGetter)
+
+        self._gather_plan = None  # see _get_gather_plan
+
+        assert len(self.indices) == len(self.dtype.names) - 1
+
+        self.domain_count = 0
+
+        self.IndexFormat = IndexFormat
+        self.PrivateIndexFormat = PrivateIndexFormat
+        self.PrivateIndexDataFormat = PrivateIndexDataFormat
+        self.PrivateIndexIndicesFormat = PrivateIndexIndicesFormat
+
+        self._index_table = None
+        self._private_index_table = None
+        self.index_cache = None  # LRUCache of private index layouts, shared by the tables of a file
+
+        self.title = None  # results type of the first data written, title of the table
+
+        # converted data is appended to the table at finalize or when write_buffers flushes the largest buffers
+        self.write_buffers = None  # WriteBuffers, shared by the tables of a file
+        self._write_buffer = []
+        self._write_buffer_nbytes = 0
+
+        self._index_data = []  # distinct layouts, (data, indices)
+        self._index_data_lookup = {}  # hash of layout: locations in _index_data
+        self._index_data_size = 0
+        self._subcase_index = []
+        self._index_offset = 0
+
+    def __deepcopy__(self, memodict=None):
+        from copy import copy
+        _copy = copy(self)
+        _copy.domain_count = 0
+        _copy._index_offset = 0
+        del _copy._index_data[:]
+        _copy._index_data_lookup = {}
+        _copy._index_data_size = 0
+        del _copy._subcase_index[:]
+        _copy._index_table = None
+        _copy._private_index_table = None
+        _copy._write_buffer = []
+        _copy._write_buffer_nbytes = 0
+
+        memodict[id(_copy)] = _copy
+
+        return _copy
+
+    def finalize(self):
+        if self.is_subtable:
+            return
+        self.flush()
+        self._write_index()
+        self._write_private_index()
+
+    def flush(self):
+        """
+        Appends the buffered data to the table.
+        """
+        if len(self._write_buffer) == 0:
+            return
+
+        table = self.get_table()
+
+        if len(self._write_buffer) == 1:
+            table.append(self._write_buffer[0])
+        else:
+            table.append(np.concatenate(self._write_buffer))
+
+        table.flush()
+
+        self._clear_write_buffer()
+
+    @property
+    def write_buffer_nbytes(self):
+        return self._write_buffer_nbytes
+
+    def write_checkpoint(self, root='/PRIVATE/CHECKPOINT'):
+        """
+        Saves the ingest state (domain count, row count and the private index not written yet) under root so that
+        an interrupted ingest can continue from here with read_checkpoint.
+        """
+        if self.is_subtable:
+            return
+
+        h5f = self.h5f
+
+        path = root + self.path()
+
+        try:
+            h5f.remove_node(path, recursive=True)
+        except tables.NoSuchNodeError:
+            pass
+
+        self.flush()
+
+        table = self.get_table()
+        table.flush()
+
+        state = np.array([self.domain_count, self._index_offset, table.nrows], dtype='<i8')
+
+        subcase_index = np.array(self._subcase_index, dtype='<i8').reshape((-1, 3))
+
+        index_data, index_indices = self._concatenate_index_data()
+
+        index_data = np.column_stack([index_data['ID'], index_data['LENGTH']])
+        index_indices = index_indices['INDEX']
+
+        index_data_len = np.array([_[0].shape[0] for _ in self._index_data], dtype='<i8')
+
+        h5f.create_array(path, 'STATE', obj=state, title='Checkpoint State', createparents=True)
+        h5f.create_array(path, 'SUBCASE_INDEX', obj=subcase_index, title='Checkpoint Subcase Index')
+        h5f.create_array(path, 'INDEX_DATA', obj=index_data, title='Checkpoint Index Data')
+        h5f.create_array(path, 'INDEX_DATA_LEN', obj=index_data_len, title='Checkpoint Index Data Lengths')
+        h5f.create_array(path, 'INDEX_INDICES', obj=index_indices, title='Checkpoint Index Indices')
+
+    def read_checkpoint(self):
+        """
+        Restores the state saved by write_checkpoint and removes rows written after it.  Returns False if there is
+        no checkpoint, in which case any rows already in the table are removed.
+        """
+        if self.is_subtable:
+            return False
+
+        h5f = self.h5f
+
+        # index may have been partially written when the ingest stopped
+        for path in ('/INDEX' + self.path(), self._private_index_path):
+            try:
+                h5f.remove_node(path, recursive=True)
+            except tables.NoSuchNodeError:
+                pass
+
+        self._index_table = None
+        self._clear_index_cache()
+
+        try:
+            group = h5f.get_node(self._checkpoint_path)
+        except tables.NoSuchNodeError:
+            group = None
+
+        self._clear_write_buffer()
+
+        if group is None:
+            try:
+                h5f.get_node(self.path()).truncate(0)
+            except tables.NoSuchNodeError:
+                pass
+            return False
+
+        domain_count, index_offset, row_count = group.STATE.read()
+
+        self.get_table().truncate(row_count)
+
+        self.domain_count = int(domain_count)
+        self._index_offset = int(index_offset)
+
+        del self._subcase_index[:]
+        self._subcase_index.extend(tuple(_) for _ in group.SUBCASE_INDEX.read().tolist())
+
+        _index_data = group.INDEX_DATA.read().reshape((-1, 2))
+        index_data_len = group.INDEX_DATA_LEN.read()
+        index_indices = group.INDEX_INDICES.read()
+
+        index_data = np.empty(_index_data.shape[0], dtype=private_index_data_format_dtype)
+        index_data['ID'] = _index_data[:, 0]
+        index_data['LENGTH'] = _index_data[:, 1]
+
+        self._clear_index_data()
+
+        layout_start = 0
+        indices_start = 0
+
+        for length in index_data_len.tolist():
+            data = index_data[layout_start: layout_start + length]
+            indices_len = int(data['LENGTH'].sum())
+            indices = index_indices[indices_start: indices_start + indices_len].astype(
+                private_index_indices_format_dtype)
+            data['POSITION'] = np.cumsum(data['LENGTH']) - data['LENGTH']
+            self._add_index_data(data, indices)
+            layout_start += length
+            indices_start += indices_len
+
+        return True
+
+    def get_table(self):
+        if self.table is None:
+            if self.expected_rows:
+                self.table = self._make_table(self.expected_rows)
+            else:
+                self.table = self._make_table()
+        return self.table
+
+    def not_implemented(self):
+        self.implemented = False
+
+    def read(self, indices, columns=None):
+        """
+        Reads the rows at indices.  If columns is given, only those fields are returned.
+        """
+        table = self.get_table()
+
+        indices = np.array(indices, dtype='i8')
+
+        if np.all(indices[1:] > indices[:-1]):
+            return self._read_sorted(indices, columns)
+
+        data = np.empty(len(indices), dtype=table._v_dtype)
+        table._read_elements(indices, data)
+
+        if columns is None:
+            return data
+
+        columns = _get_columns(columns)
+
+        result = np.empty(len(indices), dtype=_columns_dtype(table, columns))
+        _copy_columns(result, data, columns)
+
+        return result
+
+    def _read_sorted(self, indices, columns=None, min_run=16):
+        """
+        Reads the rows at the sorted, unique indices.  Contiguous runs of at least min_run rows are read as slices,
+        the remaining rows are read together by coordinates.  Whole rows are read once per run and the fields of
+        columns copied from them, pytables would read the rows again for each field.
+        """
+        table = self.get_table()
+
+        if columns is None:
+            data = np.empty(indices.shape[0], dtype=table._v_dtype)
+        else:
+            columns = _get_columns(columns)
+            data = np.empty(indices.shape[0], dtype=_columns_dtype(table, columns))
+
+        if indices.shape[0] == 0:
+            return data
+
+        run_starts = np.flatnonzero(np.diff(indices) != 1) + 1
+        run_starts = np.concatenate([[0], run_starts])
+        run_stops = np.concatenate([run_starts[1:], [indices.shape[0]]])
+
+        long_runs = (run_stops - run_starts) >= min_run
+
+        for start, stop in zip(run_starts[long_runs].tolist(), run_stops[long_runs].tolist()):
+            if columns is None:
+                table.read(indices[start], indices[stop - 1] + 1, out=data[start: stop])
+            else:
+                _copy_columns(data[start: stop], table.read(indices[start], indices[stop - 1] + 1), columns)
+
+        short_runs = ~long_runs
+
+        if np.any(short_runs):
+            short = _expand_ranges(run_starts[short_runs], run_stops[short_runs] - run_starts[short_runs])
+            _data = np.empty(short.shape[0], dtype=table._v_dtype)
+            table._read_elements(indices[short], _data)
+            if columns is None:
+                data[short] = _data
+            else:
+                _copy_columns(data, _data, columns, short)
+
+        return data
+
+    def read_domain(self, domain_id, columns=None):
+        """
+        Reads all the rows of domain_id.  If columns is given, only those fields are read and returned.
+        """
+        return self.read_domains([domain_id], columns)
+
+    def read_domains(self, domain_ids, columns=None):
+        """
+        Reads all the rows of domain_ids, in the order of domain_ids.  Domains that don't exist are skipped.
+        If columns is given, only those fields are read and returned.
+        """
+        index_table = self._get_index_table()
+
+        domain_ids = np.asarray(domain_ids, dtype='<i8').ravel()
+
+        i = np.searchsorted(index_table['DOMAIN_ID'], domain_ids)
+        valid = i < index_table.shape[0]
+        i = i[valid][index_table['DOMAIN_ID'][i[valid]] == domain_ids[valid]]
+
+        starts = index_table['POSITION'][i]
+        stops = starts + index_table['LENGTH'][i]
+
+        table = self.get_table()
+
+        if columns is None:
+            data = np.empty(int((stops - starts).sum()), dtype=table._v_dtype)
+        else:
+            columns = _get_columns(columns)
+            data = np.empty(int((stops - starts).sum()), dtype=_columns_dtype(table, columns))
+
+        if i.shape[0] == 0:
+            return data
+
+        # the rows of a domain are contiguous, domains that follow each other in the table are read as one slice
+        first = np.concatenate([[0], np.flatnonzero(starts[1:] != stops[:-1]) + 1])
+        last = np.concatenate([first[1:] - 1, [i.shape[0] - 1]])
+
+        position = 0
+
+        for start, stop in zip(starts[first].tolist(), stops[last].tolist()):
+            if columns is None:
+                table.read(start, stop, out=data[position: position + stop - start])
+            else:
+                _copy_columns(data[position: position + stop - start], table.read(start, stop), columns)
+            position += stop - start
+
+        return data
+
+    def search(self, domains, data_ids, filter=None, columns=None):
+        """
+        Returns the rows of data_ids in domains.  filter is a dict of field: values, only rows with any field in
+        its values are returned.  If columns is given, only those fields are read and returned.
+        """
+        identity = self._get_private_index_table()[0]
+
+        data_ids = np.unique(np.asarray(data_ids, dtype='<i8'))
+
+        domains = np.unique(np.asarray(domains, dtype='<i8'))
+        domains = domains[(domains > 0) & (domains <= identity.nrows)]
+
+        identity = identity.read_coordinates(domains - 1)
+
+        # domains with the same layout share the search of the layout
+        layouts, inverse = np.unique(np.column_stack([identity['LOCATION'], identity['LENGTH']]).reshape((-1, 2)),
+                                     axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+
+        indices = []
+
+        for i, (location, length) in enumerate(layouts.tolist()):
+
+            ids, positions, lengths, layout_indices = self._get_index_layout(location, length)
+
+            found = np.searchsorted(ids, data_ids)
+            valid = found < length
+            found = found[valid][ids[found[valid]] == data_ids[valid]]
+
+            _indices = layout_indices[_expand_ranges(positions[found], lengths[found])]
+
+            offsets = identity['OFFSET'][inverse == i]
+
+            indices.append((offsets[:, None] + _indices[None, :]).ravel())
+
+        if len(indices) > 0:
+            indices = np.sort(np.concatenate(indices))
+        else:
+            indices = np.empty(0, dtype='<i8')
+
+        if columns is not None:
+            columns = _get_columns(columns)
+
+            # filter fields are needed even if they aren't returned
+            _columns = list(columns)
+            if filter is not None:
+                _columns.extend(key for key in filter.keys() if key not in _columns)
+        else:
+            _columns = None
+
+        results = self._read_sorted(indices, _columns)
+
+        if filter is not None:
+            mask = np.zeros(results.shape[0], dtype=bool)
+            for key in filter.keys():
+                mask |= np.isin(results[key], list(filter[key]))
+            results = results[mask]
+
+        if columns is not None and len(_columns) > len(columns):
+            _results = np.empty(results.shape[0], dtype=_columns_dtype(self.get_table(), columns))
+            for column in columns:
+                _results[column] = results[column]
+            results = _results
+
+        return results
+
+    def path(self):
+        return self.group + '/' + self.table_id
+
+    def set_h5f(self, h5f):
+        self.h5f = h5f
+        for subtable in self.subtables:
+            subtable.set_h5f(h5f)
+
+    def set_index_cache(self, index_cache):
+        self.index_cache = index_cache
+
+    def set_write_buffers(self, write_buffers):
+        self.write_buffers = write_buffers
+        for subtable in self.subtables:
+            subtable.set_write_buffers(write_buffers)
+
+    def to_numpy(self, data):
+        if not isinstance(data, np.ndarray):
+            data = _rows_to_tokens(data)
+
+        if self.validator is _validator and self._get_gather_plan() is not None:
+            result = self._tokens_to_numpy(data)
+        else:
+            result = self._rows_to_numpy(data.tolist())
+
+        if self.array_validator is not None:
+            result = self.array_validator(result)
+
+        return result
+
+    def _rows_to_numpy(self, data):
+        # validators work on python lists of fields
+
+        result = np.empty(len(data), dtype=self.dtype)
+
+        validator = self.validator
+
+        names = list(self.dtype.names)
+
+        _result = {name: result[name] for name in names}
+
+        for i in range(len(data)):
+            _data = validator(self.indices.get_data(data[i]))
+            _data.append(self.domain_count)
+
+            for j in range(len(names)):
+                _result[names[j]][i] = _data[j]
+
+        return result
+
+    def _get_gather_plan(self):
+        if self._gather_plan is None:
+            plan = self.indices.compile()
+            if plan is None:
+                self._gather_plan = False
+            else:
+                names = self.dtype.names
+                self._gather_plan = [(names[j], plan[j], self.dtype[names[j]].base) for j in range(len(plan))]
+
+        if self._gather_plan is False:
+            return None
+
+        return self._gather_plan
+
+    def _tokens_to_numpy(self, tokens):
+        result = np.empty(tokens.shape[0], dtype=self.dtype)
+
+        for name, columns, dtype in self._get_gather_plan():
+            if isinstance(columns, DefinedValue):
+                result[name] = columns.value
+            else:
+                result[name] = convert_tokens(tokens[:, columns], dtype)
+
+        result['DOMAIN_ID'] = self.domain_count
+
+        return result
+
+    def write_data(self, data):
+        data = self.convert_data(data)
+
+        if data is not None:
+            self.append_data(data)
+
+    def convert_data(self, data):
+        """
+        Converts the punch table data to the table dtype and records its index, without writing it.
+        Returns None if there is no data.
+        """
+        assert isinstance(data, PunchTableData)
+
+        if len(data.data) == 0:
+            return None
+
+        if self.title is None:
+            self.title = self.results_type
+
+        self.domain_count += 1
+
+        if isinstance(data.data, np.ndarray) and data.data.dtype == self.dtype:
+            # already converted by a read_multiprocess worker, only the domain is set here
+            data = data.data
+            data['DOMAIN_ID'] = self.domain_count
+        else:
+            data = self.to_numpy(data.data)
+
+        self._record_data_indices(data)
+
+        return data
+
+    def append_data(self, data):
+        """
+        Appends data converted by convert_data to the table.
+        """
+        self._write_buffer.append(data)
+        self._write_buffer_nbytes += data.nbytes
+
+        if self.write_buffers is not None:
+            self.write_buffers.add(self, data.nbytes)
+
+    def _get_index_table(self):
+        if self.is_subtable:
+            return None
+        h5f = self.h5f
+        if self._index_table is None:
+            self._index_table = h5f.get_node('/INDEX%s' % self.path()).read()
+
+        return self._index_table
+
+    def _get_private_index_table(self):
+        if self.is_subtable:
+            return None
+        h5f = self.h5f
+        if self._private_index_table is None:
+            if self._is_legacy_private_index():
+                # written by h5Nastran < 0.2.0, decoded in memory so that read only files can be searched
+                self._private_index_table = tuple(
+                    _PrivateIndexArray(_) for _ in decode_legacy_private_index(
+                        h5f.get_node(self._private_index_path + '/IDENTITY').read(),
+                        h5f.get_node(self._private_index_path + '/DATA').read()
+                    )
+                )
+            else:
+                self._private_index_table = (
+                    h5f.get_node(self._private_index_path + '/IDENTITY'),
+                    h5f.get_node(self._private_index_path + '/DATA'),
+                    h5f.get_node(self._private_index_path + '/INDICES')
+                )
+
+        return self._private_index_table
+
+    def _is_legacy_private_index(self):
+        """
+        Returns True if the private index was written by h5Nastran < 0.2.0, where DATA holds the layouts serialized
+        as [id, len, i0, i1, ...] and there is no INDICES table.
+        """
+        path = self._private_index_path
+        return path + '/IDENTITY' in self.h5f and path + '/INDICES' not in self.h5f
+
+    def _upgrade_private_index(self):
+        """
+        Rewrites a private index written by h5Nastran < 0.2.0 in the current format, so that new domains can be
+        appended to it.
+        """
+        h5f = self.h5f
+        path = self._private_index_path
+
+        identity, data, indices = decode_legacy_private_index(h5f.get_node(path + '/IDENTITY').read(),
+                                                              h5f.get_node(path + '/DATA').read())
+
+        h5f.remove_node(path, recursive=True)
+
+        h5f.create_table(path, 'IDENTITY', self.PrivateIndexFormat, 'Private Index',
+                         expectedrows=identity.shape[0], createparents=True).append(identity)
+        h5f.create_table(path, 'DATA', self.PrivateIndexDataFormat, 'Private Index Data',
+                         expectedrows=data.shape[0]).append(data)
+        h5f.create_table(path, 'INDICES', self.PrivateIndexIndicesFormat, 'Private Index Indices',
+                         expectedrows=indices.shape[0]).append(indices)
+
+        h5f.flush()
+
+        self._clear_index_cache()
+
+    def _get_index_layout(self, location, length):
+        """
+        Returns the sorted ids of the layout at location in the private index, the position and number of rows of
+        each id in indices, and indices, the rows of each id.  Layouts are only read when needed and are kept in
+        the index cache.
+        """
+        key = (self.path(), location, length)
+
+        index_cache = self.index_cache
+
+        if index_cache is not None:
+            layout = index_cache.get(key)
+            if layout is not None:
+                return layout
+
+        identity, data, indices = self._get_private_index_table()
+
+        data = data.read(location, location + length)
+
+        if length > 0:
+            start = int(data['POSITION'][0])
+            stop = int(data['POSITION'][-1] + data['LENGTH'][-1])
+        else:
+            start = stop = 0
+
+        layout = (data['ID'], data['POSITION'] - start, data['LENGTH'], indices.read(start, stop)['INDEX'])
+
+        if index_cache is not None:
+            index_cache.put(key, layout, sum(_.nbytes for _ in layout))
+
+        return layout
+
+    def _clear_index_cache(self):
+        self._private_index_table = None
+        if self.index_cache is not None:
+            self.index_cache.clear(self.path())
+
+    def _get_private_index_tables(self):
+        if self.is_subtable:
+            return None, None, None
+        h5f = self.h5f
+        if self._is_legacy_private_index():
+            self._upgrade_private_index()
+        try:
+            identity = h5f.get_node(self._private_index_path + '/IDENTITY')
+        except tables.NoSuchNodeError:
+            identity = h5f.create_table(self._private_index_path, 'IDENTITY', self.PrivateIndexFormat, 'Private Index',
+                                        expectedrows=len(self._subcase_index), createparents=True)
+        try:
+            data = h5f.get_node(self._private_index_path + '/DATA')
+        except tables.NoSuchNodeError:
+            data = h5f.create_table(self._private_index_path, 'DATA', self.PrivateIndexDataFormat, 'Private Index Data',
+                                    expectedrows=self._index_data_size, createparents=True)
+        try:
+            indices = h5f.get_node(self._private_index_path + '/INDICES')
+        except tables.NoSuchNodeError:
+            indices = h5f.create_table(self._private_index_path, 'INDICES', self.PrivateIndexIndicesFormat,
+                                       'Private Index Indices', expectedrows=self._index_offset, createparents=True)
+
+        return identity, data, indices
+
+    def _make_table(self, expected_rows=100000):
+        if self.implemented is False:
+            return None
+        try:
+            return self.h5f.get_node(self.path())
+        except tables.NoSuchNodeError:
+            try:
+                title = self.title if self.title is not None else self.results_type
+                self.h5f.create_table(self.group, self.table_id, self.Format, title,
+                                        expectedrows=expected_rows, chunkshape=self.chunkshape, createparents=True)
+            except tables.FileModeError:
+                return None
+            return self.h5f.get_node(self.path())
+
+    @property
+    def _private_index_path(self):
+        return '/PRIVATE/INDEX' + self.path()
+
+    @property
+    def _checkpoint_path(self):
+        # see H5Nastran._write_punch_checkpoint
+        return '/PRIVATE/CHECKPOINT' + self.path()
+
+    def _record_data_indices(self, data):
+        if self.is_subtable:
+            return
+
+        index_data, index_indices = index_layout(data[self.index_id][:])
+
+        location = self._add_index_data(index_data, index_indices)
+
+        self._subcase_index.append((location, index_data.shape[0], self._index_offset))
+
+        self._index_offset += data.shape[0]
+
+    def _add_index_data(self, index_data, index_indices):
+        """
+        Returns the location of the layout in the private index data, only adding it if the same layout hasn't
+        been added already.  Layouts are looked up by hash and only compared to layouts with the same hash.
+        """
+        key = hash(index_data.tobytes() + index_indices.tobytes())
+
+        locations = self._index_data_lookup.setdefault(key, [])
+
+        for location, (_index_data, _index_indices) in locations:
+            if (_index_data.shape == index_data.shape and _index_indices.shape == index_indices.shape and
+                    np.array_equal(_index_data, index_data) and np.array_equal(_index_indices, index_indices)):
+                return location
+
+        location = self._index_data_size
+
+        self._index_data.append((index_data, index_indices))
+        locations.append((location, (index_data, index_indices)))
+        self._index_data_size += index_data.shape[0]
+
+        return location
+
+    def _concatenate_index_data(self, position=0):
+        """
+        Returns the DATA and INDICES rows of the distinct layouts, POSITION starting at position.
+        """
+        if len(self._index_data) == 0:
+            return (np.empty(0, dtype=private_index_data_format_dtype),
+                    np.empty(0, dtype=private_index_indices_format_dtype))
+
+        index_data = np.concatenate([_[0] for _ in self._index_data])
+        index_indices = np.concatenate([_[1] for _ in self._index_data])
+
+        index_data['POSITION'] = np.cumsum(index_data['LENGTH']) - index_data['LENGTH'] + position
+
+        return index_data, index_indices
+
+    def _clear_write_buffer(self):
+        if self.write_buffers is not None:
+            self.write_buffers.remove(self, self._write_buffer_nbytes)
+
+        del self._write_buffer[:]
+        self._write_buffer_nbytes = 0
+
+    def _clear_index_data(self):
+        del self._index_data[:]
+        self._index_data_lookup = {}
+        self._index_data_size = 0
+
+    def _write_index(self):
+        if self.is_subtable:
+            return
+
+        table = self.get_table()
+
+        # noinspection PyProtectedMember
+        domain_id = table.cols._f_col('DOMAIN_ID')[:]
+
+        unique, counts = np.unique(domain_id, return_counts=True)
+
+        domains = self.h5f.create_table('/INDEX' + self.group, self.table_id, self.IndexFormat, self.results_type,
+                                   expectedrows=unique.shape[0], createparents=True)
+
+        index = np.empty(unique.shape[0], dtype=domains.dtype)
+        index['DOMAIN_ID'] = unique
+        index['POSITION'] = np.cumsum(counts) - counts
+        index['LENGTH'] = counts
+
+        domains.append(index)
+
+        domains.flush()
+
+        self._index_table = None
+
+    def _write_private_index(self):
+        if self.is_subtable:
+            return
+
+        identity, data, indices = self._get_private_index_tables()
+
+        subcase_index = np.array(self._subcase_index, dtype=private_index_format_dtype)
+        subcase_index['LOCATION'] += data.nrows
+
+        index_data, index_indices = self._concatenate_index_data(indices.nrows)
+
+        identity.append(subcase_index)
+        data.append(index_data)
+        indices.append(index_indices)
+
+        self.h5f.flush()
+
+        self._clear_index_cache()
+
+        del self._subcase_index[:]
+        self._clear_index_data()
+
+########################################################################################################################
+
+
+def index_layout(data):
+    """
+    Returns the private index layout of the ids in data: the sorted distinct ids with the position and number of
+    their rows in indices, and indices, the rows of each id.
+    """
+    ids, inverse, counts = np.unique(data, return_inverse=True, return_counts=True)
+
+    index_data = np.empty(ids.shape[0], dtype=private_index_data_format_dtype)
+    index_data['ID'] = ids
+    index_data['POSITION'] = np.cumsum(counts) - counts
+    index_data['LENGTH'] = counts
+
+    index_indices = np.empty(inverse.size, dtype=private_index_indices_format_dtype)
+    index_indices['INDEX'] = np.argsort(inverse.ravel(), kind='stable')
+
+    return index_data, index_indices
+
+
+def decode_legacy_private_index(identity, data):
+    """
+    Returns the IDENTITY, DATA and INDICES rows of a private index written by h5Nastran < 0.2.0.  identity and data
+    are the old IDENTITY and DATA tables, LOCATION and LENGTH of identity point to the serialized layouts in data.
+    """
+    identity = identity.copy()
+    serialized = data['ID']
+
+    index_data = []
+    index_indices = []
+    layouts = {}
+    data_size = 0
+    indices_size = 0
+
+    for i in range(identity.shape[0]):
+        key = (int(identity['LOCATION'][i]), int(identity['LENGTH'][i]))
+
+        try:
+            location, length = layouts[key]
+        except KeyError:
+            _index_data, _index_indices = _decode_legacy_layout(serialized[key[0]: key[0] + key[1]])
+            _index_data['POSITION'] += indices_size
+
+            index_data.append(_index_data)
+            index_indices.append(_index_indices)
+
+            location, length = layouts[key] = data_size, _index_data.shape[0]
+
+            data_size += _index_data.shape[0]
+            indices_size += _index_indices.shape[0]
+
+        identity['LOCATION'][i] = location
+        identity['LENGTH'][i] = length
+
+    if len(index_data) == 0:
+        return (identity, np.empty(0, dtype=private_index_data_format_dtype),
+                np.empty(0, dtype=private_index_indices_format_dtype))
+
+    return identity, np.concatenate(index_data), np.concatenate(index_indices)
+
+
+def _decode_legacy_layout(serialized):
+    ids = []
+    rows = []
+
+    i = 0
+    while i < serialized.shape[0]:
+        length = serialized[i + 1]
+        ids.append(np.full(length, serialized[i], dtype='<i8'))
+        rows.append(serialized[i + 2: i + 2 + length])
+        i += 2 + length
+
+    if len(ids) == 0:
+        return index_layout(np.empty(0, dtype='<i8'))
+
+    rows = np.concatenate(rows)
+
+    data_ids = np.empty(rows.shape[0], dtype='<i8')
+    data_ids[rows] = np.concatenate(ids)
+
+    return index_layout(data_ids)
+
+
+class _PrivateIndexArray(object):
+    # in memory stand in for the private index tables, see TableDef._get_private_index_table
+    def __init__(self, data):
+        self.data = data
+        self.nrows = data.shape[0]
+
+    def read(self, start=None, stop=None):
+        return self.data[start:stop]
+
+    def read_coordinates(self, coords):
+        return self.data[coords]
+
+
+def _get_columns(columns):
+    if isinstance(columns, string_types):
+        return [columns]
+    return list(columns)
+
+
+def _columns_dtype(table, columns):
+    dtype = table.dtype
+    return np.dtype([(column, dtype[column]) for column in columns])
+
+
+def _copy_columns(data, rows, columns, indices=None):
+    # copies the fields of columns of rows to data, or to data[indices]
+    for column in columns:
+        if indices is None:
+            data[column] = rows[column]
+        else:
+            data[column][indices] = rows[column]
+
+
+def _expand_ranges(starts, lengths):
+    # concatenation of range(start, start + length) for each start, length
+    lengths = np.asarray(lengths, dtype='<i8')
+    total = int(lengths.sum())
+
+    if total == 0:
+        return np.empty(0, dtype='<i8')
+
+    ends = np.cumsum(lengths)
+    steps = np.ones(total, dtype='<i8')
+
+    nonzero = lengths > 0
+    _starts = np.asarray(starts, dtype='<i8')[nonzero]
+    _ends = ends[nonzero]
+
+    steps[0] = _starts[0]
+    steps[_ends[:-1]] = _starts[1:] - (_starts[:-1] + lengths[nonzero][:-1] - 1)
+
+    return np.cumsum(steps)
+
+
+########################################################################################################################
+
+
+class TableData(object):
+    def __init__(self, data=None, subdata_len=None, subdata=None):
+
+        if data is None:
+            data = []
+
+        if subdata_len is None:
+            subdata_len = np.zeros((1, 1))
+
+        if subdata is None:
+            subdata = []
+
+        self.data = data
+        self.subdata_len = subdata_len  # type: np.ndarray
+        self.subdata = subdata  # type: list[TableData]
+
+    def __repr__(self):
+        result = [str(self.data)]
+        for subdata in self.subdata:
+            result.append(subdata.__repr__())
+        return ';'.join(result)
+
+    def validate(self):
+        if len(self.subdata) > 0:
+            shape = self.subdata_len.shape
+            assert shape[0] == len(self.data), (shape[0], len(self.data))
+            assert shape[1] == len(self.subdata), (shape[1], len(self.subdata))
+        for subdata in self.subdata:
+            subdata.validate()
+
+
+class ResultTable(object):
+    result_type = ''
+    table_def = None  # type: TableDef
+
+    def __init__(self, h5n, parent):
+        self._h5n = h5n
+        self._parent = parent
+        self._table_def = deepcopy(self.table_def)
+        self._table_def.set_h5f(self._h5n.h5f)
+        self._table_def.set_index_cache(self._h5n.index_cache)
+        self._table_def.set_write_buffers(self._h5n.write_buffers)
+
+        if self.result_type is not None:
+            self._h5n.register_result_table(self)
+
+    def write_data(self, data):
+        self._table_def.write_data(data)
+
+    def finalize(self):
+        self._table_def.finalize()
+
+    def write_checkpoint(self, root='/PRIVATE/CHECKPOINT'):
+        self._table_def.write_checkpoint(root)
+
+    def read_checkpoint(self):
+        return self._table_def.read_checkpoint()
+
+    def read(self, indices, columns=None):
+        return self._table_def.read(indices, columns)
+
+    def read_domain(self, domain_id, columns=None):
+        return self._table_def.read_domain(domain_id, columns)
+
+    def read_domains(self, domain_ids, columns=None):
+        return self._table_def.read_domains(domain_ids, columns)
+
+    def search(self, domains, data_ids, filter=None, columns=None):
+        return self._table_def.search(domains, data_ids, filter, columns)
+
+    @property
+    def expected_rows(self):
+        return self._table_def.expected_rows
+
+    @expected_rows.setter
+    def expected_rows(self, value):
+        self._table_def.expected_rows = value
+
+    @property
+    def chunkshape(self):
+        return self._table_def.chunkshape
+
+    @chunkshape.setter
+    def chunkshape(self, value):
+        self._table_def.chunkshape = value
+
+    @property
+    def results_type(self):
+        return self._table_def.results_type
+
+    @results_type.setter
+    def results_type(self, value):
+        self._table_def.results_type = value
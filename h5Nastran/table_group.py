@@ -0,0 +1,72 @@
+from __future__ import print_function, absolute_import
+from six import iteritems
+
+from collections import OrderedDict
+
+
+class TableGroup(object):
+    """
+    Group of card or result tables.  Tables are added by class with _add_table and are only created when first
+    accessed, either as an attribute of the group or by H5Nastran when an ingest needs the card or result type.
+    """
+
+    def __init__(self, h5n):
+        self._h5n = h5n
+        self._table_classes = OrderedDict()
+
+    def _add_table(self, name, table_class):
+        self._table_classes[name] = table_class
+        self._h5n.register_table_class(table_class, self, name)
+
+    def __getattr__(self, item):
+        # only called for attributes that don't exist yet
+        try:
+            table_class = self.__dict__['_table_classes'][item]
+        except KeyError:
+            raise AttributeError('Attribute %s not found on %s.' % (item, self.__class__.__name__))
+
+        table = table_class(self._h5n, self)
+        setattr(self, item, table)
+
+        return table
+
+    def read(self):
+        for name in self._table_classes:
+            getattr(self, name)
+
+        for key, item in list(iteritems(self.__dict__)):
+            if key.startswith('_'):
+                continue
+            try:
+                item.read()
+            except AttributeError:
+                pass
+
+
+class LazyTableDef(object):
+    """
+    table_def class attribute of the card and result tables.  The table definition is only created when it is first
+    used, so that importing h5Nastran doesn't read the schema.  Lazy subtables are created with their table.
+    """
+
+    def __init__(self, create, args, kwargs):
+        self._create = create
+        self._args = args
+        self._kwargs = kwargs
+        self._table_def = None
+
+    def get(self):
+        if self._table_def is None:
+            kwargs = dict(self._kwargs)
+
+            subtables = kwargs.get('subtables', None)
+
+            if subtables is not None:
+                kwargs['subtables'] = [_.get() if isinstance(_, LazyTableDef) else _ for _ in subtables]
+
+            self._table_def = self._create(*self._args, **kwargs)
+
+        return self._table_def
+
+    def __get__(self, obj, cls):
+        return self.get()
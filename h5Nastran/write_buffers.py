@@ -0,0 +1,34 @@
+from __future__ import print_function, absolute_import
+
+
+class WriteBuffers(object):
+    """
+    Byte count of the converted results buffered by the result tables of a file.  Once max_bytes are buffered in
+    total, the tables with the largest buffers are flushed until less than half of max_bytes are left, so that many
+    small tables are appended in large batches without holding more than max_bytes.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+
+        self._tables = {}  # id: table with buffered data
+
+    def add(self, table, nbytes):
+        self._tables[id(table)] = table
+        self.nbytes += nbytes
+
+        if self.nbytes >= self.max_bytes:
+            self.flush_largest()
+
+    def remove(self, table, nbytes):
+        self._tables.pop(id(table), None)
+        self.nbytes -= nbytes
+
+    def flush_largest(self):
+        tables = sorted(self._tables.values(), key=lambda _: _.write_buffer_nbytes, reverse=True)
+
+        for table in tables:
+            if self.nbytes < self.max_bytes // 2:
+                break
+            table.flush()
@@ -0,0 +1,178 @@
+from __future__ import print_function, absolute_import
+
+import os
+import sys
+
+import numpy as np
+import tables
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+########################################################################################################################
+# small generated model, a plate of CQUAD4 and CTRIA3 with a few bars, springs and masses
+
+
+def _field(value):
+    value = '%-8s' % value
+    assert len(value) == 8, value
+    return value
+
+
+def _card(*fields):
+    return ''.join(_field(_) for _ in fields).rstrip()
+
+
+def model_bdf_lines(ngrid=60):
+    """
+    Returns the bulk data cards of the model, without the executive and case control decks.
+    """
+    lines = [_card('CORD2R', 5, '', '0.', '0.', '0.', '0.', '0.', '1.'), _card('', '1.', '0.', '0.')]
+
+    for i in range(1, ngrid + 1):
+        lines.append(_card('GRID', i, '', '%.1f' % (i % 10), '%.1f' % (i // 10), '0.'))
+
+    for i in range(1, ngrid - 10):
+        if i % 10 == 0:
+            continue
+        if i % 3 == 0:
+            lines.append(_card('CTRIA3', 1000 + i, 1, i, i + 1, i + 11))
+        else:
+            lines.append(_card('CQUAD4', 1000 + i, 1, i, i + 1, i + 11, i + 10))
+
+    lines.append(_card('CBAR', 5001, 2, 1, 2, '0.', '0.', '1.'))
+    lines.append(_card('CBAR', 5002, 2, 2, 3, '0.', '0.', '1.'))
+    lines.append(_card('CBUSH', 6001, 3, 4, 5, '', '', '', 0))
+    lines.append(_card('CONM2', 7001, 6, '', '2.5'))
+    lines.append(_card('PSHELL', 1, 1, '0.1', 1, '', 1))
+    lines.append(_card('PBAR', 2, 1, '1.', '1.', '1.', '1.'))
+    lines.append(_card('PBUSH', 3, 'K', '1.', '1.', '1.'))
+    lines.append(_card('MAT1', 1, '1.e7', '', '0.3'))
+    lines.append(_card('FORCE', 1, 5, 0, '1.', '0.', '0.', '1.'))
+    lines.append(_card('MOMENT', 1, 6, 5, '1.', '0.', '1.', '0.'))
+    lines.append(_card('SPC1', 1, 123456, 1, 2))
+
+    return lines
+
+
+def write_model_bdf(filename, ngrid=60):
+    lines = ['SOL 101', 'CEND', 'SUBCASE 1', '  LOAD = 1', '  SPC = 1', 'BEGIN BULK']
+    lines.extend(model_bdf_lines(ngrid))
+    lines.append('ENDDATA')
+
+    with open(filename, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def model_punch_lines(ngrid=60, subcases=3):
+    lines = []
+
+    def add(line):
+        lines.append(line[:72].ljust(72) + '%8d' % (len(lines) + 1))
+
+    def real(value):
+        return '%18s' % ('%.6E' % value)
+
+    def header(results_type, subcase, element_type=None):
+        add('$TITLE   = GENERATED MODEL')
+        add('$SUBTITLE=')
+        add('$LABEL   =')
+        add('$' + results_type)
+        add('$REAL OUTPUT')
+        add('$SUBCASE ID = %11d' % subcase)
+        if element_type is not None:
+            add('$ELEMENT TYPE = %12s  %s' % element_type)
+
+    quads = [1000 + i for i in range(1, ngrid - 10) if i % 10 != 0 and i % 3 != 0]
+
+    for subcase in range(1, subcases + 1):
+        header('DISPLACEMENTS', subcase)
+        for nid in range(1, ngrid + 1):
+            add('%10d%8s' % (nid, 'G') + real(nid * 0.1) + real(-nid) + real(subcase))
+            add('-CONT-' + ' ' * 12 + real(0.5) + real(0.25 * subcase) + real(nid + subcase))
+
+        header('ELEMENT FORCES', subcase, ('33', 'QUAD4'))
+        for eid in quads:
+            add('%10d%8s' % (eid, '') + real(eid) + real(2. * subcase) + real(3.))
+            add('-CONT-' + ' ' * 12 + real(4.) + real(5.) + real(subcase))
+            add('-CONT-' + ' ' * 12 + real(7.) + real(eid % 7))
+
+        header('GRID POINT FORCE BALANCE', subcase)
+        for nid in range(1, 8):
+            for name, eid in (('QUAD4', quads[nid]), ('APP-LOAD', ''), ('F-OF-SPC', ''), ('*TOTALS*', '')):
+                add('%10d%8s' % (nid, '') + '%18s' % eid + '%-18s' % ('        ' + name))
+                add('-CONT-' + ' ' * 12 + real(nid) + real(subcase) + real(4.))
+                add('-CONT-' + ' ' * 12 + real(5.) + real(6.) + real(7.))
+
+        header('SPCF', subcase)
+        for nid in (1, 2):
+            add('%10d%8s' % (nid, 'G') + real(1.) + real(2. * nid) + real(3.))
+            add('-CONT-' + ' ' * 12 + real(4.) + real(5.) + real(subcase))
+
+    return lines
+
+
+def write_model_punch(filename, ngrid=60, subcases=3, newline='\n'):
+    data = (newline.join(model_punch_lines(ngrid, subcases)) + newline).encode()
+
+    # compressed by the extension of filename
+    if filename.endswith('.gz'):
+        import gzip
+        f = gzip.open(filename, 'wb')
+    elif filename.endswith('.bz2'):
+        import bz2
+        f = bz2.BZ2File(filename, 'wb')
+    elif filename.endswith('.xz'):
+        import lzma
+        f = lzma.open(filename, 'wb')
+    else:
+        f = open(filename, 'wb')
+
+    with f:
+        f.write(data)
+
+
+########################################################################################################################
+
+
+def read_h5_tables(filename, skip=()):
+    """
+    Returns a dict of path: data of the tables and arrays of an h5 file, except the nodes under the paths of skip.
+    """
+    h5f = tables.open_file(filename, 'r')
+
+    try:
+        result = {}
+        for node in h5f.walk_nodes('/', 'Leaf'):
+            path = node._v_pathname
+            if any(path == _ or path.startswith(_ + '/') for _ in skip):
+                continue
+            result[path] = node.read()
+        return result
+    finally:
+        h5f.close()
+
+
+def assert_arrays_equal(a, b, name=''):
+    a = np.asarray(a)
+    b = np.asarray(b)
+
+    assert a.dtype == b.dtype, name
+    assert a.shape == b.shape, name
+
+    if a.dtype.names is None:
+        assert np.array_equal(a, b, equal_nan=a.dtype.kind == 'f'), name
+        return
+
+    for field in a.dtype.names:
+        assert_arrays_equal(a[field], b[field], '%s %s' % (name, field))
+
+
+def assert_tables_equal(a, b):
+    assert sorted(a.keys()) == sorted(b.keys())
+
+    for path in sorted(a.keys()):
+        assert_arrays_equal(a[path], b[path], path)
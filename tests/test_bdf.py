@@ -0,0 +1,155 @@
+from __future__ import print_function, absolute_import
+
+import os
+
+import pytest
+from pyNastran.bdf.errors import DuplicateIDsError
+
+from conftest import model_bdf_lines, write_model_bdf, read_h5_tables, assert_tables_equal
+
+from h5Nastran import H5Nastran
+
+
+# the fast reader saves the cards it reads in a different order
+_skip = ('/PRIVATE/NASTRAN/INPUT/BDF_LINES',)
+
+
+def _load(filename, h5filename, **kwargs):
+    db = H5Nastran(h5filename, 'w')
+    db.load_bdf(filename, **kwargs)
+    db.close()
+    return read_h5_tables(h5filename, _skip)
+
+
+def _write_bdf(filename, bulk_lines):
+    with open(filename, 'w') as f:
+        f.write('\n'.join(['SOL 101', 'CEND', 'BEGIN BULK'] + bulk_lines + ['ENDDATA']) + '\n')
+
+
+def test_fast_bdf(tmp_path):
+    filename = str(tmp_path / 'model.bdf')
+    write_model_bdf(filename)
+
+    expected = _load(filename, str(tmp_path / 'default.h5'))
+
+    assert expected['/NASTRAN/INPUT/ELEMENT/CQUAD4'].shape[0] == 30
+
+    assert_tables_equal(expected, _load(filename, str(tmp_path / 'fast.h5'), fast=True))
+
+
+def test_fast_bdf_free_field(tmp_path):
+    lines = [','.join(_[i: i + 8].strip() for i in range(0, len(_), 8)) for _ in model_bdf_lines()]
+
+    filename = str(tmp_path / 'model.bdf')
+    _write_bdf(filename, lines)
+
+    expected = _load(filename, str(tmp_path / 'default.h5'))
+
+    assert_tables_equal(expected, _load(filename, str(tmp_path / 'fast.h5'), fast=True))
+
+
+@pytest.mark.parametrize('cards', [
+    ['CTRIA3,1001,1,1,2,12'],  # same id as a CQUAD4
+    ['CQUAD4,1001,1,2,3,13,12'],  # same id, different card
+    ['CROD,1001,1,1,2', 'PROD,1,1,1.'],  # same id as an element read by pyNastran
+    ['CONM2,7001,7,,1.'],
+    ['GRID,1,,5.,5.,5.'],  # pyNastran asserts on duplicate nodes
+])
+def test_fast_bdf_duplicate_ids(tmp_path, cards):
+    filename = str(tmp_path / 'model.bdf')
+    _write_bdf(filename, model_bdf_lines() + cards)
+
+    db = H5Nastran(str(tmp_path / 'fast.h5'), 'w')
+
+    with pytest.raises(DuplicateIDsError):
+        db.load_bdf(filename, fast=True)
+
+    db.close()
+
+
+def test_fast_bdf_repeated_cards(tmp_path):
+    # cards repeated exactly are only kept once, as pyNastran does
+    lines = model_bdf_lines()
+
+    filename = str(tmp_path / 'model.bdf')
+    _write_bdf(filename, lines + [_ for _ in lines if _.startswith('GRID') or _.startswith('CQUAD4')])
+
+    expected = _load(filename, str(tmp_path / 'default.h5'))
+
+    assert expected['/NASTRAN/INPUT/NODE/GRID'].shape[0] == 60
+
+    assert_tables_equal(expected, _load(filename, str(tmp_path / 'fast.h5'), fast=True))
+
+
+def _write_include_tree(directory, enddata_in_include=False):
+    # main file with the cards split over include files, one of them including another
+    lines = model_bdf_lines()
+
+    grids = [_ for _ in lines if _.startswith('GRID')]
+    elements = [_ for _ in lines if _.startswith('C') and not _.startswith('CORD')]
+    other = [_ for _ in lines if _ not in grids and _ not in elements]
+
+    with open(os.path.join(directory, 'grids.bdf'), 'w') as f:
+        f.write('\n'.join(grids[:30] + ["INCLUDE 'nodes/more_grids.bdf'"]) + '\n')
+
+    os.mkdir(os.path.join(directory, 'nodes'))
+
+    with open(os.path.join(directory, 'nodes', 'more_grids.bdf'), 'w') as f:
+        f.write('\n'.join(grids[30:]) + '\n')
+
+    with open(os.path.join(directory, 'elements.bdf'), 'w') as f:
+        f.write('\n'.join(elements + (['ENDDATA'] if enddata_in_include else [])) + '\n')
+
+    filename = os.path.join(directory, 'main.bdf')
+
+    _write_bdf(filename, other + ["INCLUDE 'grids.bdf'", "INCLUDE 'elements.bdf'"])
+
+    return filename
+
+
+@pytest.mark.parametrize('enddata_in_include', [False, True])
+def test_parallel_bdf(tmp_path, enddata_in_include):
+    filename = _write_include_tree(str(tmp_path), enddata_in_include)
+
+    expected = _load(filename, str(tmp_path / 'default.h5'))
+
+    assert expected['/NASTRAN/INPUT/NODE/GRID'].shape[0] == 60
+    assert expected['/NASTRAN/INPUT/ELEMENT/CQUAD4'].shape[0] == 30
+
+    assert_tables_equal(expected, _load(filename, str(tmp_path / 'fast.h5'), fast=True))
+
+    fast = read_h5_tables(str(tmp_path / 'fast.h5'))
+
+    for processes in (1, 3):
+        h5filename = str(tmp_path / ('parallel_%d.h5' % processes))
+        assert_tables_equal(expected, _load(filename, h5filename, parallel=True, processes=processes))
+        # the deck is saved in the same order as by the serial fast reader
+        assert_tables_equal(fast, read_h5_tables(h5filename))
+
+
+def test_reopened_bdf(tmp_path):
+    from pyNastran.bdf.bdf import BDF
+
+    filename = str(tmp_path / 'model.bdf')
+    _write_bdf(filename, model_bdf_lines() + ['CORD2R,6,5,0.,0.,0.,0.,0.,1.', ',1.,0.,0.'])
+
+    expected = BDF(debug=False)
+    expected.read_bdf(filename)
+
+    h5filename = str(tmp_path / 'model.h5')
+    _load(filename, h5filename)
+
+    db = H5Nastran(h5filename, 'r')
+    bdf = db.load_bdf()
+    db.close()
+
+    # the cards rebuilt from the tables are counted once, the basic coordinate system isn't a card
+    assert bdf.card_count == expected.card_count
+    assert bdf.card_count['CORD2R'] == 2
+
+    for name in ('nodes', 'elements', 'properties', 'materials', 'coords', 'masses'):
+        cards = getattr(bdf, name)
+        _cards = getattr(expected, name)
+        assert sorted(cards.keys()) == sorted(_cards.keys())
+        for key in cards.keys():
+            assert cards[key].raw_fields() == _cards[key].raw_fields()
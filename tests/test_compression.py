@@ -0,0 +1,61 @@
+from __future__ import print_function, absolute_import
+
+import os
+
+import pytest
+import tables
+
+from conftest import write_model_bdf, write_model_punch, read_h5_tables, assert_tables_equal
+
+from h5Nastran import H5Nastran
+
+
+# the profile of the file is saved in the file
+_skip = ('/PRIVATE/h5Nastran/COMPRESSION',)
+
+
+@pytest.fixture(scope='module')
+def model(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp('compression'))
+    write_model_bdf(os.path.join(directory, 'model.bdf'))
+    write_model_punch(os.path.join(directory, 'model.pch'))
+    return directory
+
+
+def _load(directory, name, compression):
+    h5filename = os.path.join(directory, name + '.h5')
+    db = H5Nastran(h5filename, 'w', compression=compression)
+    db.load_bdf(os.path.join(directory, 'model.bdf'))
+    db.load_punch(os.path.join(directory, 'model.pch'))
+    db.close()
+    return h5filename
+
+
+_profiles = {
+    'fast': 'fast',
+    'zstd': 'zstd',
+    'filters': tables.Filters(complib='blosc:lz4', complevel=1),
+    'custom': {'/NASTRAN/RESULT/NODAL': None, '/NASTRAN/INPUT': tables.Filters(complib='zlib', complevel=9)},
+}
+
+
+@pytest.mark.parametrize('name', sorted(_profiles.keys()))
+def test_compression_profiles_identical(model, name):
+    expected = read_h5_tables(_load(model, 'default', 'default'), _skip)
+
+    filename = _load(model, name, _profiles[name])
+
+    assert_tables_equal(expected, read_h5_tables(filename, _skip))
+
+
+def test_compression_profile_filters(model):
+    filename = _load(model, 'fast', 'fast')
+
+    h5f = tables.open_file(filename, 'r')
+
+    try:
+        assert h5f.get_node('/NASTRAN/RESULT/NODAL/DISPLACEMENT').filters.complib == 'blosc:lz4'
+        assert h5f.get_node('/NASTRAN/INPUT/NODE/GRID').filters.complib == 'zlib'
+        assert h5f.get_node('/INDEX/NASTRAN/RESULT/NODAL/DISPLACEMENT').filters.complevel == 0
+    finally:
+        h5f.close()
@@ -0,0 +1,26 @@
+from __future__ import print_function, absolute_import
+
+import subprocess
+import sys
+
+from conftest import ROOT
+
+
+def test_import_builds_no_tables():
+    # table definitions are created on first use, importing h5Nastran doesn't even read the schema
+    code = 'import h5Nastran; from h5Nastran.msc import data_tables; print(len(data_tables._tables), ' \
+           'data_tables._schema is None)'
+    out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT).decode().split()
+    assert out == ['0', 'True']
+
+
+def test_table_def_created_on_use():
+    from h5Nastran.input.node import GRID
+    from h5Nastran.input.element import RBE3
+
+    assert GRID.table_def is GRID.table_def
+    assert GRID.table_def.dtype.names[0] == 'ID'
+
+    wtcg = RBE3.table_def.subtables[1]
+    assert wtcg.table_id == 'WTCG'
+    assert wtcg.subtables[0].table_id == 'G'
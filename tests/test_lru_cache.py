@@ -0,0 +1,72 @@
+from __future__ import print_function, absolute_import
+
+import numpy as np
+
+from conftest import write_model_bdf, write_model_punch
+
+from h5Nastran import H5Nastran
+from h5Nastran.lru_cache import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(100)
+
+    cache.put(('a', 1), 'a1', 40)
+    cache.put(('a', 2), 'a2', 40)
+
+    # the least recently used item is removed first
+    assert cache.get(('a', 1)) == 'a1'
+    cache.put(('b', 1), 'b1', 40)
+
+    assert ('a', 2) not in cache
+    assert cache.get(('a', 1)) == 'a1' and cache.get(('b', 1)) == 'b1'
+    assert cache.nbytes == 80
+
+    # replaced items are counted once, items larger than the cache aren't kept
+    cache.put(('b', 1), 'b1', 50)
+    assert cache.nbytes == 90
+    cache.put(('c', 1), 'c1', 101)
+    assert ('c', 1) not in cache and len(cache) == 2
+
+    cache.clear('a')
+    assert len(cache) == 1 and cache.nbytes == 50
+
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+    assert cache.get(('b', 1)) is None
+
+
+def test_index_cache(tmp_path):
+    write_model_bdf(str(tmp_path / 'model.bdf'))
+    write_model_punch(str(tmp_path / 'model.pch'))
+
+    filename = str(tmp_path / 'model.h5')
+
+    db = H5Nastran(filename, 'w')
+    db.load_bdf(str(tmp_path / 'model.bdf'))
+    db.load_punch(str(tmp_path / 'model.pch'))
+    db.close()
+
+    db = H5Nastran(filename, 'r', index_cache_size=1024 ** 2)
+
+    displacement = db.result.nodal.displacement
+    spc_force = db.result.nodal.spc_force
+
+    expected = displacement.search([1, 2, 3], [5, 7])
+
+    # the subcases share their layout, it's read once and kept in the cache shared by the tables
+    assert len(db.index_cache) == 1
+
+    spc_force.search([1], [1])
+    assert len(db.index_cache) == 2
+
+    assert np.array_equal(displacement.search([1, 2, 3], [5, 7]), expected)
+    assert len(db.index_cache) == 2
+
+    db.close()
+
+    # layouts larger than the cache are read again for each search
+    db = H5Nastran(filename, 'r', index_cache_size=0)
+    assert np.array_equal(db.result.nodal.displacement.search([1, 2, 3], [5, 7]), expected)
+    assert len(db.index_cache) == 0
+    db.close()
@@ -0,0 +1,167 @@
+from __future__ import print_function, absolute_import
+
+import os
+
+import numpy as np
+import pytest
+
+from conftest import write_model_bdf, write_model_punch, read_h5_tables, assert_arrays_equal, assert_tables_equal
+
+from h5Nastran import H5Nastran
+from h5Nastran.punch import PunchReader
+from h5Nastran.result.result_table import ResultTable
+
+
+@pytest.fixture
+def model(tmp_path):
+    directory = str(tmp_path)
+    write_model_bdf(os.path.join(directory, 'model.bdf'))
+    write_model_punch(os.path.join(directory, 'model.pch'))
+    return directory
+
+
+def _load(directory, h5filename, punch_filename, **kwargs):
+    h5filename = os.path.join(directory, h5filename)
+    db = H5Nastran(h5filename, 'w')
+    db.load_bdf(os.path.join(directory, 'model.bdf'))
+    db.load_punch(os.path.join(directory, punch_filename), **kwargs)
+    db.close()
+    return h5filename
+
+
+@pytest.mark.parametrize('punch_filename', ['model.pch.gz', 'model.pch.bz2', 'model.pch.xz', 'model_crlf.pch'])
+def test_punch_reads_identical(model, punch_filename):
+    # compressed files are decompressed as they are read, the tables are the same as from the memory mapped file
+    write_model_punch(os.path.join(model, punch_filename), newline='\r\n' if 'crlf' in punch_filename else '\n')
+
+    expected = read_h5_tables(_load(model, 'plain.h5', 'model.pch'))
+
+    assert expected['/NASTRAN/RESULT/NODAL/DISPLACEMENT'].shape[0] == 180
+
+    assert_tables_equal(expected, read_h5_tables(_load(model, 'result.h5', punch_filename)))
+
+    for (data, header), (_data, _header) in zip(_read_punch(os.path.join(model, 'model.pch')),
+                                                _read_punch(os.path.join(model, punch_filename))):
+        assert header == _header
+        assert_arrays_equal(data, _data)
+
+
+def _read_punch(filename, multiprocess=False, converter=None):
+    tables = []
+
+    reader = PunchReader(filename)
+    reader.register_callback(lambda table_data: tables.append(table_data.serialize()))
+
+    if multiprocess:
+        reader.read_multiprocess(processes=2, lines_per_task=200, converter=converter)
+    else:
+        reader.read()
+
+    reader.close()
+
+    return tables
+
+
+def test_punch_read_multiprocess(model):
+    filename = os.path.join(model, 'model.pch')
+
+    expected = _read_punch(filename)
+    result = _read_punch(filename, multiprocess=True)
+
+    assert len(expected) == 12
+    assert len(result) == len(expected)
+
+    for (data, header), (_data, _header) in zip(expected, result):
+        assert header == _header
+        assert_arrays_equal(data, _data)
+
+
+def test_punch_read_multiprocess_converted(model):
+    filename = os.path.join(model, 'model.pch')
+
+    db = H5Nastran(os.path.join(model, 'converted.h5'), 'w')
+    converter = db._result_converter()
+    db.close()
+
+    result = _read_punch(filename, multiprocess=True, converter=converter)
+
+    # the workers send the records of the result tables
+    assert len(result) == 12
+    assert all(_[0].dtype.names is not None for _ in result)
+    assert result[0][0]['ID'].tolist() == list(range(1, 61))
+
+    expected = read_h5_tables(_load(model, 'expected.h5', 'model.pch'))
+
+    assert_tables_equal(expected, read_h5_tables(_load(model, 'multiprocess.h5', 'model.pch', processes=2)))
+
+
+@pytest.mark.parametrize('interrupted', [3, 7])
+def test_resumed_load_punch(model, monkeypatch, interrupted):
+    expected = read_h5_tables(_load(model, 'expected.h5', 'model.pch'))
+
+    load_result_table = H5Nastran._load_result_table
+    count = [0]
+
+    def _load_result_table(self, table_data):
+        count[0] += 1
+        if count[0] == interrupted:
+            raise RuntimeError('interrupted')
+        return load_result_table(self, table_data)
+
+    monkeypatch.setattr(H5Nastran, '_load_result_table', _load_result_table)
+
+    filename = os.path.join(model, 'resumed.h5')
+
+    db = H5Nastran(filename, 'w')
+    db.load_bdf(os.path.join(model, 'model.bdf'))
+
+    with pytest.raises(RuntimeError):
+        db.load_punch(os.path.join(model, 'model.pch'), checkpoint_interval=0.)
+
+    db.close()
+
+    monkeypatch.setattr(H5Nastran, '_load_result_table', load_result_table)
+
+    assert any(_.startswith('/PRIVATE/CHECKPOINT/') for _ in read_h5_tables(filename))
+
+    # the tables loaded before the interruption are the only ones restored from the checkpoint
+    checkpoints = []
+    read_checkpoint = ResultTable.read_checkpoint
+
+    def _read_checkpoint(self):
+        checkpoints.append(self._table_def.path())
+        return read_checkpoint(self)
+
+    monkeypatch.setattr(ResultTable, 'read_checkpoint', _read_checkpoint)
+
+    starts = []
+    read = PunchReader.read
+
+    def _read(self, start=0):
+        starts.append(start)
+        return read(self, start)
+
+    monkeypatch.setattr(PunchReader, 'read', _read)
+
+    db = H5Nastran(filename, 'a')
+    db.load_punch(os.path.join(model, 'model.pch'), resume=True)
+
+    assert starts == [interrupted - 1]
+
+    if interrupted == 3:
+        assert sorted(checkpoints) == ['/NASTRAN/RESULT/ELEMENTAL/ELEMENT_FORCE/QUAD4',
+                                       '/NASTRAN/RESULT/NODAL/DISPLACEMENT']
+        # tables first created after the resume are sized for all their rows
+        assert db.result.nodal.spc_force.expected_rows == 6
+        assert db.h5f.get_node('/NASTRAN/RESULT/NODAL/SPC_FORCE')._v_expectedrows == 6
+    else:
+        assert len(checkpoints) == 4
+
+    db.close()
+
+    assert_tables_equal(expected, read_h5_tables(filename))
+
+    db = H5Nastran(filename, 'r')
+    table = db.result.nodal.displacement
+    assert_arrays_equal(table.search([1, 2, 3], np.arange(1, 61)), table.read(np.arange(180)))
+    db.close()
@@ -0,0 +1,232 @@
+from __future__ import print_function, absolute_import
+
+import os
+
+import numpy as np
+import pytest
+
+from conftest import write_model_punch
+
+from h5Nastran.punch import PunchReader, PunchTableIndex
+from h5Nastran.punch._file_reader import MMapFileReader
+from h5Nastran.punch._table_data import split_records, convert_tokens
+from h5Nastran.punch._table_index import sidecar_filename
+
+
+def _line(*fields):
+    # 72 character punch line of the fixed columns ID (10), FIELD1 (8) and up to three 18 character fields
+    # ids are right justified, continuations (-CONT-) start in the first column
+    line = ('%-10s' if fields[0].startswith('-') else '%10s') % fields[0] + '%-8s' % fields[1]
+    line += ''.join('%18s' % _ for _ in fields[2:])
+    return line.ljust(72).encode()
+
+
+def test_split_records():
+    block = b''.join([
+        _line('1', 'G', '1.0E+00', '2.0E+00', '3.0E+00'),
+        _line('-CONT-', '', '4.0E+00', '5.0E+00', '6.0E+00'),
+        _line('2', 'G', '7.0E+00', '', '9.0E+00'),
+        _line('-CONT-', '', '1.0E+01', '1.1E+01', '1.2E+01'),
+        _line('-CONT-', '', '1.3E+01'),
+        _line('3', 'S', '1.4E+00'),
+    ])
+
+    tokens = split_records(block)
+
+    assert tokens.shape == (3, 11)
+    assert tokens[0].tolist() == [b'1', b'G', b'1.0E+00', b'2.0E+00', b'3.0E+00', b'4.0E+00', b'5.0E+00',
+                                  b'6.0E+00', b'', b'', b'']
+    assert tokens[1, 4] == b'9.0E+00' and tokens[1, 3] == b'' and tokens[1, 8] == b'1.3E+01'
+    assert tokens[2].tolist() == [b'3', b'S', b'1.4E+00'] + [b''] * 8
+
+    with pytest.raises(ValueError):
+        split_records(_line('-CONT-', '', '1.0'))
+
+    assert split_records(b'').shape[0] == 0
+
+
+def test_convert_tokens():
+    tokens = np.array([b'1.5E+00', b'', b'-2.0E-01'])
+
+    assert np.array_equal(convert_tokens(tokens, '<f8'), [1.5, np.nan, -0.2], equal_nan=True)
+    assert convert_tokens(np.array([b'12', b'']), '<i8').tolist() == [12, 0]
+    assert convert_tokens(np.array([b'G', b'S']), 'S8').tolist() == [b'G', b'S']
+
+
+def _displacement_lines(count):
+    lines = [b'$TITLE   = DISPLACEMENTS', b'$SUBTITLE=', b'$LABEL   =', b'$DISPLACEMENTS', b'$REAL OUTPUT',
+             b'$SUBCASE ID =           1']
+    lines = [_.ljust(72) for _ in lines]
+
+    for i in range(1, count + 1):
+        lines.append(_line(str(i), 'G', '%.6E' % i, '%.6E' % -i, '0.0'))
+        lines.append(_line('-CONT-', '', '1.0', '2.0', '%.6E' % (2 * i)))
+
+    return [_ + b'%8d' % (j + 1) for j, _ in enumerate(lines)]
+
+
+def _write_lines(filename, lines, newline):
+    with open(filename, 'wb') as f:
+        f.write(newline.join(lines) + newline)
+
+
+def _read_tables(filename):
+    tables = []
+
+    reader = PunchReader(filename, cache_index=False)
+    reader.register_callback(lambda table_data: tables.append(table_data.serialize()))
+    reader.read()
+    reader.close()
+
+    return tables
+
+
+@pytest.mark.parametrize('newline', [b'\n', b'\r\n'])
+def test_mmap_file_reader(tmp_path, newline):
+    # 82 LF lines are as long as 81 CRLF lines, the separator is found from the first line
+    lines = _displacement_lines(38)
+    assert len(lines) == 82
+
+    filename = str(tmp_path / 'model.pch')
+    _write_lines(filename, lines, newline)
+
+    reader = MMapFileReader(filename)
+    assert reader.separator == newline
+    assert reader.line_count == 82
+    assert reader.line(7) == lines[7][:72]
+    assert reader.lines(6, 8)['ID'].tolist() == [b'         1', b'-CONT-    ']
+    reader.close()
+
+    tables = _read_tables(filename)
+
+    assert len(tables) == 1
+    assert tables[0][1][4] == 'DISPLACEMENTS' and tables[0][1][5] is True
+    assert tables[0][0].shape[0] == 38
+    assert tables[0][0][37, 0] == b'38'
+
+
+def test_mmap_file_reader_invalid(tmp_path):
+    filename = str(tmp_path / 'model.pch')
+    _write_lines(filename, [_[:60] for _ in _displacement_lines(2)], b'\n')
+
+    with pytest.raises(Exception):
+        MMapFileReader(filename)
+
+
+def test_table_index_sidecar(tmp_path, monkeypatch):
+    filename = str(tmp_path / 'model.pch')
+    write_model_punch(filename)
+
+    index = PunchReader(filename).table_index()
+
+    assert len(index) == 12
+    assert index.row_counts()['DISPLACEMENTS REAL OUTPUT'] == 180
+    assert os.path.exists(sidecar_filename(filename))
+
+    def _scan_tables(self):
+        raise AssertionError('the saved index should be used')
+
+    with monkeypatch.context() as m:
+        m.setattr(PunchReader, '_scan_tables', _scan_tables)
+        assert np.array_equal(PunchReader(filename).table_index().data, index.data)
+
+    if os.path.isdir('/proc/self/fd'):
+        fds = len(os.listdir('/proc/self/fd'))
+        for i in range(20):
+            PunchTableIndex.load(filename)
+        assert len(os.listdir('/proc/self/fd')) == fds
+
+
+def _write_sidecar(filename, **arrays):
+    with open(sidecar_filename(filename), 'wb') as f:
+        np.savez(f, **arrays)
+
+
+@pytest.mark.parametrize('sidecar', ['modified', 'no_info', 'renamed', 'bad_info', 'garbage', 'truncated'])
+def test_table_index_stale_sidecar(tmp_path, sidecar):
+    filename = str(tmp_path / 'model.pch')
+    write_model_punch(filename)
+
+    index = PunchReader(filename).table_index()
+
+    if sidecar == 'modified':
+        os.utime(filename, (index.mtime + 10., index.mtime + 10.))
+    elif sidecar == 'no_info':
+        _write_sidecar(filename, data=index.data)
+    elif sidecar == 'renamed':
+        _write_sidecar(filename, data=index.data, info_v2=np.array([index.version, index.filesize, index.mtime]))
+    elif sidecar == 'bad_info':
+        _write_sidecar(filename, data=index.data, info=np.array([index.version]))
+    elif sidecar == 'garbage':
+        with open(sidecar_filename(filename), 'wb') as f:
+            f.write(b'not an index')
+    else:
+        with open(sidecar_filename(filename), 'rb') as f:
+            data = f.read()
+        with open(sidecar_filename(filename), 'wb') as f:
+            f.write(data[:len(data) // 2])
+
+    assert PunchTableIndex.load(filename) is None
+
+    # the file is scanned again and the index saved
+    assert np.array_equal(PunchReader(filename).table_index().data, index.data)
+    assert PunchTableIndex.load(filename) is not None
+
+
+def _sort2_lines(header=True):
+    # displacements of point 5 keyed by time
+    lines = [b'$TITLE   = SORT2', b'$SUBTITLE=', b'$LABEL   =', b'$DISPLACEMENTS', b'$REAL OUTPUT',
+             b'$SUBCASE ID =           1']
+    if header:
+        lines.append(b'$POINT ID =           5')
+    lines = [_.ljust(72) for _ in lines]
+
+    for i in range(4):
+        time = '1' if header and i == 0 else '%.4E' % (0.1 * i)
+        lines.append(_line(time, 'G', '1.0', '2.0', '3.0'))
+        lines.append(_line('-CONT-', '', '4.0', '5.0', '6.0'))
+
+    return lines
+
+
+def _read_selected(filename, **kwargs):
+    tables = []
+
+    reader = PunchReader(filename, **kwargs)
+    reader.register_callback(lambda table_data: tables.append(table_data))
+    reader.read()
+    reader.close()
+
+    return tables
+
+
+def test_selection(tmp_path):
+    filename = str(tmp_path / 'model.pch')
+    write_model_punch(filename)
+
+    tables = _read_selected(filename, results_types='DISPLACEMENTS', subcase_ids=[2, 3])
+
+    assert [(_.header.results_type, _.header.subcase_id) for _ in tables] == [
+        ('DISPLACEMENTS REAL OUTPUT', '2'), ('DISPLACEMENTS REAL OUTPUT', '3')]
+
+    tables = _read_selected(filename, results_types=['ELEMENT FORCES', 'SPCF'], subcase_ids=1,
+                            ids=[2, (1001, 1004), 1017])
+
+    assert [_.header.results_type for _ in tables] == ['ELEMENT FORCES 33 QUAD4 REAL OUTPUT', 'SPCF REAL OUTPUT']
+    assert tables[0].data[:, 0].tolist() == [b'1001', b'1002', b'1004', b'1017']
+    assert tables[1].data[:, 0].tolist() == [b'2']
+
+    # tables without a selected id are skipped
+    assert len(_read_selected(filename, ids=[100000])) == 0
+
+
+@pytest.mark.parametrize('header', [True, False])
+def test_selection_sort2(tmp_path, header):
+    # SORT2 tables aren't keyed by id, ids doesn't filter their records
+    filename = str(tmp_path / 'model.pch')
+    _write_lines(filename, [_ + b'%8d' % (j + 1) for j, _ in enumerate(_sort2_lines(header))], b'\n')
+
+    tables = _read_selected(filename, ids=[5])
+
+    assert len(tables) == 1
+    assert tables[0].data.shape[0] == 4
@@ -0,0 +1,224 @@
+from __future__ import print_function, absolute_import
+
+import os
+
+import numpy as np
+import pytest
+
+from conftest import write_model_bdf, write_model_punch, read_h5_tables, assert_arrays_equal
+
+from h5Nastran import H5Nastran
+from h5Nastran.result import result_table
+from h5Nastran.result.result_table import DefinedValue, index_layout
+
+
+@pytest.fixture(scope='module')
+def table_classes(tmp_path_factory):
+    db = H5Nastran(str(tmp_path_factory.mktemp('result_table') / 'model.h5'), 'w')
+    table_classes = db._result_table_classes()
+    db.close()
+    return table_classes
+
+
+def _tokens(table_def, count, rng):
+    # random punch fields of the types the gather plan converts them to
+    plan = table_def._get_gather_plan()
+
+    width = 1 + max(int(np.max(columns)) for name, columns, dtype in plan if not isinstance(columns, DefinedValue))
+
+    tokens = np.zeros((count, width), dtype='S18')
+
+    for name, columns, dtype in plan:
+        if isinstance(columns, DefinedValue):
+            continue
+        for column in np.ravel(columns):
+            if dtype.kind in ('i', 'u'):
+                tokens[:, column] = [b'%d' % _ for _ in rng.randint(1, 100000, size=count)]
+            elif dtype.kind == 'f':
+                tokens[:, column] = [b'%.6E' % _ for _ in rng.standard_normal(count)]
+            else:
+                tokens[:, column] = [b'NAME%d' % _ for _ in rng.randint(0, 10, size=count)]
+
+    return tokens
+
+
+def test_gather_plan(table_classes):
+    # the columns gathered from the token array are converted as the rows of fields were
+    rng = np.random.RandomState(0)
+
+    for results_type in sorted(table_classes):
+        table_def = table_classes[results_type].table_def
+
+        assert table_def._get_gather_plan() is not None, results_type
+
+        tokens = _tokens(table_def, 50, rng)
+
+        assert_arrays_equal(table_def._tokens_to_numpy(tokens), table_def._rows_to_numpy(tokens.tolist()),
+                            results_type)
+
+
+def test_grid_force_validator(table_classes):
+    table_def = table_classes['GRID POINT FORCE BALANCE REAL OUTPUT'].table_def
+
+    names = [b'QUAD4', b'F-OF-SPC', b'F-OF-MPC', b'APP-LOAD', b'*TOTALS*']
+    eids = [b'1001', b'', b'', b'', b'']
+
+    tokens = np.zeros((5, 11), dtype='S18')
+    tokens[:, 0] = b'7'
+    tokens[:, 2] = eids
+    tokens[:, 3] = names
+    tokens[:, 5:] = b'1.0E+00'
+
+    data = table_def.to_numpy(tokens)
+
+    assert data['EID'].tolist() == [1001, -1, -2, -3, -4]
+    assert data['ELNAME'].tolist() == names
+    assert data['F1'].tolist() == [1.] * 5
+
+
+@pytest.fixture(scope='module')
+def h5filename(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp('model'))
+    write_model_bdf(os.path.join(directory, 'model.bdf'))
+    write_model_punch(os.path.join(directory, 'model.pch'))
+
+    filename = os.path.join(directory, 'model.h5')
+
+    db = H5Nastran(filename, 'w')
+    db.load_bdf(os.path.join(directory, 'model.bdf'))
+    db.load_punch(os.path.join(directory, 'model.pch'))
+    db.close()
+
+    return filename
+
+
+def test_private_index_deduplicated(h5filename):
+    # the subcases have the same ids, their layout is only saved once
+    data = read_h5_tables(h5filename)
+
+    path = '/PRIVATE/INDEX/NASTRAN/RESULT/NODAL/DISPLACEMENT'
+
+    identity = data[path + '/IDENTITY']
+
+    assert identity.shape[0] == 3
+    assert identity['LOCATION'].tolist() == [0, 0, 0]
+    assert identity['OFFSET'].tolist() == [0, 60, 120]
+    assert data[path + '/DATA'].shape[0] == 60
+    assert data[path + '/INDICES'].shape[0] == 60
+
+
+def test_private_index_hash_collisions(monkeypatch):
+    # layouts with the same hash are still compared
+    monkeypatch.setattr(result_table, 'hash', lambda _: 0, raising=False)
+
+    table_def = result_table.TableDef.create('/NASTRAN/RESULT/NODAL/DISPLACEMENT', 'DISPLACEMENTS REAL OUTPUT')
+
+    a = index_layout(np.array([3, 1, 2]))
+    b = index_layout(np.array([3, 2, 1]))
+
+    assert table_def._add_index_data(*a) == 0
+    assert table_def._add_index_data(*b) == 3
+    assert table_def._add_index_data(*index_layout(np.array([3, 1, 2]))) == 0
+    assert table_def._add_index_data(*index_layout(np.array([3, 2, 1]))) == 3
+    assert len(table_def._index_data) == 2
+
+
+def test_expand_ranges():
+    assert result_table._expand_ranges([5, 0, 9, 20], [3, 0, 2, 1]).tolist() == [5, 6, 7, 9, 10, 20]
+    assert result_table._expand_ranges([4, 2], [2, 2]).tolist() == [4, 5, 2, 3]
+    assert result_table._expand_ranges([], []).shape == (0,)
+
+
+def test_read_rows(h5filename):
+    db = H5Nastran(h5filename, 'r')
+
+    table = db.result.nodal.displacement
+    data = table._table_def.get_table().read()
+
+    rng = np.random.RandomState(0)
+
+    # long runs are read as slices and the rest by coordinates
+    sorted_indices = np.concatenate([np.arange(10, 60), [61, 63, 64, 100], np.arange(120, 140), [179]])
+    random_indices = rng.permutation(180)[:50]
+
+    for indices in (sorted_indices, random_indices, [], [0], np.arange(180)):
+        assert_arrays_equal(table.read(indices), data[np.asarray(indices, dtype='i8')])
+
+    db.close()
+
+
+def test_read_columns(h5filename, monkeypatch):
+    import tables
+
+    db = H5Nastran(h5filename, 'r')
+
+    table = db.result.nodal.displacement
+    data = table._table_def.get_table().read()
+
+    reads = []
+
+    def _counted(method):
+        def _read(self, *args, **kwargs):
+            reads.append(kwargs.get('field', None))
+            return method(self, *args, **kwargs)
+        return _read
+
+    for name in ('read', 'read_coordinates', '_read_elements'):
+        monkeypatch.setattr(tables.Table, name, _counted(getattr(tables.Table, name)))
+
+    columns = ['ID', 'X', 'RZ']
+
+    indices = np.concatenate([np.arange(10, 60), [61, 63, 64, 100], np.arange(120, 140), [179]])
+
+    # each run and the scattered rows are read once, not once per column
+    for _indices, read_count in ((indices, 3), (indices[::-1], 1), (np.arange(180), 1)):
+        del reads[:]
+
+        result = table.read(_indices, columns)
+
+        assert result.dtype.names == tuple(columns)
+        for column in columns:
+            assert_arrays_equal(result[column], data[column][_indices], column)
+
+        assert reads == [None] * read_count
+
+    assert table.read(indices, 'X').dtype.names == ('X',)
+
+    db.close()
+
+
+def test_read_domains(h5filename, monkeypatch):
+    import tables
+
+    db = H5Nastran(h5filename, 'r')
+
+    table = db.result.nodal.displacement
+    data = table._table_def.get_table().read()
+
+    slices = []
+    read = tables.Table.read
+
+    def _read(self, start=None, stop=None, *args, **kwargs):
+        if self._v_pathname == '/NASTRAN/RESULT/NODAL/DISPLACEMENT':
+            slices.append((start, stop))
+        return read(self, start, stop, *args, **kwargs)
+
+    monkeypatch.setattr(tables.Table, 'read', _read)
+
+    # domains are returned in the given order, missing domains are skipped, adjacent domains are read together
+    for domain_ids, expected_slices in (([3, 1], [(120, 180), (0, 60)]), ([1, 2, 4, 0], [(0, 120)]),
+                                        ([2, 2], [(60, 120), (60, 120)]), ([5], [])):
+        del slices[:]
+
+        expected = np.concatenate([data[data['DOMAIN_ID'] == _] for _ in domain_ids])
+
+        assert_arrays_equal(table.read_domains(domain_ids), expected)
+        assert slices == expected_slices
+
+        result = table.read_domains(domain_ids, ['ID', 'Y'])
+        assert result.dtype.names == ('ID', 'Y')
+        assert_arrays_equal(result['Y'], expected['Y'])
+
+    assert_arrays_equal(table.read_domain(2), data[60:120])
+
+    db.close()
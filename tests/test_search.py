@@ -0,0 +1,151 @@
+from __future__ import print_function, absolute_import
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+import tables
+
+from conftest import write_model_bdf, write_model_punch, read_h5_tables, assert_arrays_equal, assert_tables_equal
+
+from h5Nastran import H5Nastran
+
+
+@pytest.fixture(scope='module')
+def h5filename(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp('search'))
+    write_model_bdf(os.path.join(directory, 'model.bdf'))
+    write_model_punch(os.path.join(directory, 'model.pch'), subcases=4)
+
+    filename = os.path.join(directory, 'model.h5')
+
+    db = H5Nastran(filename, 'w')
+    db.load_bdf(os.path.join(directory, 'model.bdf'))
+    db.load_punch(os.path.join(directory, 'model.pch'))
+    db.close()
+
+    return filename
+
+
+def _result_tables(db):
+    return [db.result.nodal.displacement, db.result.nodal.grid_force, db.result.nodal.spc_force,
+            db.result.elemental.element_force.quad4]
+
+
+def _brute_force_search(table, domains, data_ids, filter=None):
+    table_def = table._table_def
+    data = table_def.get_table().read()
+
+    mask = np.isin(data['DOMAIN_ID'], domains) & np.isin(data[table_def.index_id], data_ids)
+
+    if filter is not None:
+        _mask = np.zeros(data.shape[0], dtype=bool)
+        for key, values in filter.items():
+            _mask |= np.isin(data[key], list(values))
+        mask &= _mask
+
+    return data[mask]
+
+
+def _searches(table):
+    table_def = table._table_def
+    data = table_def.get_table().read()
+
+    ids = np.unique(data[table_def.index_id])
+
+    rng = np.random.RandomState(0)
+
+    # missing domains and ids are ignored
+    yield [1, 2, 3, 4, 5], np.append(ids, ids.max() + 1), None
+    yield [0, 3], ids[:1], None
+
+    for i in range(10):
+        domains = rng.choice(np.arange(1, 5), size=rng.randint(1, 4), replace=False)
+        data_ids = rng.choice(ids, size=rng.randint(1, ids.shape[0] + 1), replace=False)
+        yield domains, data_ids, None
+
+        field = data.dtype.names[1 + i % (len(data.dtype.names) - 2)]
+        values = np.unique(data[field])[::2]
+        yield domains, data_ids, {field: values}
+        yield domains, data_ids, {field: values, table_def.index_id: data_ids[:2]}
+
+
+def test_search_matches_brute_force(h5filename):
+    db = H5Nastran(h5filename, 'r')
+
+    for table in _result_tables(db):
+        for domains, data_ids, filter in _searches(table):
+            expected = _brute_force_search(table, domains, data_ids, filter)
+            assert_arrays_equal(table.search(domains, data_ids, filter), expected)
+
+            columns = list(expected.dtype.names[:2])
+            result = table.search(domains, data_ids, filter, columns=columns)
+            assert result.dtype.names == tuple(columns)
+            for column in columns:
+                assert_arrays_equal(result[column], expected[column])
+
+    db.close()
+
+
+def _write_legacy_private_index(h5f, path):
+    # private index as written by h5Nastran < 0.2.0, DATA holds the layouts serialized as [id, len, i0, i1, ...]
+    identity = h5f.get_node(path + '/IDENTITY').read()
+    data = h5f.get_node(path + '/DATA').read()
+    indices = h5f.get_node(path + '/INDICES').read()['INDEX']
+
+    serialized = []
+    locations = {}
+    size = 0
+
+    for row in identity:
+        key = (int(row['LOCATION']), int(row['LENGTH']))
+
+        if key not in locations:
+            layout = []
+            for data_id, position, length in data[key[0]: key[0] + key[1]].tolist():
+                layout.extend([data_id, length])
+                layout.extend(indices[position: position + length].tolist())
+            locations[key] = (size, len(layout))
+            serialized.extend(layout)
+            size += len(layout)
+
+        row['LOCATION'], row['LENGTH'] = locations[key]
+
+    h5f.remove_node(path, recursive=True)
+
+    h5f.create_table(path, 'IDENTITY', identity, createparents=True)
+    h5f.create_table(path, 'DATA', np.array(serialized, dtype=[('ID', '<i8')]))
+
+
+def test_legacy_private_index(h5filename, tmp_path):
+    filename = str(tmp_path / 'legacy.h5')
+
+    shutil.copy(h5filename, filename)
+
+    h5f = tables.open_file(filename, 'a')
+    paths = [_._v_parent._v_pathname for _ in h5f.walk_nodes('/PRIVATE/INDEX', 'Table') if _.name == 'IDENTITY']
+    for path in paths:
+        _write_legacy_private_index(h5f, path)
+    h5f.close()
+
+    assert not any(_.endswith('/INDICES') for _ in read_h5_tables(filename))
+
+    # old indexes are decoded in memory when the file is read only
+    expected = H5Nastran(h5filename, 'r')
+    db = H5Nastran(filename, 'r')
+
+    for table, _table in zip(_result_tables(expected), _result_tables(db)):
+        for domains, data_ids, filter in _searches(table):
+            assert_arrays_equal(_table.search(domains, data_ids, filter), table.search(domains, data_ids, filter))
+
+    db.close()
+    expected.close()
+
+    # and rewritten in the current format before domains are added to them
+    db = H5Nastran(filename, 'a')
+    for table in _result_tables(db):
+        table._table_def._get_private_index_tables()
+    db.close()
+
+    assert_tables_equal(read_h5_tables(h5filename), read_h5_tables(filename))
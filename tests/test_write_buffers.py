@@ -0,0 +1,85 @@
+from __future__ import print_function, absolute_import
+
+import os
+
+from conftest import write_model_bdf, write_model_punch, read_h5_tables, assert_tables_equal
+
+from h5Nastran import H5Nastran
+from h5Nastran.result.result_table import TableDef
+from h5Nastran.write_buffers import WriteBuffers
+
+
+class _Table(object):
+    def __init__(self, buffers):
+        self.buffers = buffers
+        self.write_buffer_nbytes = 0
+        self.flushed = 0
+
+    def append(self, nbytes):
+        self.write_buffer_nbytes += nbytes
+        self.buffers.add(self, nbytes)
+
+    def flush(self):
+        self.buffers.remove(self, self.write_buffer_nbytes)
+        self.write_buffer_nbytes = 0
+        self.flushed += 1
+
+
+def test_write_buffers():
+    buffers = WriteBuffers(100)
+
+    a, b, c = _Table(buffers), _Table(buffers), _Table(buffers)
+
+    a.append(30)
+    b.append(40)
+    c.append(10)
+    a.append(10)
+
+    assert buffers.nbytes == 90 and a.flushed == b.flushed == c.flushed == 0
+
+    # the largest buffers are flushed until less than half is left
+    c.append(15)
+
+    assert (a.flushed, b.flushed, c.flushed) == (1, 1, 0)
+    assert buffers.nbytes == 25
+
+    c.flush()
+    assert buffers.nbytes == 0
+
+
+def _load(directory, name, **kwargs):
+    filename = os.path.join(directory, name + '.h5')
+    db = H5Nastran(filename, 'w', **kwargs)
+    db.load_bdf(os.path.join(directory, 'model.bdf'))
+    db.load_punch(os.path.join(directory, 'model.pch'))
+    db.close()
+    return filename
+
+
+def test_write_buffer_size(tmp_path, monkeypatch):
+    directory = str(tmp_path)
+    write_model_bdf(os.path.join(directory, 'model.bdf'))
+    write_model_punch(os.path.join(directory, 'model.pch'))
+
+    expected = read_h5_tables(_load(directory, 'expected'))
+
+    flushes = []
+    flush = TableDef.flush
+
+    def _flush(self):
+        if self.write_buffer_nbytes > 0:
+            flushes.append((self.path(), self.write_buffer_nbytes, self.write_buffers.nbytes))
+        return flush(self)
+
+    monkeypatch.setattr(TableDef, 'flush', _flush)
+
+    # the buffers of all the tables are counted together
+    result = read_h5_tables(_load(directory, 'buffered', write_buffer_size=20000))
+
+    assert_tables_equal(expected, result)
+
+    flushed = [_ for _ in flushes if _[2] >= 20000]
+
+    assert len(flushed) > 0
+    assert all(_[1] < 20000 for _ in flushes)
+    assert flushed[0][0] == '/NASTRAN/RESULT/NODAL/DISPLACEMENT'